@@ -0,0 +1,31 @@
+"""add generated chunks.text_search tsvector with GIN index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE chunks ADD COLUMN text_search tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', text)) STORED"
+    )
+    op.execute(
+        "CREATE INDEX ix_chunks_text_search ON chunks USING gin (text_search)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chunks_text_search", table_name="chunks")
+    op.drop_column("chunks", "text_search")
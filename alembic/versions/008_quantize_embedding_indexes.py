@@ -0,0 +1,43 @@
+"""replace the float32 HNSW index with halfvec and binary-quantized indexes
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Expression indexes quantize the stored vectors while they are built,
+    # so no column needs backfilling; the float32 column is kept for
+    # re-ranking.
+    op.execute(
+        "CREATE INDEX ix_chunks_embedding_halfvec ON chunks "
+        "USING hnsw ((embedding::halfvec(1536)) halfvec_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+    op.execute(
+        "CREATE INDEX ix_chunks_embedding_bit ON chunks "
+        "USING hnsw ((binary_quantize(embedding)::bit(1536)) bit_hamming_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+    op.drop_index("ix_chunks_embedding", table_name="chunks")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_chunks_embedding ON chunks "
+        "USING hnsw (embedding vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+    op.drop_index("ix_chunks_embedding_bit", table_name="chunks")
+    op.drop_index("ix_chunks_embedding_halfvec", table_name="chunks")
@@ -0,0 +1,35 @@
+"""add generated Matryoshka chunks.embedding_short with HNSW index
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Adding a stored generated column rewrites the table, which backfills
+    # the prefix of every existing embedding.
+    op.execute(
+        "ALTER TABLE chunks ADD COLUMN embedding_short vector(256) "
+        "GENERATED ALWAYS AS (l2_normalize(subvector(embedding, 1, 256))) STORED"
+    )
+    op.execute(
+        "CREATE INDEX ix_chunks_embedding_short ON chunks "
+        "USING hnsw (embedding_short vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chunks_embedding_short", table_name="chunks")
+    op.drop_column("chunks", "embedding_short")
@@ -1,27 +1,42 @@
 from collections.abc import Callable
 from functools import lru_cache
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 
+from documentor.adapters.composition import (
+    build_embedding_service,
+    build_ingest_use_case,
+    get_settings,
+)
 from documentor.application.use_cases.ask_question import AskQuestion
+from documentor.application.use_cases.crawl_documentation import CrawlDocumentation
+from documentor.application.use_cases.enqueue_ingestion import EnqueueIngestion
+from documentor.application.use_cases.get_job_status import GetJobStatus
 from documentor.application.use_cases.ingest_documentation import IngestDocumentation
 from documentor.application.use_cases.list_documents import ListDocuments
+from documentor.domain.models.chunk import SearchProfile
+from documentor.domain.services.document_loader_service import DocumentLoaderService
+from documentor.domain.services.llm_service import LLMService
+from documentor.infrastructure.cache import LruTtlCache
+from documentor.infrastructure.cached_embedding_service import (
+    QueryCachedEmbeddingService,
+)
+from documentor.infrastructure.cached_llm_service import RewriteCachingLLMService
 from documentor.infrastructure.config import Settings
 from documentor.infrastructure.external.anthropic_llm_service import AnthropicLLMService
 from documentor.infrastructure.external.file_document_loader import FileDocumentLoader
 from documentor.infrastructure.external.http_document_loader import HttpDocumentLoader
-from documentor.infrastructure.external.openai_embedding_service import (
-    OpenAIEmbeddingService,
-)
+from documentor.infrastructure.external.http_site_crawler import HttpSiteCrawler
 from documentor.infrastructure.external.openai_llm_service import OpenAILLMService
+from documentor.infrastructure.persistence.pg_embedding_cache import PgEmbeddingCache
 from documentor.infrastructure.persistence.pg_unit_of_work import PgUnitOfWork
+from documentor.infrastructure.query_embedding_cache import QueryEmbeddingCache
+from documentor.infrastructure.semantic_answer_cache import SemanticAnswerCache
 
-
-@lru_cache
-def get_settings() -> Settings:
-    return Settings()
+if TYPE_CHECKING:
+    from documentor.infrastructure.persistence.vector_snapshot import VectorSnapshot
 
 
 def get_session_factory(
@@ -30,9 +45,58 @@ def get_session_factory(
     return request.app.state.session_factory
 
 
-@lru_cache
-def _get_embedding_service(api_key: str, model: str) -> OpenAIEmbeddingService:
-    return OpenAIEmbeddingService(api_key=api_key, model=model)
+def get_embedding_cache(request: Request) -> PgEmbeddingCache | None:
+    return getattr(request.app.state, "embedding_cache", None)
+
+
+def build_query_embedding_cache(settings: Settings) -> QueryEmbeddingCache | None:
+    if not settings.query_embedding_cache_enabled:
+        return None
+    return QueryEmbeddingCache(
+        max_bytes=settings.query_embedding_cache_max_mb * 1024 * 1024,
+        ttl=settings.query_embedding_cache_ttl_seconds,
+        normalize=settings.query_embedding_cache_normalize,
+    )
+
+
+def get_query_embedding_cache(request: Request) -> QueryEmbeddingCache | None:
+    return getattr(request.app.state, "query_embedding_cache", None)
+
+
+def build_rewrite_cache(settings: Settings) -> LruTtlCache[str] | None:
+    if not settings.rewrite_cache_enabled:
+        return None
+    return LruTtlCache(
+        max_entries=settings.rewrite_cache_max_entries,
+        ttl=settings.rewrite_cache_ttl_seconds,
+    )
+
+
+def get_rewrite_cache(request: Request) -> LruTtlCache[str] | None:
+    return getattr(request.app.state, "rewrite_cache", None)
+
+
+def build_answer_cache(settings: Settings) -> SemanticAnswerCache | None:
+    if not settings.answer_cache_enabled:
+        return None
+    return SemanticAnswerCache(
+        max_entries=settings.answer_cache_max_entries,
+        ttl=settings.answer_cache_ttl_seconds,
+        max_distance=settings.answer_cache_max_distance,
+    )
+
+
+def get_answer_cache(request: Request) -> SemanticAnswerCache | None:
+    return getattr(request.app.state, "answer_cache", None)
+
+
+def get_vector_snapshot(request: Request) -> "VectorSnapshot | None":
+    return getattr(request.app.state, "vector_snapshot", None)
+
+
+def get_http_loader(request: Request) -> HttpDocumentLoader:
+    loader = getattr(request.app.state, "http_loader", None)
+    return loader if loader is not None else HttpDocumentLoader()
 
 
 @lru_cache
@@ -46,34 +110,41 @@ def _get_llm_service(
     return OpenAILLMService(api_key=api_key, model=model, rewrite_model=rewrite_model)
 
 
-def _build_ingest_use_case(
-    loader: HttpDocumentLoader | FileDocumentLoader,
-    settings: Settings,
-    session_factory: async_sessionmaker[AsyncSession],
+def get_ingest_documentation(
+    settings: Annotated[Settings, Depends(get_settings)],
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_session_factory)
+    ],
+    embedding_cache: Annotated[
+        PgEmbeddingCache | None, Depends(get_embedding_cache)
+    ],
+    http_loader: Annotated[HttpDocumentLoader, Depends(get_http_loader)],
 ) -> IngestDocumentation:
-    embedding_service = _get_embedding_service(
-        api_key=settings.openai_api_key,
-        model=settings.embedding_model,
-    )
-    if settings.langfuse_enabled:
-        from documentor.infrastructure.observability import ObservedEmbeddingService
-
-        embedding_service = ObservedEmbeddingService(embedding_service)
-
-    return IngestDocumentation(
-        loader=loader,
-        embedding_service=embedding_service,
-        uow=PgUnitOfWork(session_factory),
+    return build_ingest_use_case(
+        http_loader, settings, session_factory, embedding_cache
     )
 
 
-def get_ingest_documentation(
+def get_crawl_documentation(
     settings: Annotated[Settings, Depends(get_settings)],
     session_factory: Annotated[
         async_sessionmaker[AsyncSession], Depends(get_session_factory)
     ],
-) -> IngestDocumentation:
-    return _build_ingest_use_case(HttpDocumentLoader(), settings, session_factory)
+    embedding_cache: Annotated[
+        PgEmbeddingCache | None, Depends(get_embedding_cache)
+    ],
+    http_loader: Annotated[HttpDocumentLoader, Depends(get_http_loader)],
+) -> CrawlDocumentation:
+    def ingest_factory(loader: DocumentLoaderService) -> IngestDocumentation:
+        return build_ingest_use_case(
+            loader, settings, session_factory, embedding_cache
+        )
+
+    return CrawlDocumentation(
+        crawler=HttpSiteCrawler(http_loader, concurrency=settings.crawl_concurrency),
+        ingest_factory=ingest_factory,
+        max_concurrent_ingests=settings.crawl_max_concurrent_ingests,
+    )
 
 
 def get_ask_question(
@@ -81,12 +152,23 @@ def get_ask_question(
     session_factory: Annotated[
         async_sessionmaker[AsyncSession], Depends(get_session_factory)
     ],
+    embedding_cache: Annotated[
+        PgEmbeddingCache | None, Depends(get_embedding_cache)
+    ],
+    query_embedding_cache: Annotated[
+        QueryEmbeddingCache | None, Depends(get_query_embedding_cache)
+    ],
+    rewrite_cache: Annotated[
+        LruTtlCache[str] | None, Depends(get_rewrite_cache)
+    ],
+    answer_cache: Annotated[
+        SemanticAnswerCache | None, Depends(get_answer_cache)
+    ],
+    vector_snapshot: Annotated[
+        "VectorSnapshot | None", Depends(get_vector_snapshot)
+    ],
 ) -> AskQuestion:
-    embedding_service = _get_embedding_service(
-        api_key=settings.openai_api_key,
-        model=settings.embedding_model,
-    )
-    llm_service = _get_llm_service(
+    llm_service: LLMService = _get_llm_service(
         provider=settings.llm_provider,
         api_key=(
             settings.anthropic_api_key
@@ -98,18 +180,44 @@ def get_ask_question(
     )
 
     if settings.langfuse_enabled:
-        from documentor.infrastructure.observability import (
-            ObservedEmbeddingService,
-            ObservedLLMService,
-        )
+        from documentor.infrastructure.observability import ObservedLLMService
 
-        embedding_service = ObservedEmbeddingService(embedding_service)
         llm_service = ObservedLLMService(llm_service)
 
+    if rewrite_cache is not None:
+        llm_service = RewriteCachingLLMService(
+            llm_service,
+            rewrite_cache,
+            model=f"{settings.llm_provider}:{settings.rewrite_model}",
+        )
+
+    embedding_service = build_embedding_service(settings, embedding_cache)
+    if query_embedding_cache is not None:
+        embedding_service = QueryCachedEmbeddingService(
+            embedding_service, query_embedding_cache
+        )
+
     return AskQuestion(
         embedding_service=embedding_service,
         llm_service=llm_service,
-        uow=PgUnitOfWork(session_factory),
+        uow=PgUnitOfWork(session_factory, vector_snapshot),
+        answer_cache=answer_cache,
+        speculative_retrieval=settings.speculative_retrieval_enabled,
+        hybrid_search=settings.hybrid_search_enabled,
+        fan_out=settings.query_fan_out_enabled,
+        max_sub_queries=settings.query_fan_out_max_queries,
+        diversify=settings.mmr_enabled,
+        mmr_lambda=settings.mmr_lambda,
+        mmr_candidates=settings.mmr_candidates,
+        context_max_tokens=settings.context_max_tokens,
+        max_concurrent_generations=settings.ask_batch_max_concurrent_generations,
+        search_profile=SearchProfile(
+            ef_search=settings.hnsw_ef_search,
+            iterative_scan=settings.hnsw_iterative_scan,
+            max_scan_tuples=settings.hnsw_max_scan_tuples,
+            first_pass=settings.vector_first_pass,
+            rerank_candidates=settings.vector_rerank_candidates,
+        ),
     )
 
 
@@ -118,11 +226,16 @@ def get_ingest_file_documentation(
     session_factory: Annotated[
         async_sessionmaker[AsyncSession], Depends(get_session_factory)
     ],
+    embedding_cache: Annotated[
+        PgEmbeddingCache | None, Depends(get_embedding_cache)
+    ],
 ) -> Callable[[bytes, str], IngestDocumentation]:
     def factory(file_content: bytes, filename: str) -> IngestDocumentation:
         loader = FileDocumentLoader(file_content, filename)
 
-        return _build_ingest_use_case(loader, settings, session_factory)
+        return build_ingest_use_case(
+            loader, settings, session_factory, embedding_cache
+        )
 
     return factory
 
@@ -135,3 +248,19 @@ def get_list_documents(
     return ListDocuments(
         uow=PgUnitOfWork(session_factory),
     )
+
+
+def get_enqueue_ingestion(
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_session_factory)
+    ],
+) -> EnqueueIngestion:
+    return EnqueueIngestion(uow=PgUnitOfWork(session_factory))
+
+
+def get_job_status(
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_session_factory)
+    ],
+) -> GetJobStatus:
+    return GetJobStatus(uow=PgUnitOfWork(session_factory))
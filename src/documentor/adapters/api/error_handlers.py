@@ -9,7 +9,9 @@ from documentor.domain.exceptions import (
     InvalidAnswerError,
     InvalidChunkError,
     InvalidDocumentError,
+    InvalidJobError,
     InvalidQuestionError,
+    JobNotFoundError,
     LLMGenerationError,
 )
 
@@ -18,7 +20,9 @@ _EXCEPTION_STATUS_MAP: dict[type[Exception], int] = {
     InvalidDocumentError: 400,
     InvalidChunkError: 400,
     InvalidAnswerError: 400,
+    InvalidJobError: 400,
     DocumentNotFoundError: 404,
+    JobNotFoundError: 404,
     DuplicateDocumentError: 409,
     DocumentLoadError: 502,
     EmbeddingGenerationError: 502,
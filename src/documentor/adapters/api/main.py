@@ -1,19 +1,35 @@
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
+from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from documentor.adapters.api.dependencies import get_settings
+from documentor.adapters.api.dependencies import (
+    build_answer_cache,
+    build_query_embedding_cache,
+    build_rewrite_cache,
+)
 from documentor.adapters.api.error_handlers import register_error_handlers
+from documentor.adapters.composition import (
+    build_embedding_cache,
+    build_http_loader,
+    build_ingestion_worker_pool,
+    get_settings,
+)
 from documentor.infrastructure.database import (
     create_engine as create_db_engine,
     create_session_factory,
 )
 from documentor.adapters.api.routes.documents import router as documents_router
 from documentor.adapters.api.routes.health import router as health_router
+from documentor.adapters.api.routes.jobs import router as jobs_router
 from documentor.adapters.api.routes.questions import router as questions_router
-from documentor.infrastructure.persistence.orm_models import EMBEDDING_DIMENSION
+from documentor.infrastructure.external.http_document_loader import create_http_client
+from documentor.infrastructure.persistence.orm_models import (
+    EMBEDDING_DIMENSION,
+    EMBEDDING_SHORT_DIMENSION,
+)
 
 
 @asynccontextmanager
@@ -25,10 +41,26 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             f"match the database column dimension={EMBEDDING_DIMENSION}. "
             f"Update EMBEDDING_DIMENSION in orm_models.py and create a migration."
         )
+    if settings.embedding_short_dimension != EMBEDDING_SHORT_DIMENSION:
+        raise RuntimeError(
+            "Settings embedding_short_dimension="
+            f"{settings.embedding_short_dimension} does not match the database "
+            f"column dimension={EMBEDDING_SHORT_DIMENSION}. Update "
+            "EMBEDDING_SHORT_DIMENSION in orm_models.py and create a migration."
+        )
 
     engine = create_db_engine(settings.database_url)
     app.state.session_factory = create_session_factory(engine)
 
+    app.state.embedding_cache = build_embedding_cache(
+        settings, app.state.session_factory
+    )
+    app.state.query_embedding_cache = build_query_embedding_cache(settings)
+    app.state.rewrite_cache = build_rewrite_cache(settings)
+    app.state.answer_cache = build_answer_cache(settings)
+    http_client = create_http_client(settings.http_max_connections)
+    app.state.http_loader = build_http_loader(settings, http_client)
+
     langfuse_client = None
     if settings.langfuse_enabled:
         from langfuse import Langfuse
@@ -39,8 +71,42 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             base_url=settings.langfuse_host,
         )
 
+    app.state.vector_snapshot = None
+    snapshot_refresher = None
+    if settings.vector_snapshot_enabled:
+        from documentor.infrastructure.persistence.vector_snapshot import (
+            VectorSnapshot,
+            VectorSnapshotRefresher,
+        )
+
+        app.state.vector_snapshot = VectorSnapshot(
+            Path(settings.vector_snapshot_dir), settings.embedding_dimension
+        )
+        snapshot_refresher = VectorSnapshotRefresher(
+            app.state.vector_snapshot,
+            app.state.session_factory,
+            interval=settings.vector_snapshot_refresh_seconds,
+        )
+        snapshot_refresher.start()
+
+    worker_pool = None
+    if settings.ingest_workers > 0:
+        worker_pool = build_ingestion_worker_pool(
+            settings,
+            app.state.session_factory,
+            app.state.embedding_cache,
+            app.state.http_loader,
+            workers=settings.ingest_workers,
+        )
+        worker_pool.start()
+
     yield
 
+    if worker_pool is not None:
+        await worker_pool.stop()
+    if snapshot_refresher is not None:
+        await snapshot_refresher.stop()
+    await http_client.aclose()
     await engine.dispose()
 
     if langfuse_client is not None:
@@ -60,5 +126,6 @@ def create_app() -> FastAPI:
     register_error_handlers(app)
     app.include_router(health_router)
     app.include_router(documents_router)
+    app.include_router(jobs_router)
     app.include_router(questions_router)
     return app
@@ -1,21 +1,30 @@
 import hashlib
+import json
 from collections.abc import Callable
+from dataclasses import asdict
 from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi.responses import StreamingResponse
 
 from documentor.adapters.api.dependencies import (
+    get_crawl_documentation,
     get_ingest_documentation,
     get_ingest_file_documentation,
     get_list_documents,
 )
 from documentor.adapters.api.file_validation import validate_upload_file
 from documentor.adapters.api.schemas import (
+    CrawlRequest,
     DocumentResponse,
     IngestDocumentRequest,
     IngestDocumentResponse,
 )
-from documentor.application.dtos import IngestDocumentationInput
+from documentor.application.dtos import (
+    CrawlDocumentationInput,
+    IngestDocumentationInput,
+)
+from documentor.application.use_cases.crawl_documentation import CrawlDocumentation
 from documentor.application.use_cases.ingest_documentation import IngestDocumentation
 from documentor.application.use_cases.list_documents import ListDocuments
 
@@ -33,6 +42,7 @@ async def ingest_document(
             source=request.source,
             title=request.title,
             on_duplicate=request.on_duplicate,
+            commit=request.commit,
         )
     )
     doc = result.document
@@ -46,6 +56,8 @@ async def ingest_document(
             chunk_count=doc.chunk_count,
         ),
         chunks_created=result.chunks_created,
+        chunks_deleted=result.chunks_deleted,
+        chunks_unchanged=result.chunks_unchanged,
     )
 
 
@@ -58,6 +70,7 @@ async def ingest_file(
     ],
     title: Annotated[str | None, Form()] = None,
     on_duplicate: Annotated[Literal["reject", "skip", "replace"], Form()] = "reject",
+    commit: Annotated[Literal["atomic", "batched"], Form()] = "atomic",
 ) -> IngestDocumentResponse:
     """Ingest documentation from an uploaded file."""
     content = await validate_upload_file(file)
@@ -66,7 +79,9 @@ async def ingest_file(
     use_case = use_case_factory(content, file.filename or "upload")
 
     result = await use_case.execute(
-        IngestDocumentationInput(source=source, title=title, on_duplicate=on_duplicate)
+        IngestDocumentationInput(
+            source=source, title=title, on_duplicate=on_duplicate, commit=commit
+        )
     )
 
     doc = result.document
@@ -80,8 +95,30 @@ async def ingest_file(
             chunk_count=doc.chunk_count,
         ),
         chunks_created=result.chunks_created,
+        chunks_deleted=result.chunks_deleted,
+        chunks_unchanged=result.chunks_unchanged,
+    )
+
+
+@router.post("/ingest/crawl")
+async def ingest_crawl(
+    request: CrawlRequest,
+    use_case: Annotated[CrawlDocumentation, Depends(get_crawl_documentation)],
+) -> StreamingResponse:
+    """Crawl a sitemap or seed URL and stream one NDJSON result per page."""
+    input_dto = CrawlDocumentationInput(
+        url=request.url,
+        max_pages=request.max_pages,
+        on_duplicate=request.on_duplicate,
+        commit=request.commit,
     )
 
+    async def event_generator():
+        async for result in use_case.execute_stream(input_dto):
+            yield json.dumps(asdict(result)) + "\n"
+
+    return StreamingResponse(event_generator(), media_type="application/x-ndjson")
+
 
 @router.get("/documents", response_model=list[DocumentResponse])
 async def list_documents(
@@ -1,6 +1,22 @@
-from fastapi import APIRouter
+from typing import Annotated
 
-from documentor.adapters.api.schemas import HealthResponse
+from fastapi import APIRouter, Depends
+
+from documentor.adapters.api.dependencies import (
+    get_answer_cache,
+    get_embedding_cache,
+    get_query_embedding_cache,
+    get_rewrite_cache,
+)
+from documentor.adapters.api.schemas import (
+    CacheHealthResponse,
+    CacheStatsResponse,
+    HealthResponse,
+)
+from documentor.infrastructure.cache import CacheStats, LruTtlCache
+from documentor.infrastructure.persistence.pg_embedding_cache import PgEmbeddingCache
+from documentor.infrastructure.query_embedding_cache import QueryEmbeddingCache
+from documentor.infrastructure.semantic_answer_cache import SemanticAnswerCache
 
 router = APIRouter()
 
@@ -8,3 +24,59 @@ router = APIRouter()
 @router.get("/health", response_model=HealthResponse)
 async def health() -> HealthResponse:
     return HealthResponse(status="ok")
+
+
+@router.get("/health/caches", response_model=CacheHealthResponse)
+async def cache_health(
+    query_embedding_cache: Annotated[
+        QueryEmbeddingCache | None, Depends(get_query_embedding_cache)
+    ],
+    embedding_cache: Annotated[
+        PgEmbeddingCache | None, Depends(get_embedding_cache)
+    ],
+    rewrite_cache: Annotated[
+        LruTtlCache[str] | None, Depends(get_rewrite_cache)
+    ],
+    answer_cache: Annotated[
+        SemanticAnswerCache | None, Depends(get_answer_cache)
+    ],
+) -> CacheHealthResponse:
+    """Hit rates of the process's caches since it started; null when disabled."""
+    return CacheHealthResponse(
+        query_embedding=(
+            _stats_response(
+                query_embedding_cache.stats,
+                entries=len(query_embedding_cache),
+                bytes=query_embedding_cache.nbytes,
+            )
+            if query_embedding_cache is not None
+            else None
+        ),
+        embedding=(
+            _stats_response(embedding_cache.stats)
+            if embedding_cache is not None
+            else None
+        ),
+        rewrite=(
+            _stats_response(rewrite_cache.stats, entries=len(rewrite_cache))
+            if rewrite_cache is not None
+            else None
+        ),
+        answer=(
+            _stats_response(answer_cache.stats, entries=len(answer_cache))
+            if answer_cache is not None
+            else None
+        ),
+    )
+
+
+def _stats_response(
+    stats: CacheStats, entries: int | None = None, bytes: int | None = None
+) -> CacheStatsResponse:
+    return CacheStatsResponse(
+        hits=stats.hits,
+        misses=stats.misses,
+        hit_rate=stats.hit_rate,
+        entries=entries,
+        bytes=bytes,
+    )
@@ -0,0 +1,101 @@
+import hashlib
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, File, Form, UploadFile, status
+
+from documentor.adapters.api.dependencies import get_enqueue_ingestion, get_job_status
+from documentor.adapters.api.file_validation import validate_upload_file
+from documentor.adapters.api.schemas import (
+    EnqueueBatchRequest,
+    IngestDocumentRequest,
+    JobResponse,
+)
+from documentor.application.dtos import EnqueueIngestionInput, JobDTO
+from documentor.application.use_cases.enqueue_ingestion import EnqueueIngestion
+from documentor.application.use_cases.get_job_status import GetJobStatus
+
+router = APIRouter()
+
+
+@router.post(
+    "/jobs/url", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED
+)
+async def enqueue_url(
+    request: IngestDocumentRequest,
+    use_case: Annotated[EnqueueIngestion, Depends(get_enqueue_ingestion)],
+) -> JobResponse:
+    """Queue a URL for background ingestion."""
+    job = await use_case.execute(_to_input(request))
+    return _to_response(job)
+
+
+@router.post(
+    "/jobs/batch",
+    response_model=list[JobResponse],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def enqueue_batch(
+    request: EnqueueBatchRequest,
+    use_case: Annotated[EnqueueIngestion, Depends(get_enqueue_ingestion)],
+) -> list[JobResponse]:
+    """Queue many URLs for background ingestion in one request."""
+    jobs = await use_case.execute_many([_to_input(item) for item in request.sources])
+    return [_to_response(job) for job in jobs]
+
+
+@router.post(
+    "/jobs/file", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED
+)
+async def enqueue_file(
+    file: Annotated[UploadFile, File()],
+    use_case: Annotated[EnqueueIngestion, Depends(get_enqueue_ingestion)],
+    title: Annotated[str | None, Form()] = None,
+    on_duplicate: Annotated[Literal["reject", "skip", "replace"], Form()] = "reject",
+    commit: Annotated[Literal["atomic", "batched"], Form()] = "atomic",
+) -> JobResponse:
+    """Queue an uploaded file for background ingestion."""
+    content = await validate_upload_file(file)
+
+    job = await use_case.execute(
+        EnqueueIngestionInput(
+            source=f"sha256:{hashlib.sha256(content).hexdigest()}",
+            title=title,
+            on_duplicate=on_duplicate,
+            commit=commit,
+            filename=file.filename or "upload",
+            payload=content,
+        )
+    )
+    return _to_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    use_case: Annotated[GetJobStatus, Depends(get_job_status)],
+) -> JobResponse:
+    """Return the status and progress of an ingestion job."""
+    return _to_response(await use_case.execute(job_id))
+
+
+def _to_input(request: IngestDocumentRequest) -> EnqueueIngestionInput:
+    return EnqueueIngestionInput(
+        source=request.source,
+        title=request.title,
+        on_duplicate=request.on_duplicate,
+        commit=request.commit,
+    )
+
+
+def _to_response(job: JobDTO) -> JobResponse:
+    return JobResponse(
+        id=job.id,
+        source=job.source,
+        status=job.status,  # type: ignore[arg-type]
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        attempts=job.attempts,
+        chunks_processed=job.chunks_processed,
+        document_id=job.document_id,
+        error=job.error,
+    )
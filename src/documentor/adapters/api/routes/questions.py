@@ -1,4 +1,5 @@
 import json
+from dataclasses import asdict
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
@@ -7,12 +8,16 @@ from fastapi.responses import StreamingResponse
 from documentor.adapters.api.dependencies import get_ask_question
 from documentor.adapters.api.schemas import (
     AnswerResponse,
+    AskBatchRequest,
     AskQuestionRequest,
+    SearchFilterSchema,
     SourceReferenceResponse,
 )
-from documentor.application.dtos import AskQuestionInput
+from documentor.application.dtos import AskQuestionBatchInput, AskQuestionInput
 from documentor.application.use_cases.ask_question import AskQuestion
+from documentor.domain.models.chunk import SearchFilter
 from documentor.domain.models.conversation import ConversationMessage
+from documentor.domain.models.document import SourceType
 
 router = APIRouter()
 
@@ -24,6 +29,16 @@ def _map_history(request: AskQuestionRequest) -> tuple[ConversationMessage, ...]
     )
 
 
+def _map_filter(filters: SearchFilterSchema | None) -> SearchFilter | None:
+    if filters is None:
+        return None
+    return SearchFilter(
+        document_ids=frozenset(filters.document_ids),
+        source_types=frozenset(SourceType(t) for t in filters.source_types),
+        source_prefix=filters.source_prefix,
+    )
+
+
 @router.post("/ask", response_model=AnswerResponse)
 async def ask_question(
     request: AskQuestionRequest,
@@ -33,6 +48,7 @@ async def ask_question(
     input_dto = AskQuestionInput(
         question_text=request.question,
         conversation_history=_map_history(request),
+        search_filter=_map_filter(request.filters),
     )
     result = await use_case.execute(input_dto)
     return AnswerResponse(
@@ -58,6 +74,7 @@ async def ask_question_stream(
     input_dto = AskQuestionInput(
         question_text=request.question,
         conversation_history=_map_history(request),
+        search_filter=_map_filter(request.filters),
     )
 
     async def event_generator():
@@ -65,3 +82,25 @@ async def ask_question_stream(
             yield json.dumps(event) + "\n"
 
     return StreamingResponse(event_generator(), media_type="application/x-ndjson")
+
+
+@router.post("/ask/batch")
+async def ask_question_batch(
+    request: AskBatchRequest,
+    use_case: Annotated[AskQuestion, Depends(get_ask_question)],
+) -> StreamingResponse:
+    """Answer many first-turn questions, streaming one NDJSON line per answer.
+
+    Lines arrive in completion order; `index` is the question's position in
+    the request.
+    """
+    input_dto = AskQuestionBatchInput(
+        questions=tuple(request.questions),
+        search_filter=_map_filter(request.filters),
+    )
+
+    async def event_generator():
+        async for result in use_case.execute_batch(input_dto):
+            yield json.dumps(asdict(result)) + "\n"
+
+    return StreamingResponse(event_generator(), media_type="application/x-ndjson")
@@ -1,34 +1,69 @@
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, field_validator
 
 
+def _validate_http_url(v: str, field: str) -> str:
+    parsed = urlparse(v)
+    if parsed.scheme not in ("http", "https"):
+        raise ValueError(f"{field} must be an HTTP or HTTPS URL")
+    if not parsed.netloc:
+        raise ValueError(f"{field} must include a valid hostname")
+    return v
+
+
 class ConversationMessageSchema(BaseModel):
     role: Literal["user", "assistant"]
     content: str = Field(..., min_length=1, max_length=10000)
 
 
+class SearchFilterSchema(BaseModel):
+    document_ids: list[str] = Field(default_factory=list, max_length=100)
+    source_types: list[Literal["url", "file", "text"]] = Field(default_factory=list)
+    source_prefix: str | None = Field(None, min_length=1, max_length=2000)
+
+
 class AskQuestionRequest(BaseModel):
     question: str = Field(..., min_length=1, max_length=1000)
     history: list[ConversationMessageSchema] = Field(default_factory=list, max_length=50)
+    filters: SearchFilterSchema | None = None
+
+
+class AskBatchRequest(BaseModel):
+    questions: list[Annotated[str, Field(min_length=1, max_length=1000)]] = Field(
+        ..., min_length=1, max_length=1000
+    )
+    filters: SearchFilterSchema | None = None
 
 
 class IngestDocumentRequest(BaseModel):
     source: str
     title: str | None = None
     on_duplicate: Literal["reject", "skip", "replace"] = "reject"
+    commit: Literal["atomic", "batched"] = "atomic"
 
     @field_validator("source")
     @classmethod
     def source_must_be_http_url(cls, v: str) -> str:
-        parsed = urlparse(v)
-        if parsed.scheme not in ("http", "https"):
-            raise ValueError("Source must be an HTTP or HTTPS URL")
-        if not parsed.netloc:
-            raise ValueError("Source must include a valid hostname")
-        return v
+        return _validate_http_url(v, "Source")
+
+
+class CrawlRequest(BaseModel):
+    url: str
+    max_pages: int = Field(500, ge=1, le=5000)
+    on_duplicate: Literal["reject", "skip", "replace"] = "skip"
+    commit: Literal["atomic", "batched"] = "atomic"
+
+    @field_validator("url")
+    @classmethod
+    def url_must_be_http_url(cls, v: str) -> str:
+        return _validate_http_url(v, "URL")
+
+
+class EnqueueBatchRequest(BaseModel):
+    sources: list[IngestDocumentRequest] = Field(..., min_length=1, max_length=1000)
 
 
 class SourceReferenceResponse(BaseModel):
@@ -55,7 +90,36 @@ class DocumentResponse(BaseModel):
 class IngestDocumentResponse(BaseModel):
     document: DocumentResponse
     chunks_created: int
+    chunks_deleted: int = 0
+    chunks_unchanged: int = 0
+
+
+class JobResponse(BaseModel):
+    id: str
+    source: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    created_at: datetime
+    updated_at: datetime
+    attempts: int
+    chunks_processed: int
+    document_id: str | None = None
+    error: str | None = None
 
 
 class HealthResponse(BaseModel):
     status: str
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    hit_rate: float
+    entries: int | None = None
+    bytes: int | None = None
+
+
+class CacheHealthResponse(BaseModel):
+    query_embedding: CacheStatsResponse | None
+    embedding: CacheStatsResponse | None
+    rewrite: CacheStatsResponse | None
+    answer: CacheStatsResponse | None
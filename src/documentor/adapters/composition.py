@@ -0,0 +1,153 @@
+"""Builders shared by the HTTP API and the standalone ingestion worker."""
+
+from datetime import timedelta
+from functools import lru_cache
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from documentor.adapters.worker.pool import IngestionWorkerPool
+from documentor.application.use_cases.ingest_documentation import (
+    IngestDocumentation,
+    ProgressCallback,
+)
+from documentor.application.use_cases.process_ingestion_job import (
+    ProcessIngestionJob,
+)
+from documentor.domain.models.ingestion_job import IngestionJob
+from documentor.domain.services.document_loader_service import DocumentLoaderService
+from documentor.domain.services.embedding_service import EmbeddingService
+from documentor.domain.services.text_chunker import TextChunker
+from documentor.infrastructure.cached_embedding_service import CachedEmbeddingService
+from documentor.infrastructure.config import Settings
+from documentor.infrastructure.external.file_document_loader import FileDocumentLoader
+from documentor.infrastructure.external.http_document_loader import HttpDocumentLoader
+from documentor.infrastructure.external.openai_embedding_service import (
+    OpenAIEmbeddingService,
+)
+from documentor.infrastructure.external.tiktoken_tokenizer import TiktokenTokenizer
+from documentor.infrastructure.persistence.pg_embedding_cache import PgEmbeddingCache
+from documentor.infrastructure.persistence.pg_unit_of_work import PgUnitOfWork
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
+
+
+def build_embedding_cache(
+    settings: Settings, session_factory: async_sessionmaker[AsyncSession]
+) -> PgEmbeddingCache | None:
+    if not settings.embedding_cache_enabled:
+        return None
+    max_age_days = settings.embedding_cache_max_age_days
+    return PgEmbeddingCache(
+        session_factory,
+        max_entries=settings.embedding_cache_max_entries,
+        max_age=timedelta(days=max_age_days) if max_age_days else None,
+    )
+
+
+def build_http_loader(
+    settings: Settings, client: httpx.AsyncClient
+) -> HttpDocumentLoader:
+    return HttpDocumentLoader(
+        client,
+        max_connections_per_host=settings.http_max_connections_per_host,
+        dns_cache_ttl=settings.http_dns_cache_ttl_seconds,
+    )
+
+
+@lru_cache
+def _get_embedding_service(
+    api_key: str, model: str, max_concurrency: int = 4, dimensions: int | None = None
+) -> OpenAIEmbeddingService:
+    return OpenAIEmbeddingService(
+        api_key=api_key,
+        model=model,
+        max_concurrency=max_concurrency,
+        dimensions=dimensions,
+    )
+
+
+@lru_cache
+def _get_tokenizer(model: str) -> TiktokenTokenizer:
+    return TiktokenTokenizer(model=model)
+
+
+def build_embedding_service(
+    settings: Settings, embedding_cache: PgEmbeddingCache | None
+) -> EmbeddingService:
+    embedding_service: EmbeddingService = _get_embedding_service(
+        api_key=settings.openai_api_key,
+        model=settings.embedding_model,
+        max_concurrency=settings.embedding_max_concurrency,
+        dimensions=settings.embedding_dimension,
+    )
+    if settings.langfuse_enabled:
+        from documentor.infrastructure.observability import ObservedEmbeddingService
+
+        embedding_service = ObservedEmbeddingService(embedding_service)
+
+    if embedding_cache is not None:
+        embedding_service = CachedEmbeddingService(
+            embedding_service, embedding_cache, model=settings.embedding_model
+        )
+    return embedding_service
+
+
+def build_ingest_use_case(
+    loader: DocumentLoaderService,
+    settings: Settings,
+    session_factory: async_sessionmaker[AsyncSession],
+    embedding_cache: PgEmbeddingCache | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> IngestDocumentation:
+    return IngestDocumentation(
+        loader=loader,
+        embedding_service=build_embedding_service(settings, embedding_cache),
+        uow=PgUnitOfWork(session_factory),
+        chunker=TextChunker(
+            _get_tokenizer(settings.embedding_model),
+            max_tokens=settings.chunk_max_tokens,
+            overlap_tokens=settings.chunk_overlap_tokens,
+        ),
+        batch_size=settings.ingest_batch_size,
+        max_pending_batches=settings.ingest_max_pending_batches,
+        on_progress=on_progress,
+    )
+
+
+def build_ingestion_worker_pool(
+    settings: Settings,
+    session_factory: async_sessionmaker[AsyncSession],
+    embedding_cache: PgEmbeddingCache | None = None,
+    http_loader: HttpDocumentLoader | None = None,
+    *,
+    workers: int,
+) -> IngestionWorkerPool:
+    def ingest_factory(
+        job: IngestionJob, on_progress: ProgressCallback
+    ) -> IngestDocumentation:
+        loader: DocumentLoaderService
+        if job.payload is not None and job.filename is not None:
+            loader = FileDocumentLoader(job.payload, job.filename)
+        else:
+            loader = http_loader or HttpDocumentLoader()
+        return build_ingest_use_case(
+            loader, settings, session_factory, embedding_cache, on_progress
+        )
+
+    def process_factory() -> ProcessIngestionJob:
+        return ProcessIngestionJob(
+            uow=PgUnitOfWork(session_factory),
+            ingest_factory=ingest_factory,
+            lease=timedelta(seconds=settings.ingest_job_lease_seconds),
+            max_attempts=settings.ingest_job_max_attempts,
+        )
+
+    return IngestionWorkerPool(
+        process_factory,
+        workers=workers,
+        poll_interval=settings.ingest_job_poll_interval_seconds,
+    )
@@ -0,0 +1,46 @@
+"""Run ingestion workers without the HTTP API.
+
+Usage: ``python -m documentor.adapters.worker`` (``INGEST_WORKER_CONCURRENCY``
+sets the number of concurrent jobs). This is how ingestion is meant to run:
+the API processes only start workers of their own when ``INGEST_WORKERS`` is
+set.
+"""
+
+import asyncio
+import logging
+
+from documentor.adapters.composition import (
+    build_embedding_cache,
+    build_http_loader,
+    build_ingestion_worker_pool,
+    get_settings,
+)
+from documentor.infrastructure.database import create_engine as create_db_engine
+from documentor.infrastructure.database import create_session_factory
+from documentor.infrastructure.external.http_document_loader import create_http_client
+
+
+async def main() -> None:
+    settings = get_settings()
+    engine = create_db_engine(settings.database_url)
+    session_factory = create_session_factory(engine)
+    http_client = create_http_client(settings.http_max_connections)
+    pool = build_ingestion_worker_pool(
+        settings,
+        session_factory,
+        build_embedding_cache(settings, session_factory),
+        build_http_loader(settings, http_client),
+        workers=settings.ingest_worker_concurrency,
+    )
+    pool.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await pool.stop()
+        await http_client.aclose()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
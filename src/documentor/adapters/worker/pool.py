@@ -0,0 +1,53 @@
+import asyncio
+import logging
+from collections.abc import Callable
+
+from documentor.application.use_cases.process_ingestion_job import (
+    ProcessIngestionJob,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionWorkerPool:
+    """Run `workers` concurrent loops that drain the ingestion job queue.
+
+    Each loop builds a fresh `ProcessIngestionJob` per job (units of work
+    hold a session and are not shared between tasks) and sleeps for
+    `poll_interval` seconds whenever the queue is empty. Stopping cancels
+    in-flight jobs; their lease expires and another worker retries them.
+    """
+
+    def __init__(
+        self,
+        process_factory: Callable[[], ProcessIngestionJob],
+        *,
+        workers: int,
+        poll_interval: float = 1.0,
+    ) -> None:
+        self._process_factory = process_factory
+        self._workers = workers
+        self._poll_interval = poll_interval
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"ingestion-worker-{i}")
+            for i in range(self._workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                job = await self._process_factory().execute()
+            except Exception:
+                logger.exception("Ingestion worker failed to process a job")
+                job = None
+            if job is None:
+                await asyncio.sleep(self._poll_interval)
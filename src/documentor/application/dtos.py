@@ -3,8 +3,10 @@ from datetime import datetime
 from typing import Literal
 
 from documentor.domain.models.answer import Answer, SourceReference
+from documentor.domain.models.chunk import SearchFilter
 from documentor.domain.models.conversation import ConversationMessage
 from documentor.domain.models.document import Document
+from documentor.domain.models.ingestion_job import IngestionJob
 
 
 @dataclass(frozen=True)
@@ -12,12 +14,38 @@ class IngestDocumentationInput:
     source: str
     title: str | None = None
     on_duplicate: Literal["reject", "skip", "replace"] = "reject"
+    commit: Literal["atomic", "batched"] = "atomic"
+
+
+@dataclass(frozen=True)
+class EnqueueIngestionInput:
+    source: str
+    title: str | None = None
+    on_duplicate: Literal["reject", "skip", "replace"] = "reject"
+    commit: Literal["atomic", "batched"] = "atomic"
+    filename: str | None = None
+    payload: bytes | None = None
+
+
+@dataclass(frozen=True)
+class CrawlDocumentationInput:
+    url: str
+    max_pages: int = 500
+    on_duplicate: Literal["reject", "skip", "replace"] = "skip"
+    commit: Literal["atomic", "batched"] = "atomic"
 
 
 @dataclass(frozen=True)
 class AskQuestionInput:
     question_text: str
     conversation_history: tuple[ConversationMessage, ...] = field(default_factory=tuple)
+    search_filter: SearchFilter | None = None
+
+
+@dataclass(frozen=True)
+class AskQuestionBatchInput:
+    questions: tuple[str, ...]
+    search_filter: SearchFilter | None = None
 
 
 @dataclass(frozen=True)
@@ -50,6 +78,13 @@ class AnswerDTO:
         )
 
 
+@dataclass(frozen=True)
+class BatchAnswerDTO:
+    index: int
+    answer: AnswerDTO | None = None
+    error: str | None = None
+
+
 @dataclass(frozen=True)
 class DocumentDTO:
     id: str
@@ -75,3 +110,41 @@ class DocumentDTO:
 class IngestResultDTO:
     document: DocumentDTO
     chunks_created: int
+    chunks_deleted: int = 0
+    chunks_unchanged: int = 0
+
+
+@dataclass(frozen=True)
+class JobDTO:
+    id: str
+    source: str
+    status: str
+    created_at: datetime
+    updated_at: datetime
+    attempts: int
+    chunks_processed: int
+    document_id: str | None
+    error: str | None
+
+    @staticmethod
+    def from_entity(job: IngestionJob) -> "JobDTO":
+        return JobDTO(
+            id=job.id,
+            source=job.source,
+            status=str(job.status),
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            attempts=job.attempts,
+            chunks_processed=job.chunks_processed,
+            document_id=job.document_id,
+            error=job.error,
+        )
+
+
+@dataclass(frozen=True)
+class CrawlPageResultDTO:
+    url: str
+    status: Literal["ingested", "failed"]
+    document_id: str | None = None
+    chunks_created: int = 0
+    error: str | None = None
@@ -1,17 +1,56 @@
+import asyncio
+import re
 from collections.abc import AsyncIterator
+from dataclasses import replace
+from datetime import UTC, datetime
 from typing import Any
 
+from documentor.domain.exceptions import DocumentorDomainError
 from documentor.domain.models.answer import Answer, SourceReference
+from documentor.domain.models.chunk import (
+    Embedding,
+    RetrievedChunk,
+    SearchFilter,
+    SearchProfile,
+)
 from documentor.domain.models.conversation import ConversationMessage
 from documentor.domain.models.question import Question
+from documentor.domain.services.answer_cache import AnswerCache
+from documentor.domain.services.context_packing import (
+    fit_token_budget,
+    merge_adjacent,
+)
+from documentor.domain.services.diversification import (
+    MMR_LAMBDA,
+    maximal_marginal_relevance,
+)
 from documentor.domain.services.embedding_service import EmbeddingService
 from documentor.domain.services.llm_service import LLMService
+from documentor.domain.services.query_decomposition import (
+    MAX_SUB_QUERIES,
+    decompose_query,
+)
+from documentor.domain.services.rank_fusion import reciprocal_rank_fusion
 from documentor.domain.unit_of_work import UnitOfWork
 
-from documentor.application.dtos import AnswerDTO, AskQuestionInput
+from documentor.application.dtos import (
+    AnswerDTO,
+    AskQuestionBatchInput,
+    AskQuestionInput,
+    BatchAnswerDTO,
+)
 
 
 MIN_RELEVANCE_SCORE = 0.3
+TOP_K = 5
+MMR_CANDIDATES = 20
+DEFAULT_MAX_CONCURRENT_GENERATIONS = 8
+# Token-set Jaccard similarity above which a rewrite is not worth a new search.
+TRIVIAL_REWRITE_SIMILARITY = 0.8
+
+_WORD = re.compile(r"\w+")
+
+SearchResults = list[RetrievedChunk]
 
 
 class AskQuestion:
@@ -20,119 +59,479 @@ class AskQuestion:
         embedding_service: EmbeddingService,
         llm_service: LLMService,
         uow: UnitOfWork,
+        answer_cache: AnswerCache | None = None,
+        speculative_retrieval: bool = False,
+        hybrid_search: bool = False,
+        search_profile: SearchProfile | None = None,
+        diversify: bool = False,
+        mmr_lambda: float = MMR_LAMBDA,
+        mmr_candidates: int = MMR_CANDIDATES,
+        context_max_tokens: int | None = None,
+        max_concurrent_generations: int = DEFAULT_MAX_CONCURRENT_GENERATIONS,
+        fan_out: bool = False,
+        max_sub_queries: int = MAX_SUB_QUERIES,
     ) -> None:
         self._embedding_service = embedding_service
         self._llm_service = llm_service
         self._uow = uow
-
-    async def _get_search_query(
-        self,
-        question: Question,
-        history: tuple[ConversationMessage, ...],
-    ) -> str:
-        if history:
-            return await self._llm_service.rewrite_query(question, history)
-        return question.text
+        self._answer_cache = answer_cache
+        self._speculative_retrieval = speculative_retrieval
+        self._hybrid_search = hybrid_search
+        self._search_profile = replace(
+            search_profile or SearchProfile(), min_score=MIN_RELEVANCE_SCORE
+        )
+        self._diversify = diversify
+        self._mmr_lambda = mmr_lambda
+        self._mmr_candidates = max(mmr_candidates, TOP_K)
+        self._context_max_tokens = context_max_tokens
+        self._max_concurrent_generations = max(1, max_concurrent_generations)
+        self._fan_out = fan_out
+        self._max_sub_queries = max_sub_queries
 
     async def execute(self, input: AskQuestionInput) -> AnswerDTO:
         """Process a question using RAG: embed, search, generate."""
         question = Question(text=input.question_text)
+        history = input.conversation_history
+        retrieved_at = datetime.now(UTC)
+        search_filter = _effective_filter(input.search_filter)
+
+        embedding: Embedding | None = None
+        if history:
+            results = await self._retrieve_with_history(
+                question, history, search_filter
+            )
+        else:
+            embeddings, lexical = await self._embed(question.text, search_filter)
+            embedding = embeddings[0]
+            cached = await self._find_cached_answer(embedding, search_filter)
+            if cached is not None:
+                return AnswerDTO.from_domain(cached)
+            results = await self._search(embeddings, search_filter, lexical)
 
-        search_query = await self._get_search_query(
-            question, input.conversation_history
+        return await self._answer(
+            question, history, results, embedding, search_filter, retrieved_at
         )
-        embedding = await self._embedding_service.embed(search_query)
 
-        async with self._uow:
-            results = await self._uow.chunks.search_similar(embedding, top_k=5)
-            results = [
-                (chunk, score)
-                for chunk, score in results
-                if score >= MIN_RELEVANCE_SCORE
-            ]
-
-            if not results:
-                return AnswerDTO(
-                    text="No relevant documentation found for your question.",
-                    sources=[],
-                )
+    async def execute_batch(
+        self, input: AskQuestionBatchInput
+    ) -> AsyncIterator[BatchAnswerDTO]:
+        """Answer independent first-turn questions, yielding answers as they finish.
+
+        All questions are embedded in one `embed_batch` call and searched in
+        one `retrieve_batch` call. Generation then runs for at most
+        `max_concurrent_generations` questions at a time, and each answer is
+        yielded, tagged with its question's index, as soon as it is ready. A
+        failed generation yields its error without affecting the others.
+        Batches use vector search only, without the full-text pass.
+        """
+        questions = [Question(text=text) for text in input.questions]
+        search_filter = _effective_filter(input.search_filter)
+        retrieved_at = datetime.now(UTC)
+        embeddings = await self._embedding_service.embed_batch(
+            [question.text for question in questions]
+        )
 
-            chunks = [chunk for chunk, _score in results]
-            text = await self._llm_service.generate(
-                question, chunks, input.conversation_history
+        pending: list[int] = []
+        for index, embedding in enumerate(embeddings):
+            cached = await self._find_cached_answer(embedding, search_filter)
+            if cached is None:
+                pending.append(index)
+            else:
+                yield BatchAnswerDTO(index=index, answer=AnswerDTO.from_domain(cached))
+        if not pending:
+            return
+
+        async with self._uow:
+            batches = await self._uow.chunks.retrieve_batch(
+                [embeddings[index] for index in pending],
+                **self._retrieve_options(search_filter),
             )
 
-            document_ids = {chunk.document_id for chunk, _score in results}
-            documents = await self._uow.documents.find_by_ids(document_ids)
-            document_titles = {
-                doc_id: documents[doc_id].title if doc_id in documents else doc_id
-                for doc_id in document_ids
-            }
+        answers: asyncio.Queue[BatchAnswerDTO | None] = asyncio.Queue()
+        slots = asyncio.Semaphore(self._max_concurrent_generations)
 
-        answer = Answer(
-            text=text,
-            sources=tuple(
-                SourceReference(
-                    document_title=document_titles[chunk.document_id],
-                    chunk_text=chunk.content.text,
-                    relevance_score=score,
-                    chunk_id=chunk.id,
+        async def answer(index: int, results: SearchResults) -> None:
+            try:
+                dto = await self._answer(
+                    questions[index],
+                    (),
+                    self._rank(results),
+                    embeddings[index],
+                    search_filter,
+                    retrieved_at,
                 )
-                for chunk, score in results
-            ),
-        )
+                answers.put_nowait(BatchAnswerDTO(index=index, answer=dto))
+            except DocumentorDomainError as e:
+                answers.put_nowait(BatchAnswerDTO(index=index, error=str(e)))
+            finally:
+                slots.release()
 
-        return AnswerDTO.from_domain(answer)
+        async def run() -> None:
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for index, results in zip(pending, batches, strict=True):
+                        await slots.acquire()
+                        group.create_task(answer(index, results))
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0]
+            finally:
+                answers.put_nowait(None)
+
+        runner = asyncio.create_task(run())
+        try:
+            while (result := await answers.get()) is not None:
+                yield result
+            await runner
+        finally:
+            runner.cancel()
 
     async def execute_stream(
         self, input: AskQuestionInput
     ) -> AsyncIterator[dict[str, Any]]:
         """Process a question using RAG with streaming LLM output."""
         question = Question(text=input.question_text)
+        history = input.conversation_history
+        retrieved_at = datetime.now(UTC)
+        search_filter = _effective_filter(input.search_filter)
 
-        search_query = await self._get_search_query(
-            question, input.conversation_history
-        )
-        embedding = await self._embedding_service.embed(search_query)
-
-        async with self._uow:
-            results = await self._uow.chunks.search_similar(embedding, top_k=5)
-            results = [
-                (chunk, score)
-                for chunk, score in results
-                if score >= MIN_RELEVANCE_SCORE
-            ]
-
-            if not results:
-                yield {
-                    "type": "text",
-                    "content": "No relevant documentation found for your question.",
-                }
-                yield {"type": "sources", "sources": []}
+        embedding: Embedding | None = None
+        if history:
+            results = await self._retrieve_with_history(
+                question, history, search_filter
+            )
+        else:
+            embeddings, lexical = await self._embed(question.text, search_filter)
+            embedding = embeddings[0]
+            cached = await self._find_cached_answer(embedding, search_filter)
+            if cached is not None:
+                yield {"type": "text", "content": cached.text}
+                yield {"type": "sources", "sources": _source_events(cached.sources)}
                 yield {"type": "done"}
                 return
+            results = await self._search(embeddings, search_filter, lexical)
 
-            chunks = [chunk for chunk, _score in results]
-            document_ids = {chunk.document_id for chunk, _score in results}
-            documents = await self._uow.documents.find_by_ids(document_ids)
-            doc_titles = {
-                doc_id: documents[doc_id].title if doc_id in documents else doc_id
-                for doc_id in document_ids
+        if not results:
+            yield {
+                "type": "text",
+                "content": "No relevant documentation found for your question.",
             }
+            yield {"type": "sources", "sources": []}
+            yield {"type": "done"}
+            return
 
+        results = self._fit_context(results)
+        text_parts: list[str] = []
         async for text_chunk in self._llm_service.generate_stream(
-            question, chunks, input.conversation_history
+            question, merge_adjacent(results), history
         ):
+            text_parts.append(text_chunk)
             yield {"type": "text", "content": text_chunk}
 
-        sources = [
-            {
-                "document_title": doc_titles[chunk.document_id],
-                "chunk_text": chunk.content.text,
-                "relevance_score": score,
-                "chunk_id": chunk.id,
-            }
-            for chunk, score in results
-        ]
-        yield {"type": "sources", "sources": sources}
+        sources = _source_references(results)
+        yield {"type": "sources", "sources": _source_events(sources)}
+
+        text = "".join(text_parts)
+        if embedding is not None and search_filter is None and text.strip():
+            answer = Answer(text=text, sources=sources)
+            await self._cache_answer(embedding, answer, results, retrieved_at)
         yield {"type": "done"}
+
+    async def _retrieve_with_history(
+        self,
+        question: Question,
+        history: tuple[ConversationMessage, ...],
+        search_filter: SearchFilter | None,
+    ) -> SearchResults:
+        """Rewrite the follow-up into a standalone query and search with it.
+
+        In speculative mode the raw question is embedded and searched while
+        the rewrite is in flight. A rewrite that is nearly the same text
+        reuses those results as they are; otherwise the rewrite is searched
+        too and both result sets are merged. In hybrid mode both are already
+        rank-fused with full-text hits, whose scores are not comparable to
+        similarities, so they are fused by rank again instead of by score.
+        """
+        if not self._speculative_retrieval:
+            search_query = await self._llm_service.rewrite_query(question, history)
+            return await self._embed_and_search(search_query, search_filter)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                speculative = group.create_task(
+                    self._embed_and_search(question.text, search_filter)
+                )
+                search_query = await self._llm_service.rewrite_query(
+                    question, history
+                )
+                if _is_trivial_rewrite(question.text, search_query):
+                    rewritten_embedding = None
+                else:
+                    rewritten_embedding = await self._embedding_service.embed(
+                        search_query
+                    )
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0]
+
+        if rewritten_embedding is None:
+            return speculative.result()
+        if not self._hybrid_search:
+            return _merge_results(
+                speculative.result(),
+                await self._search([rewritten_embedding], search_filter),
+            )
+        lexical = await self._search_fulltext(search_query, search_filter)
+        return reciprocal_rank_fusion(
+            [
+                speculative.result(),
+                await self._search([rewritten_embedding], search_filter, lexical),
+            ],
+            top_k=TOP_K,
+        )
+
+    async def _embed_and_search(
+        self, text: str, search_filter: SearchFilter | None
+    ) -> SearchResults:
+        embeddings, lexical = await self._embed(text, search_filter)
+        return await self._search(embeddings, search_filter, lexical)
+
+    async def _embed(
+        self, text: str, search_filter: SearchFilter | None
+    ) -> tuple[list[Embedding], SearchResults | None]:
+        """Embed `text`; in hybrid mode, run its full-text search meanwhile.
+
+        The first embedding is that of `text`. In fan-out mode a compound
+        question is also split into sub-queries, embedded in the same
+        `embed_batch` call and returned after it.
+        """
+        texts = [text]
+        if self._fan_out:
+            texts.extend(decompose_query(text, self._max_sub_queries))
+        if not self._hybrid_search:
+            return await self._embed_all(texts), None
+        try:
+            async with asyncio.TaskGroup() as group:
+                lexical = group.create_task(
+                    self._search_fulltext(text, search_filter)
+                )
+                embeddings = await self._embed_all(texts)
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0]
+        return embeddings, lexical.result()
+
+    async def _embed_all(self, texts: list[str]) -> list[Embedding]:
+        if len(texts) == 1:
+            return [await self._embedding_service.embed(texts[0])]
+        return await self._embedding_service.embed_batch(texts)
+
+    async def _search(
+        self,
+        embeddings: list[Embedding],
+        search_filter: SearchFilter | None,
+        lexical: SearchResults | None = None,
+    ) -> SearchResults:
+        """Vector search per embedding, fused by reciprocal rank.
+
+        A single embedding without `lexical` results is returned as ranked.
+        Fan-out sub-queries are searched together with one `retrieve_batch`
+        call; rank fusion de-duplicates chunks several of them found, and
+        ranks those first.
+
+        Fusion orders the hits, but every hit's `score` stays a cosine
+        similarity: full-text ranks are replaced by the hit's similarity to
+        the first embedding before fusing, so lexical-only hits are scored
+        on the same scale as the others in sources and cached answers.
+        """
+        options = self._retrieve_options(search_filter)
+        async with self._uow:
+            if len(embeddings) == 1:
+                batches = [await self._uow.chunks.retrieve(embeddings[0], **options)]
+            else:
+                batches = await self._uow.chunks.retrieve_batch(embeddings, **options)
+        rankings = [self._rank(results) for results in batches]
+        if lexical is not None:
+            rankings.append(_scored_by_similarity(lexical, embeddings[0]))
+        if len(rankings) == 1:
+            return rankings[0]
+        return reciprocal_rank_fusion(rankings, top_k=TOP_K)
+
+    def _retrieve_options(self, search_filter: SearchFilter | None) -> dict[str, Any]:
+        return {
+            "top_k": self._mmr_candidates if self._diversify else TOP_K,
+            "profile": self._search_profile,
+            "search_filter": search_filter,
+            "with_embeddings": self._diversify,
+        }
+
+    def _rank(self, results: SearchResults) -> SearchResults:
+        """Narrow the vector hits of one query to `TOP_K`.
+
+        The relevance threshold is applied by the search itself, so iterative
+        index scans can still fill `TOP_K`; it is re-checked here for repositories
+        that ignore it. It applies to cosine scores only: a full-text match on
+        an exact identifier is kept however far its embedding is.
+
+        With `diversify`, `mmr_candidates` hits were fetched with their vectors
+        and are narrowed to `TOP_K` by maximal marginal relevance, so
+        overlapping neighbours of one section do not fill every slot.
+        """
+        results = [result for result in results if result.score >= MIN_RELEVANCE_SCORE]
+        if self._diversify:
+            results = maximal_marginal_relevance(
+                results, top_k=TOP_K, lambda_=self._mmr_lambda
+            )
+        return results
+
+    async def _answer(
+        self,
+        question: Question,
+        history: tuple[ConversationMessage, ...],
+        results: SearchResults,
+        embedding: Embedding | None,
+        search_filter: SearchFilter | None,
+        retrieved_at: datetime,
+    ) -> AnswerDTO:
+        if not results:
+            return AnswerDTO(
+                text="No relevant documentation found for your question.",
+                sources=[],
+            )
+
+        # No connection is held from here on: titles came with the search.
+        results = self._fit_context(results)
+        text = await self._llm_service.generate(
+            question, merge_adjacent(results), history
+        )
+
+        answer = Answer(text=text, sources=_source_references(results))
+        if embedding is not None and search_filter is None:
+            await self._cache_answer(embedding, answer, results, retrieved_at)
+
+        return AnswerDTO.from_domain(answer)
+
+    async def _search_fulltext(
+        self, text: str, search_filter: SearchFilter | None
+    ) -> SearchResults:
+        async with self._uow:
+            return await self._uow.chunks.search_fulltext(
+                text, top_k=TOP_K, search_filter=search_filter, with_embeddings=True
+            )
+
+    def _fit_context(self, results: SearchResults) -> SearchResults:
+        """Drop the hits that do not fit the context token budget, if any.
+
+        Sources and cached answers then only cite chunks the LLM was shown.
+        """
+        if self._context_max_tokens is None:
+            return results
+        return fit_token_budget(results, self._context_max_tokens)
+
+    async def _find_cached_answer(
+        self, embedding: Embedding, search_filter: SearchFilter | None
+    ) -> Answer | None:
+        """Return a cached answer to a similar question, if still up to date.
+
+        Only unfiltered first-turn questions are cached, since follow-up
+        answers depend on the conversation and scoped ones on the filter.
+        A hit is discarded, and every answer built on the same documents
+        invalidated, when one of its documents was deleted or re-ingested
+        after the answer was cached.
+        """
+        if self._answer_cache is None or search_filter is not None:
+            return None
+        cached = await self._answer_cache.find_similar(embedding)
+        if cached is None:
+            return None
+
+        async with self._uow:
+            documents = await self._uow.documents.find_by_ids(set(cached.document_ids))
+        stale = {
+            doc_id
+            for doc_id in cached.document_ids
+            if doc_id not in documents
+            or documents[doc_id].updated_since(cached.cached_at)
+        }
+        if stale:
+            await self._answer_cache.invalidate_documents(stale)
+            return None
+        return cached.answer
+
+    async def _cache_answer(
+        self,
+        embedding: Embedding,
+        answer: Answer,
+        results: SearchResults,
+        retrieved_at: datetime,
+    ) -> None:
+        if self._answer_cache is None:
+            return
+        document_ids = frozenset(result.chunk.document_id for result in results)
+        await self._answer_cache.store(embedding, answer, document_ids, retrieved_at)
+
+
+def _effective_filter(search_filter: SearchFilter | None) -> SearchFilter | None:
+    if search_filter is None or search_filter.is_empty:
+        return None
+    return search_filter
+
+
+def _is_trivial_rewrite(original: str, rewritten: str) -> bool:
+    original_words = set(_WORD.findall(original.casefold()))
+    rewritten_words = set(_WORD.findall(rewritten.casefold()))
+    union = original_words | rewritten_words
+    if not union:
+        return True
+    similarity = len(original_words & rewritten_words) / len(union)
+    return similarity >= TRIVIAL_REWRITE_SIMILARITY
+
+
+def _scored_by_similarity(
+    results: SearchResults, embedding: Embedding
+) -> SearchResults:
+    """Replace full-text ranks with cosine similarity to `embedding`, keeping order.
+
+    Hits without a stored embedding score 0.
+    """
+    embedded = [r.chunk.embedding for r in results if r.chunk.embedding is not None]
+    similarities = iter(embedding.cosine_similarities(embedded))
+    return [
+        replace(
+            result,
+            score=next(similarities) if result.chunk.embedding is not None else 0.0,
+        )
+        for result in results
+    ]
+
+
+def _merge_results(*result_sets: SearchResults) -> SearchResults:
+    """Union of `result_sets` by chunk id, keeping each chunk's best score."""
+    best: dict[str, RetrievedChunk] = {}
+    for results in result_sets:
+        for result in results:
+            chunk_id = result.chunk.id
+            if chunk_id not in best or result.score > best[chunk_id].score:
+                best[chunk_id] = result
+    return sorted(best.values(), key=lambda result: result.score, reverse=True)[:TOP_K]
+
+
+def _source_references(results: SearchResults) -> tuple[SourceReference, ...]:
+    return tuple(
+        SourceReference(
+            document_title=result.document_title,
+            chunk_text=result.chunk.content.text,
+            relevance_score=result.score,
+            chunk_id=result.chunk.id,
+        )
+        for result in results
+    )
+
+
+def _source_events(sources: tuple[SourceReference, ...]) -> list[dict[str, Any]]:
+    return [
+        {
+            "document_title": source.document_title,
+            "chunk_text": source.chunk_text,
+            "relevance_score": source.relevance_score,
+            "chunk_id": source.chunk_id,
+        }
+        for source in sources
+    ]
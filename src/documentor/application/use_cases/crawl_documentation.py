@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+
+from documentor.application.dtos import (
+    CrawlDocumentationInput,
+    CrawlPageResultDTO,
+    IngestDocumentationInput,
+)
+from documentor.application.use_cases.ingest_documentation import IngestDocumentation
+from documentor.domain.exceptions import DocumentorDomainError
+from documentor.domain.services.document_loader_service import (
+    DocumentLoaderService,
+    LoadedDocument,
+)
+from documentor.domain.services.site_crawler import CrawledPage, SiteCrawler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_INGESTS = 4
+
+IngestFactory = Callable[[DocumentLoaderService], IngestDocumentation]
+
+
+class _FetchedDocumentLoader(DocumentLoaderService):
+    """Hands an already-fetched page to `IngestDocumentation`."""
+
+    def __init__(self, document: LoadedDocument) -> None:
+        self._document = document
+
+    async def load(self, source: str) -> LoadedDocument:
+        return self._document
+
+
+class CrawlDocumentation:
+    """Ingest every page of a sitemap or site, streaming per-page results.
+
+    Pages are ingested as the crawler yields them, with at most
+    `max_concurrent_ingests` in flight; the crawler is paused while all
+    slots are busy. Each page is ingested in its own unit of work, so one
+    failing page does not affect the others.
+    """
+
+    def __init__(
+        self,
+        crawler: SiteCrawler,
+        ingest_factory: IngestFactory,
+        max_concurrent_ingests: int = DEFAULT_MAX_CONCURRENT_INGESTS,
+    ) -> None:
+        self._crawler = crawler
+        self._ingest_factory = ingest_factory
+        self._max_concurrent_ingests = max_concurrent_ingests
+
+    async def execute_stream(
+        self, input: CrawlDocumentationInput
+    ) -> AsyncIterator[CrawlPageResultDTO]:
+        results: asyncio.Queue[CrawlPageResultDTO | None] = asyncio.Queue()
+        slots = asyncio.Semaphore(self._max_concurrent_ingests)
+
+        async def ingest(page: CrawledPage) -> None:
+            try:
+                results.put_nowait(await self._ingest_page(page, input))
+            finally:
+                slots.release()
+
+        async def run() -> None:
+            try:
+                async with asyncio.TaskGroup() as group:
+                    async for page in self._crawler.crawl(
+                        input.url, max_pages=input.max_pages
+                    ):
+                        await slots.acquire()
+                        group.create_task(ingest(page))
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0]
+            finally:
+                results.put_nowait(None)
+
+        runner = asyncio.create_task(run())
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+            await runner
+        finally:
+            runner.cancel()
+
+    async def _ingest_page(
+        self, page: CrawledPage, input: CrawlDocumentationInput
+    ) -> CrawlPageResultDTO:
+        if page.document is None:
+            return CrawlPageResultDTO(url=page.url, status="failed", error=page.error)
+
+        use_case = self._ingest_factory(_FetchedDocumentLoader(page.document))
+        try:
+            result = await use_case.execute(
+                IngestDocumentationInput(
+                    source=page.url,
+                    on_duplicate=input.on_duplicate,
+                    commit=input.commit,
+                )
+            )
+        except DocumentorDomainError as e:
+            return CrawlPageResultDTO(url=page.url, status="failed", error=str(e))
+        except Exception:
+            logger.exception("Crawled page %s failed unexpectedly", page.url)
+            return CrawlPageResultDTO(
+                url=page.url,
+                status="failed",
+                error="Unexpected error during ingestion",
+            )
+        return CrawlPageResultDTO(
+            url=page.url,
+            status="ingested",
+            document_id=result.document.id,
+            chunks_created=result.chunks_created,
+        )
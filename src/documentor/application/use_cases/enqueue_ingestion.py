@@ -0,0 +1,32 @@
+from documentor.application.dtos import EnqueueIngestionInput, JobDTO
+from documentor.domain.models.ingestion_job import IngestionJob
+from documentor.domain.unit_of_work import UnitOfWork
+
+
+class EnqueueIngestion:
+    def __init__(self, uow: UnitOfWork) -> None:
+        self._uow = uow
+
+    async def execute(self, input: EnqueueIngestionInput) -> JobDTO:
+        """Queue a source for background ingestion and return the job."""
+        [job] = await self.execute_many([input])
+        return job
+
+    async def execute_many(self, inputs: list[EnqueueIngestionInput]) -> list[JobDTO]:
+        """Queue several sources in one transaction, preserving their order."""
+        jobs = [
+            IngestionJob.create(
+                source=input.source,
+                title=input.title,
+                on_duplicate=input.on_duplicate,
+                commit=input.commit,
+                filename=input.filename,
+                payload=input.payload,
+            )
+            for input in inputs
+        ]
+        async with self._uow:
+            for job in jobs:
+                await self._uow.jobs.save(job)
+            await self._uow.commit()
+        return [JobDTO.from_entity(job) for job in jobs]
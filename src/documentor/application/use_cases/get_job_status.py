@@ -0,0 +1,16 @@
+from documentor.application.dtos import JobDTO
+from documentor.domain.exceptions import JobNotFoundError
+from documentor.domain.unit_of_work import UnitOfWork
+
+
+class GetJobStatus:
+    def __init__(self, uow: UnitOfWork) -> None:
+        self._uow = uow
+
+    async def execute(self, job_id: str) -> JobDTO:
+        """Return the status and progress of an ingestion job."""
+        async with self._uow:
+            job = await self._uow.jobs.find_by_id(job_id)
+        if job is None:
+            raise JobNotFoundError(job_id)
+        return JobDTO.from_entity(job)
@@ -1,8 +1,17 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from itertools import chain
+
 from documentor.domain.exceptions import DuplicateDocumentError, InvalidDocumentError
-from documentor.domain.models.chunk import Chunk, ChunkContent, split_text_into_chunks
+from documentor.domain.models.chunk import Chunk, ChunkContent
 from documentor.domain.models.document import Document
-from documentor.domain.services.document_loader_service import DocumentLoaderService
+from documentor.domain.services.document_loader_service import (
+    DocumentLoaderService,
+    LoadedDocument,
+)
 from documentor.domain.services.embedding_service import EmbeddingService
+from documentor.domain.services.text_chunker import TextChunker
 from documentor.domain.unit_of_work import UnitOfWork
 
 from documentor.application.dtos import (
@@ -12,16 +21,30 @@ from documentor.application.dtos import (
 )
 
 
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_MAX_PENDING_BATCHES = 2
+
+ProgressCallback = Callable[[int], Awaitable[None]]
+
+
 class IngestDocumentation:
     def __init__(
         self,
         loader: DocumentLoaderService,
         embedding_service: EmbeddingService,
         uow: UnitOfWork,
+        chunker: TextChunker,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_pending_batches: int = DEFAULT_MAX_PENDING_BATCHES,
+        on_progress: ProgressCallback | None = None,
     ) -> None:
         self._loader = loader
         self._embedding_service = embedding_service
         self._uow = uow
+        self._chunker = chunker
+        self._batch_size = batch_size
+        self._max_pending_batches = max_pending_batches
+        self._on_progress = on_progress
 
     async def execute(self, input: IngestDocumentationInput) -> IngestResultDTO:
         """Ingest documentation from a source: load, chunk, embed, and store."""
@@ -37,51 +60,172 @@ class IngestDocumentation:
                         chunks_created=0,
                     )
                 # on_duplicate == "replace"
-                await self._uow.chunks.delete_by_document_id(existing.id)
-                await self._uow.documents.delete(existing.id)
+                return await self._replace(existing, input)
 
             loaded = await self._loader.load(input.source)
-
-            text_chunks = split_text_into_chunks(loaded.content)
-
-            if not text_chunks:
+            contents = self._chunker.iter_chunks(loaded.content)
+            first_chunk = next(contents, None)
+            if first_chunk is None:
                 raise InvalidDocumentError(
                     f"No extractable content from source: {input.source}"
                 )
 
-            title = input.title if input.title else loaded.title
-
             document = Document.create(
                 source=input.source,
-                title=title,
+                title=input.title if input.title else loaded.title,
                 source_type=loaded.source_type,
-                chunk_count=len(text_chunks),
             )
+            await self._uow.documents.save(document)
 
-            chunks: list[Chunk] = []
-            for position, text in enumerate(text_chunks):
-                token_count = self._embedding_service.count_tokens(text)
-                content = ChunkContent(text=text, token_count=token_count)
-                chunk = Chunk.create(
-                    document_id=document.id,
-                    content=content,
-                    position=position,
-                )
-                chunks.append(chunk)
+            document.chunk_count = await self._run_pipeline(
+                document.id,
+                chain([first_chunk], contents),
+                commit_batches=input.commit == "batched",
+            )
+            await self._uow.documents.update(document)
+            await self._uow.commit()
 
-            texts = [chunk.content.text for chunk in chunks]
-            embeddings = await self._embedding_service.embed_batch(texts)
+        return IngestResultDTO(
+            document=DocumentDTO.from_entity(document),
+            chunks_created=document.chunk_count,
+        )
 
-            # zip pairs each chunk with its corresponding embedding by index,
-            # iterating both lists in lockstep; strict=True ensures they have equal length.
-            for chunk, embedding in zip(chunks, embeddings, strict=True):
-                chunk.set_embedding(embedding)
+    async def _run_pipeline(
+        self,
+        document_id: str,
+        contents: Iterator[ChunkContent],
+        *,
+        commit_batches: bool,
+    ) -> int:
+        """Stream chunks through chunk → embed → persist stages.
 
-            await self._uow.documents.save(document)
-            await self._uow.chunks.save_all(chunks)
-            await self._uow.commit()
+        Stages are connected by bounded queues of `batch_size` chunks, so at
+        most a few batches are in memory at once whatever the source size.
+        Chunks are flushed as their embeddings arrive; with `commit_batches`
+        each batch is also committed instead of waiting for the final commit.
+        `on_progress` receives the running total after every batch.
+        Returns the number of chunks persisted.
+        """
+        to_embed: asyncio.Queue[list[Chunk] | None] = asyncio.Queue(
+            self._max_pending_batches
+        )
+        to_persist: asyncio.Queue[list[Chunk] | None] = asyncio.Queue(
+            self._max_pending_batches
+        )
+        persisted = 0
+
+        async def produce() -> None:
+            batch: list[Chunk] = []
+            for chunk in self._build_chunks(document_id, enumerate(contents)):
+                batch.append(chunk)
+                if len(batch) == self._batch_size:
+                    await to_embed.put(batch)
+                    batch = []
+            if batch:
+                await to_embed.put(batch)
+            await to_embed.put(None)
+
+        async def embed() -> None:
+            while (batch := await to_embed.get()) is not None:
+                await self._embed(batch)
+                await to_persist.put(batch)
+            await to_persist.put(None)
+
+        async def persist() -> None:
+            nonlocal persisted
+            while (batch := await to_persist.get()) is not None:
+                await self._uow.chunks.save_all(batch)
+                if commit_batches:
+                    await self._uow.commit()
+                persisted += len(batch)
+                await self._report_progress(persisted)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                group.create_task(embed())
+                group.create_task(persist())
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0]
+        return persisted
+
+    async def _replace(
+        self, existing: Document, input: IngestDocumentationInput
+    ) -> IngestResultDTO:
+        """Re-ingest an existing document by applying only the chunk-level diff.
+
+        Chunks whose text is unchanged keep their row and embedding (moving
+        position if needed); only added text is embedded and inserted, and
+        only vanished text is deleted. The document id stays stable.
+        """
+        loaded = await self._loader.load(input.source)
+        contents = self._split(loaded, input.source)
+
+        stored_by_hash: dict[str, list[Chunk]] = defaultdict(list)
+        for chunk in await self._uow.chunks.find_by_document_id(existing.id):
+            stored_by_hash[chunk.content.content_hash].append(chunk)
+
+        moved: dict[str, int] = {}
+        added: list[tuple[int, ChunkContent]] = []
+        for position, content in enumerate(contents):
+            matches = stored_by_hash.get(content.content_hash)
+            if matches:
+                kept = matches.pop(0)
+                if kept.position != position:
+                    moved[kept.id] = position
+            else:
+                added.append((position, content))
+
+        removed = {chunk.id for chunks in stored_by_hash.values() for chunk in chunks}
+
+        new_chunks = list(self._build_chunks(existing.id, added))
+        await self._embed(new_chunks)
+
+        existing.title = input.title if input.title else loaded.title
+        existing.source_type = loaded.source_type
+        existing.chunk_count = len(contents)
+        existing.touch()
+
+        await self._uow.chunks.delete_by_ids(removed)
+        await self._uow.chunks.update_positions(moved)
+        await self._uow.chunks.save_all(new_chunks)
+        await self._uow.documents.update(existing)
+        await self._uow.commit()
+        await self._report_progress(len(contents))
 
         return IngestResultDTO(
-            document=DocumentDTO.from_entity(document),
-            chunks_created=len(chunks),
+            document=DocumentDTO.from_entity(existing),
+            chunks_created=len(new_chunks),
+            chunks_deleted=len(removed),
+            chunks_unchanged=len(contents) - len(new_chunks),
         )
+
+    async def _report_progress(self, chunks_processed: int) -> None:
+        if self._on_progress is not None:
+            await self._on_progress(chunks_processed)
+
+    def _split(self, loaded: LoadedDocument, source: str) -> list[ChunkContent]:
+        contents = self._chunker.split(loaded.content)
+        if not contents:
+            raise InvalidDocumentError(f"No extractable content from source: {source}")
+        return contents
+
+    @staticmethod
+    def _build_chunks(
+        document_id: str, contents: Iterable[tuple[int, ChunkContent]]
+    ) -> Iterator[Chunk]:
+        for position, content in contents:
+            yield Chunk.create(
+                document_id=document_id, content=content, position=position
+            )
+
+    async def _embed(self, chunks: list[Chunk]) -> None:
+        if not chunks:
+            return
+        texts = [chunk.content.text for chunk in chunks]
+        embeddings = await self._embedding_service.embed_batch(texts)
+
+        # zip pairs each chunk with its corresponding embedding by index,
+        # iterating both lists in lockstep; strict=True ensures they have equal length.
+        for chunk, embedding in zip(chunks, embeddings, strict=True):
+            chunk.set_embedding(embedding)
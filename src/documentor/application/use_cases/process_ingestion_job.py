@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import timedelta
+
+from documentor.application.dtos import IngestDocumentationInput, JobDTO
+from documentor.application.use_cases.ingest_documentation import (
+    IngestDocumentation,
+    ProgressCallback,
+)
+from documentor.domain.exceptions import DocumentorDomainError
+from documentor.domain.models.ingestion_job import IngestionJob
+from documentor.domain.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE = timedelta(minutes=5)
+DEFAULT_MAX_ATTEMPTS = 3
+
+IngestFactory = Callable[[IngestionJob, ProgressCallback], IngestDocumentation]
+
+
+class ProcessIngestionJob:
+    """Claim the next queued ingestion job and run it to completion.
+
+    A claimed job is leased for `lease`, renewed every third of it while
+    the ingestion runs, so a job whose worker died is picked up again once
+    the lease expires. A worker whose lease expired anyway (a stalled loop)
+    stops writing to the job. Jobs claimed more than `max_attempts` times
+    are failed instead of retried.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        ingest_factory: IngestFactory,
+        lease: timedelta = DEFAULT_LEASE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        self._uow = uow
+        self._ingest_factory = ingest_factory
+        self._lease = lease
+        self._max_attempts = max_attempts
+
+    async def execute(self) -> JobDTO | None:
+        """Process one job; returns None when the queue is empty."""
+        async with self._uow:
+            job = await self._uow.jobs.claim_next(self._lease)
+            await self._uow.commit()
+        if job is None:
+            return None
+
+        if job.attempts > self._max_attempts:
+            job.fail(f"Abandoned after {self._max_attempts} attempts")
+        else:
+            await self._run(job)
+
+        async with self._uow:
+            await self._uow.jobs.update(job)
+            await self._uow.commit()
+        return JobDTO.from_entity(job)
+
+    async def _run(self, job: IngestionJob) -> None:
+        # Progress reports and lease renewals share the unit of work.
+        uow_lock = asyncio.Lock()
+
+        async def on_progress(chunks_processed: int) -> None:
+            async with uow_lock, self._uow:
+                await self._uow.jobs.record_progress(
+                    job, chunks_processed, self._lease
+                )
+                await self._uow.commit()
+
+        async def keep_leased() -> None:
+            while True:
+                await asyncio.sleep(self._lease.total_seconds() / 3)
+                try:
+                    async with uow_lock, self._uow:
+                        renewed = await self._uow.jobs.renew_lease(job, self._lease)
+                        await self._uow.commit()
+                except Exception:
+                    logger.exception("Failed to renew lease of job %s", job.id)
+                    continue
+                if not renewed:
+                    logger.warning("Job %s was claimed by another worker", job.id)
+                    return
+
+        use_case = self._ingest_factory(job, on_progress)
+        heartbeat = asyncio.create_task(keep_leased())
+        try:
+            result = await use_case.execute(
+                IngestDocumentationInput(
+                    source=job.source,
+                    title=job.title,
+                    on_duplicate=job.on_duplicate,
+                    commit=job.commit,
+                )
+            )
+        except DocumentorDomainError as e:
+            job.fail(str(e))
+        except Exception:
+            logger.exception("Ingestion job %s failed unexpectedly", job.id)
+            job.fail("Unexpected error during ingestion")
+        else:
+            job.succeed(result.document.id, result.document.chunk_count)
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
@@ -8,10 +8,20 @@ class DocumentNotFoundError(DocumentorDomainError):
         super().__init__(f"Document not found: {document_id}")
 
 
+class JobNotFoundError(DocumentorDomainError):
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        super().__init__(f"Ingestion job not found: {job_id}")
+
+
 class InvalidDocumentError(DocumentorDomainError):
     pass
 
 
+class InvalidJobError(DocumentorDomainError):
+    pass
+
+
 class InvalidChunkError(DocumentorDomainError):
     pass
 
@@ -1,23 +1,134 @@
+import hashlib
+import math
+from array import array
+from collections.abc import Buffer, Sequence
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Literal
+
+import numpy as np
 from uuid_utils import uuid7
 
 from documentor.domain.exceptions import InvalidChunkError, InvalidEmbeddingError
+from documentor.domain.models.document import SourceType
 
+_FLOAT32_SIZE = 4
 
-@dataclass(frozen=True)
+IterativeScan = Literal["off", "relaxed_order", "strict_order"]
+FirstPass = Literal["exact", "halfvec", "bit", "short"]
+
+
+@dataclass(frozen=True, eq=False)
 class Embedding:
-    vector: tuple[float, ...]
+    """Embedding vector backed by one contiguous float32 buffer.
+
+    `vector` is a read-only float32 memoryview: 4 bytes per dimension instead
+    of a boxed Python float, and buffers from API responses or the database
+    can be wrapped without copying.
+    """
+
+    vector: memoryview
     dimension: int
 
     def __post_init__(self) -> None:
+        vector = self.vector
+        if not isinstance(vector, memoryview) or vector.format != "f":
+            vector = memoryview(array("f", vector))
+        object.__setattr__(self, "vector", vector.toreadonly())
         if len(self.vector) != self.dimension:
             raise InvalidEmbeddingError(
                 f"Vector length {len(self.vector)} does not match dimension {self.dimension}"
             )
 
     @classmethod
-    def from_list(cls, values: list[float]) -> "Embedding":
-        return cls(vector=tuple(values), dimension=len(values))
+    def from_list(cls, values: Sequence[float]) -> "Embedding":
+        return cls(vector=memoryview(array("f", values)), dimension=len(values))
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer) -> "Embedding":
+        """Wrap a native-endian float32 buffer (bytes, array, ndarray) without copying."""
+        view = memoryview(buffer).cast("B")
+        if len(view) % _FLOAT32_SIZE:
+            raise InvalidEmbeddingError(
+                f"Buffer of {len(view)} bytes is not a whole number of float32 values"
+            )
+        vector = view.cast("f")
+        return cls(vector=vector, dimension=len(vector))
+
+    def to_list(self) -> list[float]:
+        return self.vector.tolist()
+
+    def as_array(self) -> np.ndarray:
+        """Read-only float32 ndarray view of `vector`, without copying."""
+        return np.frombuffer(self.vector, dtype=np.float32)
+
+    def dot(self, other: "Embedding") -> float:
+        if other.dimension != self.dimension:
+            raise InvalidEmbeddingError(
+                f"Cannot compare dimension {self.dimension} with {other.dimension}"
+            )
+        return math.sumprod(self.vector, other.vector)
+
+    def norm(self) -> float:
+        return self._norm
+
+    @cached_property
+    def _norm(self) -> float:
+        # The vector is read-only, so the norm is computed once per embedding.
+        return math.sqrt(self.dot(self))
+
+    def truncate(self, dimension: int) -> "Embedding":
+        """Keep the first `dimension` values, re-normalized to unit length.
+
+        Matryoshka-trained models such as text-embedding-3 front-load the
+        signal, so the prefix is a usable lower-dimensional embedding.
+        """
+        if not 0 < dimension <= self.dimension:
+            raise InvalidEmbeddingError(
+                f"Cannot truncate dimension {self.dimension} to {dimension}"
+            )
+        prefix = self.vector[:dimension]
+        norm = math.sqrt(math.sumprod(prefix, prefix))
+        return Embedding.from_list([value / norm if norm else 0.0 for value in prefix])
+
+    def cosine_similarity(self, other: "Embedding") -> float:
+        denominator = self.norm() * other.norm()
+        return self.dot(other) / denominator if denominator else 0.0
+
+    def cosine_similarities(self, others: Sequence["Embedding"]) -> list[float]:
+        """Cosine similarity against each of `others`, as one matrix-vector product."""
+        if not others:
+            return []
+        own_norm = self.norm()
+        if not own_norm:
+            return [0.0] * len(others)
+        query = self.as_array() / own_norm
+        return (unit_rows(others, self.dimension) @ query).tolist()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Embedding):
+            return NotImplemented
+        return self.dimension == other.dimension and self.vector == other.vector
+
+    def __hash__(self) -> int:
+        return hash(self.vector.tobytes())
+
+
+def unit_rows(embeddings: Sequence[Embedding], dimension: int) -> np.ndarray:
+    """Stack `embeddings` into a float32 matrix of unit-length rows.
+
+    Zero vectors stay zero rows, so their similarity to anything is 0.
+    """
+    for embedding in embeddings:
+        if embedding.dimension != dimension:
+            raise InvalidEmbeddingError(
+                f"Cannot compare dimension {dimension} with {embedding.dimension}"
+            )
+    matrix = np.empty((len(embeddings), dimension), dtype=np.float32)
+    for row, embedding in zip(matrix, embeddings, strict=True):
+        row[:] = embedding.as_array()
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
 
 
 @dataclass(frozen=True)
@@ -31,6 +142,10 @@ class ChunkContent:
         if self.token_count <= 0:
             raise InvalidChunkError("Token count must be greater than 0")
 
+    @property
+    def content_hash(self) -> str:
+        return compute_content_hash(self.text)
+
 
 @dataclass
 class Chunk:
@@ -61,20 +176,66 @@ class Chunk:
         return self.embedding is not None
 
 
-def split_text_into_chunks(
-    text: str, chunk_size: int = 500, overlap: int = 50
-) -> list[str]:
-    """Split text into overlapping chunks by word boundaries."""
-    words = text.split()
-    if not words:
-        return []
+@dataclass(frozen=True)
+class RetrievedChunk:
+    """A search hit: the chunk, its score and document title.
+
+    The chunk carries no embedding unless the search was asked for one.
+    """
+
+    chunk: Chunk
+    score: float
+    document_title: str
+
+
+@dataclass(frozen=True)
+class SearchProfile:
+    """Recall/latency trade-off of one nearest-neighbour search.
+
+    `ef_search` is the size of the HNSW candidate list (None keeps the server
+    default). `min_score` drops hits below that cosine similarity inside the
+    query; with an `iterative_scan` other than "off" the index then keeps
+    scanning, up to `max_scan_tuples` rows, until `top_k` hits pass it.
+
+    `first_pass` picks the index candidates come from: "halfvec" (float16),
+    "bit" (binary), "short" (truncated Matryoshka prefix), or "exact" for a
+    full scan, the baseline when measuring recall. The `rerank_candidates`
+    best candidates (at least `top_k`) are then re-ranked on the
+    full-precision vectors.
+    """
+
+    ef_search: int | None = None
+    iterative_scan: IterativeScan = "off"
+    max_scan_tuples: int | None = None
+    min_score: float | None = None
+    first_pass: FirstPass = "halfvec"
+    rerank_candidates: int = 40
+
+    def __post_init__(self) -> None:
+        if self.ef_search is not None and not 1 <= self.ef_search <= 1000:
+            raise ValueError("ef_search must be between 1 and 1000")
+        if self.max_scan_tuples is not None and self.max_scan_tuples < 1:
+            raise ValueError("max_scan_tuples must be positive")
+        if self.rerank_candidates < 1:
+            raise ValueError("rerank_candidates must be positive")
+
+
+@dataclass(frozen=True)
+class SearchFilter:
+    """Restricts a search to the chunks of matching documents.
+
+    Criteria are combined with AND; values within one criterion with OR.
+    Empty criteria match every document.
+    """
+
+    document_ids: frozenset[str] = frozenset()
+    source_types: frozenset[SourceType] = frozenset()
+    source_prefix: str | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.document_ids or self.source_types or self.source_prefix)
 
-    chunks: list[str] = []
-    start = 0
-    while start < len(words):
-        end = start + chunk_size
-        chunk_text = " ".join(words[start:end])
-        chunks.append(chunk_text)
-        start += chunk_size - overlap
 
-    return chunks
+def compute_content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -20,6 +20,7 @@ class Document:
     source_type: SourceType
     created_at: datetime
     chunk_count: int = 0
+    updated_at: datetime | None = None
 
     def __post_init__(self) -> None:
         if not self.source or not self.source.strip():
@@ -28,6 +29,17 @@ class Document:
             raise InvalidDocumentError("Document title cannot be empty")
         if self.created_at.tzinfo is None:
             raise InvalidDocumentError("created_at must be timezone-aware")
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+        elif self.updated_at.tzinfo is None:
+            raise InvalidDocumentError("updated_at must be timezone-aware")
+
+    def touch(self) -> None:
+        """Record that the document's content was re-ingested."""
+        self.updated_at = datetime.now(UTC)
+
+    def updated_since(self, moment: datetime) -> bool:
+        return (self.updated_at or self.created_at) > moment
 
     @classmethod
     def create(
@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Literal
+
+from uuid_utils import uuid7
+
+from documentor.domain.exceptions import InvalidJobError
+
+
+class JobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class IngestionJob:
+    """A queued request to ingest one source, processed by a background worker.
+
+    File uploads carry their bytes in `payload` together with `filename`;
+    the payload is dropped once the job has finished.
+    """
+
+    id: str
+    source: str
+    status: JobStatus
+    created_at: datetime
+    updated_at: datetime
+    title: str | None = None
+    on_duplicate: Literal["reject", "skip", "replace"] = "reject"
+    commit: Literal["atomic", "batched"] = "atomic"
+    filename: str | None = None
+    payload: bytes | None = None
+    attempts: int = 0
+    chunks_processed: int = 0
+    document_id: str | None = None
+    error: str | None = None
+
+    def __post_init__(self) -> None:
+        if not self.source or not self.source.strip():
+            raise InvalidJobError("Job source cannot be empty")
+        if self.payload is not None and not self.filename:
+            raise InvalidJobError("File jobs need a filename")
+
+    @classmethod
+    def create(
+        cls,
+        source: str,
+        title: str | None = None,
+        on_duplicate: Literal["reject", "skip", "replace"] = "reject",
+        commit: Literal["atomic", "batched"] = "atomic",
+        filename: str | None = None,
+        payload: bytes | None = None,
+    ) -> "IngestionJob":
+        now = datetime.now(UTC)
+        return cls(
+            id=str(uuid7()),
+            source=source,
+            status=JobStatus.QUEUED,
+            created_at=now,
+            updated_at=now,
+            title=title,
+            on_duplicate=on_duplicate,
+            commit=commit,
+            filename=filename,
+            payload=payload,
+        )
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def succeed(self, document_id: str, chunks_processed: int) -> None:
+        self.status = JobStatus.SUCCEEDED
+        self.document_id = document_id
+        self.chunks_processed = chunks_processed
+        self.error = None
+        self.updated_at = datetime.now(UTC)
+
+    def fail(self, error: str) -> None:
+        self.status = JobStatus.FAILED
+        self.error = error
+        self.updated_at = datetime.now(UTC)
@@ -1,6 +1,13 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
-from documentor.domain.models.chunk import Chunk, Embedding
+from documentor.domain.models.chunk import (
+    Chunk,
+    Embedding,
+    RetrievedChunk,
+    SearchFilter,
+    SearchProfile,
+)
 
 
 class ChunkRepository(ABC):
@@ -9,8 +16,65 @@ class ChunkRepository(ABC):
 
     @abstractmethod
     async def search_similar(
-        self, embedding: Embedding, top_k: int = 5
+        self,
+        embedding: Embedding,
+        top_k: int = 5,
+        profile: SearchProfile | None = None,
+        search_filter: SearchFilter | None = None,
     ) -> list[tuple[Chunk, float]]: ...
 
+    @abstractmethod
+    async def retrieve(
+        self,
+        embedding: Embedding,
+        top_k: int = 5,
+        profile: SearchProfile | None = None,
+        search_filter: SearchFilter | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        """Return the `top_k` closest chunks with document titles.
+
+        Vectors are only loaded with `with_embeddings`.
+        """
+
+    @abstractmethod
+    async def retrieve_batch(
+        self,
+        embeddings: Sequence[Embedding],
+        top_k: int = 5,
+        profile: SearchProfile | None = None,
+        search_filter: SearchFilter | None = None,
+        with_embeddings: bool = False,
+    ) -> list[list[RetrievedChunk]]:
+        """Like `retrieve` for each of `embeddings`, in as few round trips as possible.
+
+        Results are in the order of `embeddings`.
+        """
+
+    @abstractmethod
+    async def search_fulltext(
+        self,
+        query: str,
+        top_k: int = 5,
+        search_filter: SearchFilter | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        """Return the `top_k` chunks best matching any word of `query` lexically.
+
+        Scores are full-text ranks scaled into [0, 1), not comparable with
+        cosine similarities; `with_embeddings` loads the chunks' embeddings
+        so callers can score them against a query embedding instead.
+        """
+
+    @abstractmethod
+    async def find_by_document_id(self, document_id: str) -> list[Chunk]:
+        """Return a document's chunks ordered by position, without embeddings."""
+
+    @abstractmethod
+    async def update_positions(self, positions: dict[str, int]) -> None: ...
+
+    @abstractmethod
+    async def delete_by_ids(self, chunk_ids: set[str]) -> None: ...
+
     @abstractmethod
     async def delete_by_document_id(self, document_id: str) -> None: ...
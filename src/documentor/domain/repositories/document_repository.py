@@ -7,6 +7,9 @@ class DocumentRepository(ABC):
     @abstractmethod
     async def save(self, document: Document) -> Document: ...
 
+    @abstractmethod
+    async def update(self, document: Document) -> Document: ...
+
     @abstractmethod
     async def find_by_id(self, document_id: str) -> Document | None: ...
 
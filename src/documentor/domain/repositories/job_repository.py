@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+from documentor.domain.models.ingestion_job import IngestionJob
+
+
+class JobRepository(ABC):
+    @abstractmethod
+    async def save(self, job: IngestionJob) -> IngestionJob: ...
+
+    @abstractmethod
+    async def update(self, job: IngestionJob) -> IngestionJob:
+        """Store the job's state unless another worker has claimed it since.
+
+        A job is claimed by the worker whose claim set its current
+        `attempts`; writes from a worker holding an older claim are ignored.
+        """
+
+    @abstractmethod
+    async def find_by_id(self, job_id: str) -> IngestionJob | None: ...
+
+    @abstractmethod
+    async def claim_next(self, lease: timedelta) -> IngestionJob | None:
+        """Lock the oldest runnable job, mark it running and lease it for `lease`.
+
+        Runnable jobs are queued ones and running ones whose lease expired
+        (their worker died). Concurrent callers never claim the same job.
+        """
+
+    @abstractmethod
+    async def record_progress(
+        self, job: IngestionJob, chunks_processed: int, lease: timedelta
+    ) -> bool:
+        """Store progress and extend the job's lease by `lease` from now.
+
+        Returns False, writing nothing, when another worker has claimed the
+        job since `job` was claimed.
+        """
+
+    @abstractmethod
+    async def renew_lease(self, job: IngestionJob, lease: timedelta) -> bool:
+        """Extend the job's lease by `lease` from now.
+
+        Returns False, writing nothing, when another worker has claimed the
+        job since `job` was claimed.
+        """
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+
+from documentor.domain.models.answer import Answer
+from documentor.domain.models.chunk import Embedding
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    answer: Answer
+    document_ids: frozenset[str]
+    cached_at: datetime
+
+
+class AnswerCache(ABC):
+    @abstractmethod
+    async def find_similar(self, embedding: Embedding) -> CachedAnswer | None:
+        """Return the closest cached answer within the cache's distance threshold."""
+
+    @abstractmethod
+    async def store(
+        self,
+        embedding: Embedding,
+        answer: Answer,
+        document_ids: frozenset[str],
+        cached_at: datetime,
+    ) -> None:
+        """Cache `answer`, valid for documents not updated after `cached_at`."""
+
+    @abstractmethod
+    async def invalidate_documents(self, document_ids: set[str]) -> None:
+        """Drop every cached answer built from any of `document_ids`."""
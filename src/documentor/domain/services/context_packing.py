@@ -0,0 +1,93 @@
+from collections.abc import Sequence
+
+from documentor.domain.models.chunk import Chunk, ChunkContent, RetrievedChunk
+
+# Shorter suffix/prefix matches are treated as coincidence, not overlap.
+MIN_OVERLAP_CHARS = 16
+
+_RUN_SEPARATOR = "\n\n"
+
+
+def fit_token_budget(
+    results: Sequence[RetrievedChunk], max_tokens: int
+) -> list[RetrievedChunk]:
+    """Keep hits, in relevance order, while their `token_count` fits `max_tokens`.
+
+    A hit that does not fit is skipped and smaller ones after it may still
+    be kept. The most relevant hit is always kept.
+    """
+    kept: list[RetrievedChunk] = []
+    used = 0
+    for result in results:
+        tokens = result.chunk.content.token_count
+        if kept and used + tokens > max_tokens:
+            continue
+        kept.append(result)
+        used += tokens
+    return kept
+
+
+def merge_adjacent(results: Sequence[RetrievedChunk]) -> list[Chunk]:
+    """Merge hits into the passages sent to the LLM.
+
+    Chunks of one document with consecutive positions become one passage,
+    with the text that overlapping windows repeat removed. A passage keeps
+    the id and position of its first chunk, and passages are ordered by the
+    relevance of their best chunk.
+    """
+    rank = {result.chunk.id: i for i, result in enumerate(results)}
+    ordered = sorted(
+        (result.chunk for result in results),
+        key=lambda chunk: (chunk.document_id, chunk.position),
+    )
+    runs: list[list[Chunk]] = []
+    for chunk in ordered:
+        previous = runs[-1][-1] if runs else None
+        if (
+            previous is not None
+            and previous.document_id == chunk.document_id
+            and previous.position + 1 == chunk.position
+        ):
+            runs[-1].append(chunk)
+        else:
+            runs.append([chunk])
+    runs.sort(key=lambda run: min(rank[chunk.id] for chunk in run))
+    return [_merge(run) for run in runs]
+
+
+def _merge(run: list[Chunk]) -> Chunk:
+    if len(run) == 1:
+        return run[0]
+    text = run[0].content.text
+    token_count = run[0].content.token_count
+    for chunk in run[1:]:
+        following = chunk.content
+        overlap = _overlap(text, following.text)
+        if overlap:
+            text += following.text[overlap:]
+            # Token counts are per chunk; drop the overlap's share of the next one.
+            share = overlap / len(following.text)
+            token_count += max(1, round(following.token_count * (1 - share)))
+        else:
+            text += _RUN_SEPARATOR + following.text
+            token_count += following.token_count
+    first = run[0]
+    return Chunk(
+        id=first.id,
+        document_id=first.document_id,
+        content=ChunkContent(text=text, token_count=token_count),
+        position=first.position,
+    )
+
+
+def _overlap(text: str, following: str) -> int:
+    """Length of the longest suffix of `text` that starts `following`."""
+    if len(following) < MIN_OVERLAP_CHARS:
+        return 0
+    probe = following[:MIN_OVERLAP_CHARS]
+    start = text.find(probe, max(0, len(text) - len(following)))
+    while start != -1:
+        if following.startswith(text[start:]):
+            return len(text) - start
+        start = text.find(probe, start + 1)
+    return 0
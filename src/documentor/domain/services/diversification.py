@@ -0,0 +1,64 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from documentor.domain.models.chunk import RetrievedChunk, unit_rows
+
+MMR_LAMBDA = 0.7
+
+
+def maximal_marginal_relevance(
+    candidates: Sequence[RetrievedChunk],
+    *,
+    top_k: int,
+    lambda_: float = MMR_LAMBDA,
+) -> list[RetrievedChunk]:
+    """Pick `top_k` candidates trading relevance against redundancy.
+
+    Each step selects the candidate maximizing
+    ``lambda_ * score - (1 - lambda_) * max similarity to those selected``,
+    where `score` is its cosine similarity to the query and similarities
+    between candidates come from their embeddings. ``lambda_=1`` keeps the
+    ranking as is; lower values favour chunks that repeat less of what is
+    already selected, such as the overlapping neighbours of a chunk.
+    Candidates without an embedding are never counted as redundant.
+
+    Candidate similarities come from one matrix product over their
+    normalized embeddings. A running maximum of each candidate's similarity
+    to the selected ones is updated per pick, so every pick is an argmax.
+    """
+    if not 0.0 <= lambda_ <= 1.0:
+        raise ValueError("lambda_ must be between 0 and 1")
+    results = list(candidates)
+    count = min(top_k, len(results))
+    if count <= 0:
+        return []
+    scores = np.array([result.score for result in results])
+    similarity = _similarity_matrix(results)
+    redundancy = np.zeros(len(results))
+    available = np.ones(len(results), dtype=bool)
+    selected: list[RetrievedChunk] = []
+    for _ in range(count):
+        gain = lambda_ * scores - (1 - lambda_) * redundancy
+        best = int(np.argmax(np.where(available, gain, -np.inf)))
+        available[best] = False
+        selected.append(results[best])
+        np.maximum(redundancy, similarity[best], out=redundancy)
+    return selected
+
+
+def _similarity_matrix(results: list[RetrievedChunk]) -> np.ndarray:
+    """Pairwise cosine similarities; 0 for candidates without an embedding."""
+    embedded = [
+        (i, result.chunk.embedding)
+        for i, result in enumerate(results)
+        if result.chunk.embedding is not None
+    ]
+    if not embedded:
+        return np.zeros((len(results), len(results)))
+    dimension = embedded[0][1].dimension
+    vectors = np.zeros((len(results), dimension), dtype=np.float32)
+    vectors[[i for i, _ in embedded]] = unit_rows(
+        [embedding for _, embedding in embedded], dimension
+    )
+    return vectors @ vectors.T
@@ -0,0 +1,38 @@
+import re
+
+MAX_SUB_QUERIES = 3
+# Parts shorter than this are objects of one question ("lists and tuples"),
+# not questions of their own.
+MIN_SUB_QUERY_WORDS = 3
+
+_QUESTION_BOUNDARY = re.compile(r"(?<=[?;])\s+|\n+")
+_CONJUNCTION = re.compile(
+    r",?\s+(?:and also|and then|as well as|and|also)\s+(?=\w)", re.IGNORECASE
+)
+_WORD = re.compile(r"\w+")
+
+
+def decompose_query(text: str, max_queries: int = MAX_SUB_QUERIES) -> list[str]:
+    """Split a compound question into up to `max_queries` sub-queries.
+
+    The text is cut at question boundaries (``?``, ``;``, new lines), then
+    each question at coordinating conjunctions when both sides are questions
+    of their own, with at least `MIN_SUB_QUERY_WORDS` words. Returns an empty
+    list when the text is a single question.
+    """
+    parts: list[str] = []
+    for question in _QUESTION_BOUNDARY.split(text):
+        parts.extend(_split_conjunctions(question))
+    sub_queries = list(dict.fromkeys(part for part in parts if part))
+    if len(sub_queries) < 2:
+        return []
+    return sub_queries[:max_queries]
+
+
+def _split_conjunctions(question: str) -> list[str]:
+    pieces = [piece.strip(" ,") for piece in _CONJUNCTION.split(question.strip())]
+    if len(pieces) > 1 and all(
+        len(_WORD.findall(piece)) >= MIN_SUB_QUERY_WORDS for piece in pieces
+    ):
+        return pieces
+    return [question.strip()]
@@ -0,0 +1,28 @@
+from collections.abc import Sequence
+
+from documentor.domain.models.chunk import RetrievedChunk
+
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[RetrievedChunk]],
+    *,
+    k: int = RRF_K,
+    top_k: int | None = None,
+) -> list[RetrievedChunk]:
+    """Fuse rankings by summing ``1 / (k + rank)`` for each chunk.
+
+    Only ranks matter, so rankings with incomparable scores (cosine
+    similarity, full-text rank) can be combined. A chunk found by several
+    rankings keeps the entry, and score, of the first one listing it.
+    """
+    fused: dict[str, float] = {}
+    entries: dict[str, RetrievedChunk] = {}
+    for ranking in rankings:
+        for rank, result in enumerate(ranking, 1):
+            chunk_id = result.chunk.id
+            fused[chunk_id] = fused.get(chunk_id, 0.0) + 1.0 / (k + rank)
+            entries.setdefault(chunk_id, result)
+    ordered = sorted(entries.values(), key=lambda r: fused[r.chunk.id], reverse=True)
+    return ordered if top_k is None else ordered[:top_k]
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from documentor.domain.services.document_loader_service import LoadedDocument
+
+
+@dataclass(frozen=True)
+class CrawledPage:
+    url: str
+    document: LoadedDocument | None = None
+    error: str | None = None
+
+
+class SiteCrawler(ABC):
+    @abstractmethod
+    def crawl(self, start_url: str, *, max_pages: int) -> AsyncIterator[CrawledPage]:
+        """Yield pages of a sitemap or of the site under a seed URL as they are fetched.
+
+        Pages that fail to load are yielded with `error` set instead of
+        aborting the crawl.
+        """
@@ -0,0 +1,193 @@
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from documentor.domain.models.chunk import ChunkContent
+from documentor.domain.services.tokenizer import Tokenizer
+
+DEFAULT_MAX_TOKENS = 512
+DEFAULT_OVERLAP_TOKENS = 64
+
+_BLOCK_SEPARATOR = "\n\n"
+_MARKDOWN_HEADING = re.compile(r"^#{1,6}\s")
+_HTML_HEADING = re.compile(r"^\s*<h[1-6][\s>]", re.IGNORECASE)
+_UNDERLINE = re.compile(r"^([=\-~^\"'`#*+])\1{2,}\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+
+
+@dataclass(frozen=True)
+class _Block:
+    text: str
+    is_heading: bool = False
+
+
+@dataclass(frozen=True)
+class _EncodedBlock:
+    tokens: list[int]
+    is_heading: bool
+
+
+class TextChunker:
+    """Split documents into token-bounded chunks aligned on their structure.
+
+    The text is cut into blocks — headings (Markdown ATX/setext, RST, HTML
+    ``<h1>``–``<h6>``), fenced code blocks and paragraphs — and each block is
+    tokenized exactly once. Blocks are packed greedily up to ``max_tokens``;
+    a heading starts a new chunk once the current one holds at least
+    ``min_section_tokens``, and is never left dangling at the end of a chunk.
+    Only blocks larger than ``max_tokens`` are cut mid-block, with
+    ``overlap_tokens`` of overlap. Every chunk carries its exact token count.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Tokenizer,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+        min_section_tokens: int | None = None,
+    ) -> None:
+        if not 0 <= overlap_tokens < max_tokens:
+            raise ValueError("overlap_tokens must be in [0, max_tokens)")
+        self._tokenizer = tokenizer
+        self._max_tokens = max_tokens
+        self._overlap_tokens = overlap_tokens
+        self._min_section_tokens = (
+            max_tokens // 4 if min_section_tokens is None else min_section_tokens
+        )
+        self._separator = tokenizer.encode(_BLOCK_SEPARATOR)
+
+    def split(self, text: str) -> list[ChunkContent]:
+        return list(self.iter_chunks(text))
+
+    def iter_chunks(self, text: str) -> Iterator[ChunkContent]:
+        """Lazily yield the chunks of `text`, in document order."""
+        current: list[_EncodedBlock] = []
+        size = 0
+        for block in _iter_blocks(text):
+            tokens = self._tokenizer.encode(block.text)
+            encoded = _EncodedBlock(tokens, block.is_heading)
+            if len(encoded.tokens) > self._max_tokens:
+                yield from self._pack(current)
+                current, size = [], 0
+                yield from self._windows(encoded.tokens)
+                continue
+
+            added = len(encoded.tokens) + (len(self._separator) if current else 0)
+            starts_section = encoded.is_heading and size >= self._min_section_tokens
+            if current and (size + added > self._max_tokens or starts_section):
+                carried = self._carry_trailing_headings(current)
+                yield from self._pack(current)
+                current = carried
+                size = self._size(current)
+                added = len(encoded.tokens) + (len(self._separator) if current else 0)
+                if current and size + added > self._max_tokens:
+                    yield from self._pack(current)
+                    current, size, added = [], 0, len(encoded.tokens)
+            current.append(encoded)
+            size += added
+
+        yield from self._pack(current)
+
+    def _carry_trailing_headings(
+        self, current: list[_EncodedBlock]
+    ) -> list[_EncodedBlock]:
+        """Detach headings at the end of `current` so they open the next chunk."""
+        carried: list[_EncodedBlock] = []
+        while len(current) > 1 and current[-1].is_heading:
+            carried.insert(0, current.pop())
+        return carried
+
+    def _size(self, blocks: list[_EncodedBlock]) -> int:
+        if not blocks:
+            return 0
+        separators = len(self._separator) * (len(blocks) - 1)
+        return sum(len(block.tokens) for block in blocks) + separators
+
+    def _pack(self, blocks: list[_EncodedBlock]) -> Iterator[ChunkContent]:
+        if not blocks:
+            return
+        tokens: list[int] = []
+        for block in blocks:
+            if tokens:
+                tokens.extend(self._separator)
+            tokens.extend(block.tokens)
+        yield from self._to_content(tokens)
+
+    def _windows(self, tokens: list[int]) -> Iterator[ChunkContent]:
+        """Cut `tokens` into overlapping windows of at most `max_tokens`.
+
+        Window ends are moved back, and starts back or forward, onto
+        character boundaries, so a multi-byte character split across
+        tokens is never cut in two.
+        """
+        start = 0
+        while True:
+            end = start + self._max_tokens
+            if end < len(tokens):
+                end = self._boundary(tokens, end, start + 1, end)
+            yield from self._to_content(tokens[start:end])
+            if end >= len(tokens):
+                break
+            overlap_start = max(end - self._overlap_tokens, start + 1)
+            start = self._boundary(tokens, overlap_start, start + 1, end)
+
+    def _boundary(self, tokens: list[int], index: int, low: int, high: int) -> int:
+        """Character boundary nearest `index` in `[low, high]`, searching back first.
+
+        Falls back to `index` when there is none, as in a run of invalid bytes.
+        """
+        starts = self._tokenizer.starts_character
+        for cut in range(index, low - 1, -1):
+            if starts(tokens[cut]):
+                return cut
+        for cut in range(index + 1, high + 1):
+            if cut == len(tokens) or starts(tokens[cut]):
+                return cut
+        return index
+
+    def _to_content(self, tokens: list[int]) -> Iterable[ChunkContent]:
+        text = self._tokenizer.decode(tokens)
+        if text.strip():
+            yield ChunkContent(text=text, token_count=len(tokens))
+
+
+def _iter_blocks(text: str) -> Iterator[_Block]:
+    """Cut `text` into headings, fenced code blocks and paragraphs."""
+    lines: list[str] = []
+    fence: str | None = None
+
+    def flush() -> Iterator[_Block]:
+        block = "\n".join(lines).strip()
+        lines.clear()
+        if block:
+            yield _Block(block)
+
+    for line in text.splitlines():
+        if fence is not None:
+            lines.append(line)
+            if line.strip().startswith(fence):
+                fence = None
+                yield from flush()
+            continue
+
+        if match := _FENCE.match(line):
+            yield from flush()
+            fence = match.group(1)
+            lines.append(line)
+        elif not line.strip():
+            yield from flush()
+        elif _MARKDOWN_HEADING.match(line) or _HTML_HEADING.match(line):
+            yield from flush()
+            yield _Block(line.strip(), is_heading=True)
+        elif _UNDERLINE.match(line) and lines and not _UNDERLINE.match(lines[-1]):
+            # Setext/RST heading: the previous line is the title, optionally
+            # preceded by an RST overline.
+            heading = [lines.pop(), line]
+            if len(lines) == 1 and _UNDERLINE.match(lines[0]):
+                heading.insert(0, lines.pop())
+            yield from flush()
+            yield _Block("\n".join(heading).strip(), is_heading=True)
+        else:
+            lines.append(line)
+
+    yield from flush()
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+
+class Tokenizer(ABC):
+    @abstractmethod
+    def encode(self, text: str) -> list[int]: ...
+
+    @abstractmethod
+    def decode(self, tokens: Sequence[int]) -> str: ...
+
+    def starts_character(self, token: int) -> bool:
+        """Whether `token` begins on a character boundary.
+
+        Byte-level tokenizers can split a multi-byte character across
+        tokens; cutting a token list before a token that continues one
+        would decode to replacement characters on both sides.
+        """
+        return True
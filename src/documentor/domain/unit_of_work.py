@@ -4,11 +4,13 @@ from typing import Self
 
 from documentor.domain.repositories.chunk_repository import ChunkRepository
 from documentor.domain.repositories.document_repository import DocumentRepository
+from documentor.domain.repositories.job_repository import JobRepository
 
 
 class UnitOfWork(ABC):
     documents: DocumentRepository
     chunks: ChunkRepository
+    jobs: JobRepository
 
     @abstractmethod
     async def commit(self) -> None: ...
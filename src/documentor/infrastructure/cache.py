@@ -0,0 +1,63 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def record(self, *, hits: int = 0, misses: int = 0) -> None:
+        self.hits += hits
+        self.misses += misses
+
+
+class LruTtlCache[V]:
+    """In-process mapping with LRU eviction beyond ``max_entries`` and a TTL.
+
+    ``in_flight`` holds pending computations by key, so that decorators
+    sharing the cache can coalesce concurrent misses.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[V, float]] = OrderedDict()
+        self.stats = CacheStats()
+        self.in_flight: dict[str, asyncio.Task[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> V | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= self._clock():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.stats.record(misses=1)
+            return None
+        self._entries.move_to_end(key)
+        self.stats.record(hits=1)
+        return entry[0]
+
+    def put(self, key: str, value: V) -> None:
+        self._entries[key] = (value, self._clock() + self._ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
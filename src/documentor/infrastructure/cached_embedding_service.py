@@ -0,0 +1,120 @@
+import asyncio
+import hashlib
+import logging
+
+from documentor.domain.models.chunk import Embedding
+from documentor.domain.services.embedding_service import EmbeddingService
+from documentor.infrastructure.persistence.pg_embedding_cache import PgEmbeddingCache
+from documentor.infrastructure.query_embedding_cache import QueryEmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """Serve embeddings from a persistent cache, embedding only the misses.
+
+    Cache failures are logged and treated as misses so that an unavailable
+    cache never blocks ingestion or question answering.
+    """
+
+    def __init__(
+        self, inner: EmbeddingService, cache: PgEmbeddingCache, model: str
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._model = model
+
+    async def embed(self, text: str) -> Embedding:
+        key = _text_hash(text)
+        cached = await self._lookup({key})
+        if key in cached:
+            return cached[key]
+
+        embedding = await self._inner.embed(text)
+        await self._store({key: embedding})
+        return embedding
+
+    async def embed_batch(self, texts: list[str]) -> list[Embedding]:
+        if not texts:
+            return []
+        keys = [_text_hash(text) for text in texts]
+        embeddings = await self._lookup(set(keys))
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in embeddings:
+                missing.setdefault(key, text)
+
+        if missing:
+            fetched = await self._inner.embed_batch(list(missing.values()))
+            computed = dict(zip(missing.keys(), fetched, strict=True))
+            await self._store(computed)
+            embeddings.update(computed)
+
+        logger.debug(
+            "Embedding cache served %d of %d texts",
+            len(texts) - sum(1 for key in keys if key in missing),
+            len(texts),
+        )
+        return [embeddings[key] for key in keys]
+
+    def count_tokens(self, text: str) -> int:
+        return self._inner.count_tokens(text)
+
+    async def _lookup(self, keys: set[str]) -> dict[str, Embedding]:
+        try:
+            return await self._cache.get_many(self._model, keys)
+        except Exception:
+            logger.warning("Embedding cache lookup failed", exc_info=True)
+            return {}
+
+    async def _store(self, embeddings: dict[str, Embedding]) -> None:
+        try:
+            await self._cache.put_many(self._model, embeddings)
+        except Exception:
+            logger.warning("Embedding cache write failed", exc_info=True)
+
+
+class QueryCachedEmbeddingService(EmbeddingService):
+    """Answer repeated single-text `embed` calls from an in-process cache.
+
+    Meant for the question path, where the same queries recur: a hit skips
+    the embedding round trip entirely, and concurrent misses for the same
+    key share one call to `inner`, even across service instances. `embed_batch`
+    is passed through.
+    """
+
+    def __init__(self, inner: EmbeddingService, cache: QueryEmbeddingCache) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    async def embed(self, text: str) -> Embedding:
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
+
+        key = self._cache.key(text)
+        task = self._cache.in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._embed_and_store(key, text))
+            self._cache.in_flight[key] = task
+        # Shielded so that one cancelled request does not fail the others.
+        return await asyncio.shield(task)
+
+    async def _embed_and_store(self, key: str, text: str) -> Embedding:
+        try:
+            embedding = await self._inner.embed(text)
+        finally:
+            del self._cache.in_flight[key]
+        self._cache.put(text, embedding)
+        return embedding
+
+    async def embed_batch(self, texts: list[str]) -> list[Embedding]:
+        return await self._inner.embed_batch(texts)
+
+    def count_tokens(self, text: str) -> int:
+        return self._inner.count_tokens(text)
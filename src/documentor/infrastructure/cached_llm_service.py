@@ -0,0 +1,90 @@
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
+
+from documentor.domain.models.chunk import Chunk
+from documentor.domain.models.conversation import ConversationMessage
+from documentor.domain.models.question import Question
+from documentor.domain.services.llm_service import LLMService
+from documentor.infrastructure.cache import LruTtlCache
+from documentor.infrastructure.external.prompt_builder import (
+    build_rewrite_user_message,
+)
+
+
+def rewrite_cache_key(
+    model: str,
+    question: Question,
+    conversation_history: tuple[ConversationMessage, ...],
+) -> str:
+    """Hash the rewrite prompt exactly as sent, so history beyond its window is ignored."""
+    message = build_rewrite_user_message(question, conversation_history)
+    return hashlib.sha256(f"{model}\0{message}".encode()).hexdigest()
+
+
+class RewriteCachingLLMService(LLMService):
+    """Memoize `rewrite_query`; generation is passed through.
+
+    The key covers the rewrite model and the truncated history that
+    `build_rewrite_user_message` puts in the prompt, so a retried or
+    regenerated turn reuses the earlier rewrite. Concurrent identical
+    rewrites share one call to `inner`.
+    """
+
+    def __init__(
+        self, inner: LLMService, cache: LruTtlCache[str], model: str
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._model = model
+
+    async def generate(
+        self,
+        question: Question,
+        context_chunks: list[Chunk],
+        conversation_history: tuple[ConversationMessage, ...] = (),
+    ) -> str:
+        return await self._inner.generate(
+            question, context_chunks, conversation_history
+        )
+
+    def generate_stream(
+        self,
+        question: Question,
+        context_chunks: list[Chunk],
+        conversation_history: tuple[ConversationMessage, ...] = (),
+    ) -> AsyncIterator[str]:
+        return self._inner.generate_stream(
+            question, context_chunks, conversation_history
+        )
+
+    async def rewrite_query(
+        self,
+        question: Question,
+        conversation_history: tuple[ConversationMessage, ...],
+    ) -> str:
+        key = rewrite_cache_key(self._model, question, conversation_history)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._cache.in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._rewrite_and_store(key, question, conversation_history)
+            )
+            self._cache.in_flight[key] = task
+        return await asyncio.shield(task)
+
+    async def _rewrite_and_store(
+        self,
+        key: str,
+        question: Question,
+        conversation_history: tuple[ConversationMessage, ...],
+    ) -> str:
+        try:
+            rewritten = await self._inner.rewrite_query(question, conversation_history)
+        finally:
+            del self._cache.in_flight[key]
+        self._cache.put(key, rewritten)
+        return rewritten
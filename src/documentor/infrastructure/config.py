@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -9,6 +11,58 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     embedding_model: str = "text-embedding-3-small"
     embedding_dimension: int = 1536
+    embedding_short_dimension: int = 256
+    embedding_max_concurrency: int = 4
+    embedding_cache_enabled: bool = False
+    embedding_cache_max_entries: int | None = 500_000
+    embedding_cache_max_age_days: int | None = 90
+    query_embedding_cache_enabled: bool = True
+    query_embedding_cache_max_mb: int = 64
+    query_embedding_cache_ttl_seconds: float = 3600.0
+    query_embedding_cache_normalize: bool = True
+    rewrite_cache_enabled: bool = True
+    rewrite_cache_max_entries: int = 10_000
+    rewrite_cache_ttl_seconds: float = 3600.0
+    speculative_retrieval_enabled: bool = False
+    hybrid_search_enabled: bool = False
+    query_fan_out_enabled: bool = False
+    query_fan_out_max_queries: int = 3
+    mmr_enabled: bool = False
+    mmr_lambda: float = 0.7
+    mmr_candidates: int = 20
+    context_max_tokens: int = 4000
+    ask_batch_max_concurrent_generations: int = 8
+    hnsw_ef_search: int = 40
+    hnsw_iterative_scan: Literal["off", "relaxed_order", "strict_order"] = (
+        "relaxed_order"
+    )
+    hnsw_max_scan_tuples: int = 20_000
+    vector_first_pass: Literal["exact", "halfvec", "bit", "short"] = "halfvec"
+    vector_rerank_candidates: int = 40
+    vector_snapshot_enabled: bool = False
+    vector_snapshot_dir: str = "var/vector-snapshot"
+    vector_snapshot_refresh_seconds: float = 30.0
+    answer_cache_enabled: bool = False
+    answer_cache_max_entries: int = 2000
+    answer_cache_ttl_seconds: float = 3600.0
+    answer_cache_max_distance: float = 0.05
+    chunk_max_tokens: int = 512
+    chunk_overlap_tokens: int = 64
+    ingest_batch_size: int = 64
+    ingest_max_pending_batches: int = 2
+    http_max_connections: int = 50
+    http_max_connections_per_host: int = 4
+    http_dns_cache_ttl_seconds: float = 300.0
+    crawl_concurrency: int = 8
+    crawl_max_concurrent_ingests: int = 4
+    # Workers inside each API process; ingestion normally runs in its own
+    # process (`python -m documentor.adapters.worker`) with
+    # `ingest_worker_concurrency` jobs at a time.
+    ingest_workers: int = 0
+    ingest_worker_concurrency: int = 2
+    ingest_job_lease_seconds: int = 300
+    ingest_job_max_attempts: int = 3
+    ingest_job_poll_interval_seconds: float = 1.0
     llm_provider: str = "openai"
     llm_model: str = "gpt-4o-mini"
     rewrite_model: str = ""
@@ -2,16 +2,18 @@ import logging
 from collections.abc import AsyncIterator
 
 from anthropic import AsyncAnthropic
-from anthropic.types import MessageParam
+from anthropic.types import MessageParam, TextBlockParam, Usage
 
 from documentor.domain.exceptions import LLMGenerationError
 from documentor.domain.models.chunk import Chunk
 from documentor.domain.models.conversation import ConversationMessage
 from documentor.domain.models.question import Question
 from documentor.domain.services.llm_service import LLMService
+from documentor.infrastructure.external.llm_usage import LLMUsage, report_usage
 from documentor.infrastructure.external.prompt_builder import (
     build_query_rewrite_prompt,
     build_rag_system_prompt,
+    build_rag_user_message,
     build_rewrite_user_message,
 )
 
@@ -25,6 +27,56 @@ def _build_history_messages(
     return [{"role": msg.role, "content": msg.content} for msg in history]
 
 
+def _build_rag_request(
+    question: Question,
+    context_chunks: list[Chunk],
+    history: tuple[ConversationMessage, ...],
+) -> tuple[list[TextBlockParam], list[MessageParam]]:
+    """Build the system blocks and messages, marking the prompt cache breakpoints.
+
+    The system prompt and the history are the same from one turn of a
+    conversation to the next, so both end with a cache breakpoint: the next
+    turn reads the whole prefix from the cache and only the new context and
+    question are processed. Prefixes below the model's minimum cacheable
+    length are simply not cached.
+    """
+    system: list[TextBlockParam] = [
+        {
+            "type": "text",
+            "text": build_rag_system_prompt(),
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+    messages = _build_history_messages(history)
+    if messages:
+        last = history[-1]
+        messages[-1] = {
+            "role": last.role,
+            "content": [
+                {
+                    "type": "text",
+                    "text": last.content,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+    messages.append(
+        {"role": "user", "content": build_rag_user_message(question, context_chunks)}
+    )
+    return system, messages
+
+
+def _report_usage(usage: Usage) -> None:
+    report_usage(
+        LLMUsage(
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cache_read_input_tokens=usage.cache_read_input_tokens or 0,
+            cache_creation_input_tokens=usage.cache_creation_input_tokens or 0,
+        )
+    )
+
+
 class AnthropicLLMService(LLMService):
     def __init__(
         self,
@@ -43,17 +95,16 @@ class AnthropicLLMService(LLMService):
         conversation_history: tuple[ConversationMessage, ...] = (),
     ) -> str:
         try:
-            system_prompt = build_rag_system_prompt(context_chunks)
-            history_messages = _build_history_messages(conversation_history)
+            system, messages = _build_rag_request(
+                question, context_chunks, conversation_history
+            )
             response = await self._client.messages.create(
                 model=self._model,
                 max_tokens=1024,
-                system=system_prompt,
-                messages=[
-                    *history_messages,
-                    {"role": "user", "content": question.text},
-                ],
+                system=system,
+                messages=messages,
             )
+            _report_usage(response.usage)
             if not response.content:
                 raise LLMGenerationError("LLM returned empty response")
             return response.content[0].text
@@ -69,19 +120,18 @@ class AnthropicLLMService(LLMService):
         conversation_history: tuple[ConversationMessage, ...] = (),
     ) -> AsyncIterator[str]:
         try:
-            system_prompt = build_rag_system_prompt(context_chunks)
-            history_messages = _build_history_messages(conversation_history)
+            system, messages = _build_rag_request(
+                question, context_chunks, conversation_history
+            )
             async with self._client.messages.stream(
                 model=self._model,
                 max_tokens=1024,
-                system=system_prompt,
-                messages=[
-                    *history_messages,
-                    {"role": "user", "content": question.text},
-                ],
+                system=system,
+                messages=messages,
             ) as stream:
                 async for text in stream.text_stream:
                     yield text
+                _report_usage((await stream.get_final_message()).usage)
         except LLMGenerationError:
             raise
         except Exception as e:
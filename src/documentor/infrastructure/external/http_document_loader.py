@@ -1,5 +1,9 @@
 import asyncio
 import socket
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from ipaddress import ip_address
 from urllib.parse import urlparse
 
@@ -12,29 +16,80 @@ from documentor.domain.services.document_loader_service import (
     LoadedDocument,
 )
 
+_TIMEOUT_SECONDS = 30.0
+_DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
+_DEFAULT_DNS_CACHE_TTL_SECONDS = 300.0
+
+
+def create_http_client(max_connections: int = 50) -> httpx.AsyncClient:
+    """Build the pooled client shared by all HTTP loads of the process."""
+    return httpx.AsyncClient(
+        timeout=_TIMEOUT_SECONDS,
+        follow_redirects=False,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    )
+
 
 class HttpDocumentLoader(DocumentLoaderService):
+    """Load documents over HTTP(S) with SSRF protection.
+
+    With a shared `client`, connections are pooled across loads, at most
+    `max_connections_per_host` requests run against one host at a time, and
+    hosts that passed the SSRF check are trusted for `dns_cache_ttl` seconds.
+    Without one, each load opens and closes its own client.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        *,
+        max_connections_per_host: int = _DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        dns_cache_ttl: float = _DEFAULT_DNS_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._client = client
+        self._host_slots: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max(1, max_connections_per_host))
+        )
+        self._dns_cache_ttl = dns_cache_ttl
+        self._validated_hosts: dict[str, float] = {}
+
     async def load(self, source: str) -> LoadedDocument:
         return await self._load_url(source)
 
-    async def _load_url(self, url: str) -> LoadedDocument:
+    async def fetch_text(self, url: str) -> str:
+        """Return the body of `url` after the same checks as `load`."""
         await self._validate_url_target(url)
         try:
-            async with httpx.AsyncClient(
-                timeout=30.0, follow_redirects=False
-            ) as client:
+            async with self._session() as client, self._host_slot(url):
                 response = await client.get(url)
                 response.raise_for_status()
-                content = response.text
-                title = _extract_title_from_content(content) or _title_from_url(url)
-                return LoadedDocument(
-                    content=content, title=title, source_type=SourceType.URL
-                )
-        except DocumentLoadError:
-            raise
+                return response.text
         except Exception as e:
             raise DocumentLoadError(f"Failed to load URL '{url}': {e}") from e
 
+    async def _load_url(self, url: str) -> LoadedDocument:
+        content = await self.fetch_text(url)
+        title = _extract_title_from_content(content) or _title_from_url(url)
+        return LoadedDocument(content=content, title=title, source_type=SourceType.URL)
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._client is not None:
+            yield self._client
+            return
+        async with httpx.AsyncClient(
+            timeout=_TIMEOUT_SECONDS, follow_redirects=False
+        ) as client:
+            yield client
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str) -> AsyncIterator[None]:
+        async with self._host_slots[urlparse(url).hostname or ""]:
+            yield
+
     async def _validate_url_target(self, url: str) -> None:
         """Reject URLs that resolve to private/reserved IP addresses (SSRF protection)."""
         parsed = urlparse(url)
@@ -42,6 +97,10 @@ class HttpDocumentLoader(DocumentLoaderService):
         if not hostname:
             raise DocumentLoadError(f"Invalid URL: no hostname in '{url}'")
 
+        expires_at = self._validated_hosts.get(hostname)
+        if expires_at is not None and expires_at > time.monotonic():
+            return
+
         try:
             loop = asyncio.get_running_loop()
             addrinfo = await loop.getaddrinfo(hostname, None)
@@ -57,6 +116,9 @@ class HttpDocumentLoader(DocumentLoaderService):
                     "URL must not target private or reserved network addresses"
                 )
 
+        if self._client is not None:
+            self._validated_hosts[hostname] = time.monotonic() + self._dns_cache_ttl
+
 
 def _extract_title_from_content(content: str) -> str | None:
     for line in content.splitlines():
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import re
+from collections.abc import AsyncIterator
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from documentor.domain.exceptions import DocumentLoadError
+from documentor.domain.services.site_crawler import CrawledPage, SiteCrawler
+from documentor.infrastructure.external.http_document_loader import (
+    HttpDocumentLoader,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CONCURRENCY = 8
+_MAX_SITEMAP_DEPTH = 3
+
+_LOC_PATTERN = re.compile(r"<loc>\s*([^<\s]+)\s*</loc>", re.IGNORECASE)
+_SITEMAP_INDEX_PATTERN = re.compile(r"<sitemapindex[\s>]", re.IGNORECASE)
+_HREF_PATTERN = re.compile(r"""href\s*=\s*["']([^"'\s]+)["']""", re.IGNORECASE)
+_SKIPPED_EXTENSIONS = (
+    ".css", ".js", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico",
+    ".webp", ".zip", ".gz", ".tar", ".woff", ".woff2", ".mp4", ".pdf",
+)  # fmt: skip
+
+
+class HttpSiteCrawler(SiteCrawler):
+    """Crawl a sitemap, or the pages linked under a seed URL, over HTTP.
+
+    A start URL ending in ``.xml`` is read as a sitemap (sitemap indexes are
+    followed). Any other URL is a seed: links are followed breadth-first
+    while they stay on the same host and under the seed's directory. Up to
+    `concurrency` pages are fetched at once through the shared loader, which
+    also applies its per-host limits and SSRF checks.
+    """
+
+    def __init__(
+        self, loader: HttpDocumentLoader, concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> None:
+        self._loader = loader
+        self._concurrency = max(1, concurrency)
+
+    async def crawl(
+        self, start_url: str, *, max_pages: int
+    ) -> AsyncIterator[CrawledPage]:
+        if urlparse(start_url).path.lower().endswith(".xml"):
+            try:
+                urls = await self._sitemap_urls(start_url, max_pages)
+            except DocumentLoadError as e:
+                yield CrawledPage(url=start_url, error=str(e))
+                return
+            follow_links = False
+        else:
+            urls = [start_url]
+            follow_links = True
+
+        async for page in self._fetch_all(urls, max_pages, follow_links):
+            yield page
+
+    async def _sitemap_urls(
+        self, sitemap_url: str, max_pages: int, depth: int = 0
+    ) -> list[str]:
+        body = await self._loader.fetch_text(sitemap_url)
+        locations = [_normalize(loc) for loc in _LOC_PATTERN.findall(body)]
+        if not _SITEMAP_INDEX_PATTERN.search(body):
+            return list(dict.fromkeys(locations))[:max_pages]
+        if depth >= _MAX_SITEMAP_DEPTH:
+            return []
+
+        urls: dict[str, None] = {}
+        for child in locations:
+            remaining = max_pages - len(urls)
+            if remaining <= 0:
+                break
+            try:
+                found = await self._sitemap_urls(child, remaining, depth + 1)
+            except DocumentLoadError:
+                continue
+            urls.update(dict.fromkeys(found))
+        return list(urls)[:max_pages]
+
+    async def _fetch_all(
+        self, urls: list[str], max_pages: int, follow_links: bool
+    ) -> AsyncIterator[CrawledPage]:
+        frontier: asyncio.Queue[str] = asyncio.Queue()
+        pages: asyncio.Queue[CrawledPage | None] = asyncio.Queue(self._concurrency)
+        seen: set[str] = set()
+        scope = _scope_of(urls[0]) if urls else ""
+
+        def enqueue(url: str) -> None:
+            if len(seen) < max_pages and url not in seen:
+                seen.add(url)
+                frontier.put_nowait(url)
+
+        for url in urls:
+            enqueue(_normalize(url))
+
+        async def worker() -> None:
+            # A worker that died would leave its queue items undone and
+            # `frontier.join()` waiting forever, so every page error is
+            # reported as a failed page instead.
+            while True:
+                url = await frontier.get()
+                try:
+                    try:
+                        page = await self._fetch(url)
+                        if follow_links and page.document is not None:
+                            for link in _extract_links(url, page.document.content):
+                                if link.startswith(scope):
+                                    enqueue(link)
+                    except Exception:
+                        logger.exception("Crawling %s failed unexpectedly", url)
+                        page = CrawledPage(
+                            url=url, error="Unexpected error while crawling"
+                        )
+                    await pages.put(page)
+                finally:
+                    frontier.task_done()
+
+        async def coordinate() -> None:
+            workers = [
+                asyncio.create_task(worker()) for _ in range(self._concurrency)
+            ]
+            try:
+                await frontier.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+            await pages.put(None)
+
+        coordinator = asyncio.create_task(coordinate())
+        try:
+            while (page := await pages.get()) is not None:
+                yield page
+        finally:
+            coordinator.cancel()
+            await asyncio.gather(coordinator, return_exceptions=True)
+
+    async def _fetch(self, url: str) -> CrawledPage:
+        try:
+            return CrawledPage(url=url, document=await self._loader.load(url))
+        except DocumentLoadError as e:
+            return CrawledPage(url=url, error=str(e))
+
+
+def _normalize(url: str) -> str:
+    return urldefrag(url.strip())[0]
+
+
+def _scope_of(url: str) -> str:
+    """URL prefix that followed links must share: the seed's directory."""
+    parsed = urlparse(url)
+    directory = parsed.path.rsplit("/", 1)[0] + "/"
+    return f"{parsed.scheme}://{parsed.netloc}{directory}"
+
+
+def _extract_links(page_url: str, content: str) -> list[str]:
+    links: list[str] = []
+    for href in _HREF_PATTERN.findall(content):
+        link = _normalize(urljoin(page_url, href))
+        parsed = urlparse(link)
+        if parsed.scheme not in ("http", "https"):
+            continue
+        if parsed.path.lower().endswith(_SKIPPED_EXTENSIONS):
+            continue
+        links.append(link)
+    return links
@@ -0,0 +1,49 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LLMUsage:
+    """Token counts of one completion, as reported by the provider.
+
+    `input_tokens` counts only the uncached part of the prompt; the cached
+    prefix is split into `cache_read_input_tokens` (served from the prompt
+    cache) and `cache_creation_input_tokens` (written to it).
+    """
+
+    input_tokens: int
+    output_tokens: int
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+
+    def as_usage_details(self) -> dict[str, int]:
+        return {
+            "input": self.input_tokens,
+            "output": self.output_tokens,
+            "cache_read_input_tokens": self.cache_read_input_tokens,
+            "cache_creation_input_tokens": self.cache_creation_input_tokens,
+        }
+
+
+_collected: ContextVar[list[LLMUsage] | None] = ContextVar(
+    "llm_usage", default=None
+)
+
+
+@contextmanager
+def collect_usage() -> Iterator[list[LLMUsage]]:
+    """Collect the usage reported by LLM calls made inside the block."""
+    usages: list[LLMUsage] = []
+    token = _collected.set(usages)
+    try:
+        yield usages
+    finally:
+        _collected.reset(token)
+
+
+def report_usage(usage: LLMUsage) -> None:
+    usages = _collected.get()
+    if usages is not None:
+        usages.append(usage)
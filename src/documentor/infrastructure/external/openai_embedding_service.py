@@ -1,3 +1,6 @@
+import asyncio
+import base64
+
 import tiktoken
 from openai import AsyncOpenAI
 
@@ -7,40 +10,100 @@ from documentor.domain.services.embedding_service import EmbeddingService
 
 
 _MAX_BATCH_SIZE = 2048
+_MAX_BATCH_TOKENS = 300_000
+_DEFAULT_MAX_CONCURRENCY = 4
 
 
 class OpenAIEmbeddingService(EmbeddingService):
-    def __init__(self, api_key: str, model: str = "text-embedding-3-small") -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "text-embedding-3-small",
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        max_batch_tokens: int = _MAX_BATCH_TOKENS,
+        dimensions: int | None = None,
+    ) -> None:
         self._client = AsyncOpenAI(api_key=api_key)
         self._model = model
+        # Only text-embedding-3 models accept `dimensions`; older ones reject it.
+        self._options: dict[str, int] = (
+            {"dimensions": dimensions}
+            if dimensions is not None and model.startswith("text-embedding-3")
+            else {}
+        )
         self._encoding = tiktoken.encoding_for_model(model)
+        self._max_batch_tokens = max_batch_tokens
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
     async def embed(self, text: str) -> Embedding:
         try:
             response = await self._client.embeddings.create(
-                model=self._model, input=text
+                model=self._model,
+                input=text,
+                encoding_format="base64",
+                **self._options,
             )
-            return Embedding.from_list(response.data[0].embedding)
+            return _to_embedding(response.data[0].embedding)
         except Exception as e:
             raise EmbeddingGenerationError(f"Failed to generate embedding: {e}") from e
 
     async def embed_batch(self, texts: list[str]) -> list[Embedding]:
+        """Embed texts in token-bounded sub-batches sent concurrently.
+
+        Sub-batches are packed greedily in input order, so concatenating
+        their results restores the original ordering.
+        """
+        if not texts:
+            return []
         try:
-            all_embeddings: list[Embedding] = []
-            for i in range(0, len(texts), _MAX_BATCH_SIZE):
-                batch = texts[i : i + _MAX_BATCH_SIZE]
-                response = await self._client.embeddings.create(
-                    model=self._model, input=batch
-                )
-                sorted_data = sorted(response.data, key=lambda x: x.index)
-                all_embeddings.extend(
-                    Embedding.from_list(item.embedding) for item in sorted_data
-                )
-            return all_embeddings
-        except Exception as e:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(self._embed_sub_batch(texts[start:end]))
+                    for start, end in self._pack_sub_batches(texts)
+                ]
+        except ExceptionGroup as eg:
+            cause = eg.exceptions[0]
             raise EmbeddingGenerationError(
-                f"Failed to generate embeddings batch: {e}"
-            ) from e
+                f"Failed to generate embeddings batch: {cause}"
+            ) from cause
+        return [embedding for task in tasks for embedding in task.result()]
 
     def count_tokens(self, text: str) -> int:
         return len(self._encoding.encode(text))
+
+    def _pack_sub_batches(self, texts: list[str]) -> list[tuple[int, int]]:
+        """Return [start, end) slices within both the item and token limits."""
+        slices: list[tuple[int, int]] = []
+        start = 0
+        batch_tokens = 0
+        for i, text in enumerate(texts):
+            tokens = self.count_tokens(text)
+            is_full = (
+                i - start >= _MAX_BATCH_SIZE
+                or batch_tokens + tokens > self._max_batch_tokens
+            )
+            if i > start and is_full:
+                slices.append((start, i))
+                start = i
+                batch_tokens = 0
+            batch_tokens += tokens
+        slices.append((start, len(texts)))
+        return slices
+
+    async def _embed_sub_batch(self, batch: list[str]) -> list[Embedding]:
+        async with self._semaphore:
+            response = await self._client.embeddings.create(
+                model=self._model,
+                input=batch,
+                encoding_format="base64",
+                **self._options,
+            )
+        sorted_data = sorted(response.data, key=lambda x: x.index)
+        return [_to_embedding(item.embedding) for item in sorted_data]
+
+
+def _to_embedding(data: str | list[float]) -> Embedding:
+    """Decode a base64 float32 payload without materializing Python floats."""
+    if isinstance(data, str):
+        return Embedding.from_buffer(base64.b64decode(data))
+    return Embedding.from_list(data)
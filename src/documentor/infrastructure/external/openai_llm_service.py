@@ -2,6 +2,7 @@ import logging
 from collections.abc import AsyncIterator
 
 from openai import AsyncOpenAI
+from openai.types import CompletionUsage
 from openai.types.chat import ChatCompletionMessageParam
 
 from documentor.domain.exceptions import LLMGenerationError
@@ -9,9 +10,11 @@ from documentor.domain.models.chunk import Chunk
 from documentor.domain.models.conversation import ConversationMessage
 from documentor.domain.models.question import Question
 from documentor.domain.services.llm_service import LLMService
+from documentor.infrastructure.external.llm_usage import LLMUsage, report_usage
 from documentor.infrastructure.external.prompt_builder import (
     build_query_rewrite_prompt,
     build_rag_system_prompt,
+    build_rag_user_message,
     build_rewrite_user_message,
 )
 
@@ -25,6 +28,34 @@ def _build_history_messages(
     return [{"role": msg.role, "content": msg.content} for msg in history]
 
 
+def _build_rag_messages(
+    question: Question,
+    context_chunks: list[Chunk],
+    history: tuple[ConversationMessage, ...],
+) -> list[ChatCompletionMessageParam]:
+    # Instructions and history first: OpenAI caches long prompt prefixes
+    # automatically, and only the last message changes between turns.
+    return [
+        {"role": "system", "content": build_rag_system_prompt()},
+        *_build_history_messages(history),
+        {"role": "user", "content": build_rag_user_message(question, context_chunks)},
+    ]
+
+
+def _report_usage(usage: CompletionUsage | None) -> None:
+    if usage is None:
+        return
+    details = usage.prompt_tokens_details
+    cached = (details.cached_tokens or 0) if details is not None else 0
+    report_usage(
+        LLMUsage(
+            input_tokens=usage.prompt_tokens - cached,
+            output_tokens=usage.completion_tokens,
+            cache_read_input_tokens=cached,
+        )
+    )
+
+
 class OpenAILLMService(LLMService):
     def __init__(
         self,
@@ -43,16 +74,13 @@ class OpenAILLMService(LLMService):
         conversation_history: tuple[ConversationMessage, ...] = (),
     ) -> str:
         try:
-            system_prompt = build_rag_system_prompt(context_chunks)
-            history_messages = _build_history_messages(conversation_history)
             response = await self._client.chat.completions.create(
                 model=self._model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    *history_messages,
-                    {"role": "user", "content": question.text},
-                ],
+                messages=_build_rag_messages(
+                    question, context_chunks, conversation_history
+                ),
             )
+            _report_usage(response.usage)
             text = response.choices[0].message.content or ""
             if not text.strip():
                 raise LLMGenerationError("LLM returned empty response")
@@ -69,18 +97,19 @@ class OpenAILLMService(LLMService):
         conversation_history: tuple[ConversationMessage, ...] = (),
     ) -> AsyncIterator[str]:
         try:
-            system_prompt = build_rag_system_prompt(context_chunks)
-            history_messages = _build_history_messages(conversation_history)
             stream = await self._client.chat.completions.create(
                 model=self._model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    *history_messages,
-                    {"role": "user", "content": question.text},
-                ],
+                messages=_build_rag_messages(
+                    question, context_chunks, conversation_history
+                ),
                 stream=True,
+                stream_options={"include_usage": True},
             )
             async for chunk in stream:
+                # The usage arrives in a last chunk without choices.
+                if not chunk.choices:
+                    _report_usage(chunk.usage)
+                    continue
                 delta = chunk.choices[0].delta.content
                 if delta:
                     yield delta
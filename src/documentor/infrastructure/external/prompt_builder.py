@@ -3,7 +3,23 @@ from documentor.domain.models.conversation import ConversationMessage
 from documentor.domain.models.question import Question
 
 
-def build_rag_system_prompt(chunks: list[Chunk]) -> str:
+def build_rag_system_prompt() -> str:
+    """Return the answering instructions, identical for every request.
+
+    Retrieved context goes in the last user message (`build_rag_user_message`)
+    so the system prompt and the conversation history form a prefix that
+    stays the same from one turn to the next and can be served from the
+    provider's prompt cache.
+    """
+    return (
+        "You are a helpful assistant that answers questions based on the provided "
+        "documentation context. Use ONLY the information from the sources given "
+        "with the question to answer. If the answer cannot be found in the "
+        "sources, say so clearly."
+    )
+
+
+def build_rag_user_message(question: Question, chunks: list[Chunk]) -> str:
     context_parts: list[str] = []
     for i, chunk in enumerate(chunks, 1):
         context_parts.append(
@@ -12,10 +28,8 @@ def build_rag_system_prompt(chunks: list[Chunk]) -> str:
         )
     context = "\n\n".join(context_parts)
     return (
-        "You are a helpful assistant that answers questions based on the provided "
-        "documentation context. Use ONLY the information from the sources below to "
-        "answer. If the answer cannot be found in the sources, say so clearly.\n\n"
-        f"--- CONTEXT ---\n{context}\n--- END CONTEXT ---"
+        f"--- CONTEXT ---\n{context}\n--- END CONTEXT ---\n\n"
+        f"Question: {question.text}"
     )
 
 
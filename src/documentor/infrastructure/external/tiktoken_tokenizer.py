@@ -0,0 +1,23 @@
+from collections.abc import Sequence
+
+import tiktoken
+
+from documentor.domain.services.tokenizer import Tokenizer
+
+
+class TiktokenTokenizer(Tokenizer):
+    def __init__(self, model: str = "text-embedding-3-small") -> None:
+        self._encoding = tiktoken.encoding_for_model(model)
+
+    def encode(self, text: str) -> list[int]:
+        # Documents may legitimately contain strings like "<|endoftext|>";
+        # encode them as plain text instead of rejecting the document.
+        return self._encoding.encode(text, disallowed_special=())
+
+    def decode(self, tokens: Sequence[int]) -> str:
+        return self._encoding.decode(list(tokens))
+
+    def starts_character(self, token: int) -> bool:
+        data = self._encoding.decode_single_token_bytes(token)
+        # UTF-8 continuation bytes are 0b10xxxxxx.
+        return not data or data[0] & 0xC0 != 0x80
@@ -8,6 +8,7 @@ from documentor.domain.models.conversation import ConversationMessage
 from documentor.domain.models.question import Question
 from documentor.domain.services.embedding_service import EmbeddingService
 from documentor.domain.services.llm_service import LLMService
+from documentor.infrastructure.external.llm_usage import LLMUsage, collect_usage
 
 
 def _serialize_history(
@@ -27,6 +28,17 @@ def _serialize_chunks(chunks: list[Chunk]) -> list[dict[str, Any]]:
     ]
 
 
+def _usage_details(usages: list[LLMUsage]) -> dict[str, int] | None:
+    """Sum the usage the provider reported, including prompt cache reads and writes."""
+    if not usages:
+        return None
+    totals: dict[str, int] = {}
+    for usage in usages:
+        for key, count in usage.as_usage_details().items():
+            totals[key] = totals.get(key, 0) + count
+    return totals
+
+
 class ObservedLLMService(LLMService):
     def __init__(self, inner: LLMService) -> None:
         self._inner = inner
@@ -45,11 +57,11 @@ class ObservedLLMService(LLMService):
                 "conversation_history": _serialize_history(conversation_history),
                 "context_chunks": _serialize_chunks(context_chunks),
             },
-        ) as span:
+        ) as span, collect_usage() as usages:
             result = await self._inner.generate(
                 question, context_chunks, conversation_history
             )
-            span.update(output=result)
+            span.update(output=result, usage_details=_usage_details(usages))
             return result
 
     async def generate_stream(
@@ -66,14 +78,16 @@ class ObservedLLMService(LLMService):
                 "conversation_history": _serialize_history(conversation_history),
                 "context_chunks": _serialize_chunks(context_chunks),
             },
-        ) as span:
+        ) as span, collect_usage() as usages:
             collected: list[str] = []
             async for chunk in self._inner.generate_stream(
                 question, context_chunks, conversation_history
             ):
                 collected.append(chunk)
                 yield chunk
-            span.update(output="".join(collected))
+            span.update(
+                output="".join(collected), usage_details=_usage_details(usages)
+            )
 
     async def rewrite_query(
         self,
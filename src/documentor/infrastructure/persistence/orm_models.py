@@ -1,12 +1,46 @@
 from datetime import datetime
+from typing import Any
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from pgvector.sqlalchemy import BIT, HALFVEC, Vector
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    cast,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.elements import ColumnElement
 
 from documentor.infrastructure.database import Base
 
 EMBEDDING_DIMENSION = 1536
+# Matryoshka prefix of `embedding` indexed for cheap first-pass searches.
+EMBEDDING_SHORT_DIMENSION = 256
+TEXT_SEARCH_CONFIG = "english"
+HALFVEC_TYPE = HALFVEC(EMBEDDING_DIMENSION)
+BIT_TYPE = BIT(EMBEDDING_DIMENSION)
+
+# Full-precision vectors stay in the table for re-ranking; only quantized
+# copies are indexed, to keep the HNSW graphs small.
+_HALFVEC_INDEX_EXPRESSION = text(
+    f"(embedding::halfvec({EMBEDDING_DIMENSION})) halfvec_cosine_ops"
+)
+_BIT_INDEX_EXPRESSION = text(
+    f"(binary_quantize(embedding)::bit({EMBEDDING_DIMENSION})) bit_hamming_ops"
+)
+
+
+def binary_quantize(column: Any) -> ColumnElement[str]:
+    """One bit per dimension (set when positive), as the bit index stores it."""
+    return cast(func.binary_quantize(column), BIT_TYPE)
 
 
 class DocumentModel(Base):
@@ -19,6 +53,9 @@ class DocumentModel(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
     chunk_count: Mapped[int] = mapped_column(Integer, default=0)
 
 
@@ -33,13 +70,78 @@ class ChunkModel(Base):
     token_count: Mapped[int] = mapped_column(Integer, nullable=False)
     position: Mapped[int] = mapped_column(Integer, nullable=False)
     embedding = mapped_column(Vector(EMBEDDING_DIMENSION), nullable=True)
+    embedding_short = mapped_column(
+        Vector(EMBEDDING_SHORT_DIMENSION),
+        Computed(
+            f"l2_normalize(subvector(embedding, 1, {EMBEDDING_SHORT_DIMENSION}))",
+            persisted=True,
+        ),
+    )
+    text_search = mapped_column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{TEXT_SEARCH_CONFIG}', text)", persisted=True),
+    )
 
     __table_args__ = (
         Index(
-            "ix_chunks_embedding",
-            embedding,
+            "ix_chunks_embedding_halfvec",
+            _HALFVEC_INDEX_EXPRESSION,
             postgresql_using="hnsw",
             postgresql_with={"m": 16, "ef_construction": 64},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
         ),
+        Index(
+            "ix_chunks_embedding_bit",
+            _BIT_INDEX_EXPRESSION,
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+        ),
+        Index(
+            "ix_chunks_embedding_short",
+            embedding_short,
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding_short": "vector_cosine_ops"},
+        ),
+        Index("ix_chunks_text_search", text_search, postgresql_using="gin"),
+    )
+
+
+class EmbeddingCacheModel(Base):
+    __tablename__ = "embedding_cache"
+
+    model: Mapped[str] = mapped_column(String, primary_key=True)
+    text_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    embedding = mapped_column(Vector(EMBEDDING_DIMENSION), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+
+class IngestionJobModel(Base):
+    __tablename__ = "ingestion_jobs"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    source: Mapped[str] = mapped_column(String, nullable=False)
+    title: Mapped[str | None] = mapped_column(String, nullable=True)
+    on_duplicate: Mapped[str] = mapped_column(String, nullable=False)
+    commit_mode: Mapped[str] = mapped_column(String, nullable=False)
+    filename: Mapped[str | None] = mapped_column(String, nullable=True)
+    payload: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    chunks_processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    document_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_ingestion_jobs_status_created_at", "status", "created_at"),
     )
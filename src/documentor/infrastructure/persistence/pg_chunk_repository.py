@@ -1,9 +1,83 @@
-from sqlalchemy import delete, select
+import re
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    Text,
+    bindparam,
+    cast,
+    delete,
+    func,
+    select,
+    text,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from documentor.domain.models.chunk import Chunk, ChunkContent, Embedding
+from documentor.domain.models.chunk import (
+    Chunk,
+    ChunkContent,
+    Embedding,
+    FirstPass,
+    RetrievedChunk,
+    SearchFilter,
+    SearchProfile,
+)
 from documentor.domain.repositories.chunk_repository import ChunkRepository
-from documentor.infrastructure.persistence.orm_models import ChunkModel
+from documentor.infrastructure.persistence.orm_models import (
+    EMBEDDING_SHORT_DIMENSION,
+    HALFVEC_TYPE,
+    TEXT_SEARCH_CONFIG,
+    ChunkModel,
+    DocumentModel,
+    binary_quantize,
+)
+from documentor.infrastructure.persistence.vector_codec import (
+    binary_vector_codec,
+    embedding_from_pgvector,
+    embedding_to_pgvector,
+    vector_send,
+)
+
+_STAGING_TABLE = "chunks_staging"
+_STAGING_COLUMNS = ["id", "document_id", "text", "token_count", "position", "embedding"]
+
+# Temporary tables are per-connection; ON COMMIT DELETE ROWS keeps pooled
+# connections from carrying staged rows across transactions.
+_CREATE_STAGING_TABLE = text(
+    f"CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} ("
+    "id varchar, document_id varchar, text text, token_count integer, "
+    "position integer, embedding vector"
+    ") ON COMMIT DELETE ROWS"
+)
+_INSERT_FROM_STAGING = text(
+    "INSERT INTO chunks (id, document_id, text, token_count, position, embedding) "
+    "SELECT id, document_id, text, token_count, position, embedding "
+    f"FROM {_STAGING_TABLE}"
+)
+_TRUNCATE_STAGING_TABLE = text(f"TRUNCATE {_STAGING_TABLE}")
+
+_QUERY_TERM = re.compile(r"\w+")
+# ts_rank_cd normalization flag 32 scales ranks to rank / (rank + 1).
+_RANK_NORMALIZATION = 32
+
+# Filtered searches over at most this many chunks skip the HNSW index and
+# rank the candidates found through the document_id btree exactly.
+_EXACT_SEARCH_MAX_CHUNKS = 10_000
+
+
+@dataclass(frozen=True)
+class _Scope:
+    """A resolved `SearchFilter`: matching documents and how to search them."""
+
+    document_ids: list[str]
+    exact: bool
 
 
 class PgChunkRepository(ChunkRepository):
@@ -11,25 +85,306 @@ class PgChunkRepository(ChunkRepository):
         self._session = session
 
     async def save_all(self, chunks: list[Chunk]) -> list[Chunk]:
-        models = [_to_model(chunk) for chunk in chunks]
-        self._session.add_all(models)
+        """Bulk-insert chunks via binary COPY into a staging table.
+
+        Rows bypass the ORM unit of work: asyncpg streams them with binary
+        COPY into a temporary table, and a single INSERT ... SELECT moves them
+        into `chunks`. Vectors are copied as pgvector's binary format, encoded
+        straight from each embedding's buffer. Everything runs on the
+        session's connection, inside its current transaction.
+        """
+        if not chunks:
+            return chunks
+
         await self._session.flush()
+        # Executing through the session first makes sure the transaction has
+        # begun before COPY goes straight to the driver connection.
+        await self._session.execute(_CREATE_STAGING_TABLE)
+
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        async with binary_vector_codec(driver_connection):
+            await driver_connection.copy_records_to_table(
+                _STAGING_TABLE, records=_to_records(chunks), columns=_STAGING_COLUMNS
+            )
+
+        await self._session.execute(_INSERT_FROM_STAGING)
+        await self._session.execute(_TRUNCATE_STAGING_TABLE)
         return chunks
 
     async def search_similar(
-        self, embedding: Embedding, top_k: int = 5
+        self,
+        embedding: Embedding,
+        top_k: int = 5,
+        profile: SearchProfile | None = None,
+        search_filter: SearchFilter | None = None,
     ) -> list[tuple[Chunk, float]]:
-        vector = list(embedding.vector)
-        distance_expr = ChunkModel.embedding.cosine_distance(vector)
+        scope = await self._resolve_scope(search_filter)
+        if scope is not None and not scope.document_ids:
+            return []
+        nearest = _nearest(
+            [
+                ChunkModel.id,
+                ChunkModel.document_id,
+                ChunkModel.text,
+                ChunkModel.token_count,
+                ChunkModel.position,
+                vector_send(ChunkModel.embedding).label("embedding"),
+            ],
+            embedding,
+            top_k,
+            profile,
+            scope,
+        ).subquery()
+        # Iterative scans in relaxed order may return hits slightly out of
+        # order, hence the re-sort outside the index scan.
+        stmt = select(nearest).order_by(nearest.c.distance)
+        await self._apply_profile(_profile_for(profile, scope))
+        result = await self._session.execute(stmt)
+        return [(_to_entity(row), 1.0 - float(row.distance)) for row in result.all()]
+
+    async def retrieve(
+        self,
+        embedding: Embedding,
+        top_k: int = 5,
+        profile: SearchProfile | None = None,
+        search_filter: SearchFilter | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        """Nearest chunks joined with their document titles in one round trip.
+
+        Only the columns the answer path needs are selected, so vectors only
+        cross the wire `with_embeddings`. The nearest-neighbour subquery is
+        ordered and limited on its own, keeping it on the HNSW index before
+        the join.
+        """
+        scope = await self._resolve_scope(search_filter)
+        if scope is not None and not scope.document_ids:
+            return []
+        nearest = _nearest(
+            _retrieved_columns(with_embeddings),
+            embedding,
+            top_k,
+            profile,
+            scope,
+        ).subquery()
+        await self._apply_profile(_profile_for(profile, scope))
+        stmt = (
+            select(nearest, DocumentModel.title)
+            .join(DocumentModel, DocumentModel.id == nearest.c.document_id)
+            .order_by(nearest.c.distance)
+        )
+        result = await self._session.execute(stmt)
+        return [_to_retrieved(row, 1.0 - float(row.distance)) for row in result.all()]
+
+    async def retrieve_batch(
+        self,
+        embeddings: Sequence[Embedding],
+        top_k: int = 5,
+        profile: SearchProfile | None = None,
+        search_filter: SearchFilter | None = None,
+        with_embeddings: bool = False,
+    ) -> list[list[RetrievedChunk]]:
+        """Run one nearest-neighbour search per embedding in a single statement.
+
+        The query vectors are sent as one array and unnested WITH ORDINALITY;
+        a LATERAL subquery runs the same index search as `retrieve` for each
+        of them. Exact scopes rank through a materialized CTE, which cannot be
+        correlated, so they are searched one embedding at a time instead.
+        """
+        if not embeddings:
+            return []
+        scope = await self._resolve_scope(search_filter)
+        if scope is not None and not scope.document_ids:
+            return [[] for _ in embeddings]
+        if scope is not None and scope.exact:
+            return [
+                await self.retrieve(
+                    embedding, top_k, profile, search_filter, with_embeddings
+                )
+                for embedding in embeddings
+            ]
+
+        queries = (
+            func.unnest(
+                bindparam(
+                    "queries",
+                    [_vector_literal(embedding) for embedding in embeddings],
+                    type_=ARRAY(Text),
+                )
+            )
+            .table_valued("query", with_ordinality="ordinal")
+            .render_derived()
+        )
+        nearest = _nearest(
+            _retrieved_columns(with_embeddings),
+            cast(queries.c.query, ChunkModel.embedding.type),
+            top_k,
+            profile,
+            scope,
+        ).lateral("nearest")
+        stmt = (
+            select(queries.c.ordinal, nearest, DocumentModel.title)
+            .select_from(queries)
+            .join(nearest, true())
+            .join(DocumentModel, DocumentModel.id == nearest.c.document_id)
+            .order_by(queries.c.ordinal, nearest.c.distance)
+        )
+        await self._apply_profile(_profile_for(profile, scope))
+        result = await self._session.execute(stmt)
+        batches: list[list[RetrievedChunk]] = [[] for _ in embeddings]
+        for row in result.all():
+            batches[row.ordinal - 1].append(
+                _to_retrieved(row, 1.0 - float(row.distance))
+            )
+        return batches
+
+    async def search_fulltext(
+        self,
+        query: str,
+        top_k: int = 5,
+        search_filter: SearchFilter | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        """Rank chunks on the GIN-indexed `text_search` column.
+
+        Query words are OR-ed, so identifiers match even when the rest of
+        the question does not; stop words are dropped by the text search
+        configuration and chunks matching more terms rank higher.
+        """
+        terms = _QUERY_TERM.findall(query)
+        if not terms:
+            return []
+        tsquery = func.to_tsquery(TEXT_SEARCH_CONFIG, " | ".join(terms))
+        rank_expr = func.ts_rank_cd(
+            ChunkModel.text_search, tsquery, _RANK_NORMALIZATION
+        )
         stmt = (
-            select(ChunkModel, distance_expr.label("distance"))
-            .where(ChunkModel.embedding.isnot(None))
-            .order_by(distance_expr)
+            select(
+                *_retrieved_columns(with_embeddings),
+                DocumentModel.title,
+                rank_expr.label("rank"),
+            )
+            .join(DocumentModel, DocumentModel.id == ChunkModel.document_id)
+            .where(
+                ChunkModel.text_search.bool_op("@@")(tsquery),
+                *_document_conditions(search_filter),
+            )
+            .order_by(rank_expr.desc())
             .limit(top_k)
         )
         result = await self._session.execute(stmt)
+        return [_to_retrieved(row, float(row.rank)) for row in result.all()]
+
+    async def find_retrieved(self, scores: Mapping[str, float]) -> list[RetrievedChunk]:
+        """Load the chunks scored by an external search, best score first.
+
+        Ids that no longer exist are skipped.
+        """
+        if not scores:
+            return []
+        stmt = (
+            select(
+                ChunkModel.id,
+                ChunkModel.document_id,
+                ChunkModel.text,
+                ChunkModel.token_count,
+                ChunkModel.position,
+                DocumentModel.title,
+            )
+            .join(DocumentModel, DocumentModel.id == ChunkModel.document_id)
+            .where(ChunkModel.id.in_(list(scores)))
+        )
+        result = await self._session.execute(stmt)
+        hits = [_to_retrieved(row, scores[row.id]) for row in result.all()]
+        return sorted(hits, key=lambda hit: hit.score, reverse=True)
+
+    async def _resolve_scope(self, search_filter: SearchFilter | None) -> _Scope | None:
+        """Find the documents a filter matches and plan the search over them.
+
+        Chunk counts come from the small documents table: when the filter is
+        selective, ranking its chunks exactly is both cheaper and more
+        accurate than an HNSW scan that would discard most candidates.
+        """
+        conditions = _document_conditions(search_filter)
+        if not conditions:
+            return None
+        result = await self._session.execute(
+            select(DocumentModel.id, DocumentModel.chunk_count).where(*conditions)
+        )
         rows = result.all()
-        return [(_to_entity(row[0]), 1.0 - float(row[1])) for row in rows]
+        return _Scope(
+            document_ids=[row.id for row in rows],
+            exact=sum(row.chunk_count for row in rows) <= _EXACT_SEARCH_MAX_CHUNKS,
+        )
+
+    async def _apply_profile(self, profile: SearchProfile | None) -> None:
+        """Set the profile's HNSW parameters for the rest of the transaction.
+
+        `set_config(..., true)` is the bindable form of `SET LOCAL`, and all
+        parameters go in one statement, so a profile costs one round trip.
+        """
+        if profile is None:
+            return
+        parameters = {
+            "hnsw.ef_search": profile.ef_search,
+            "hnsw.iterative_scan": profile.iterative_scan,
+            "hnsw.max_scan_tuples": profile.max_scan_tuples,
+        }
+        settings = [
+            func.set_config(name, str(value), True)
+            for name, value in parameters.items()
+            if value is not None
+        ]
+        await self._session.execute(select(*settings))
+
+    async def find_by_document_id(self, document_id: str) -> list[Chunk]:
+        stmt = (
+            select(
+                ChunkModel.id,
+                ChunkModel.document_id,
+                ChunkModel.text,
+                ChunkModel.token_count,
+                ChunkModel.position,
+            )
+            .where(ChunkModel.document_id == document_id)
+            .order_by(ChunkModel.position)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            Chunk(
+                id=row.id,
+                document_id=row.document_id,
+                content=ChunkContent(text=row.text, token_count=row.token_count),
+                position=row.position,
+            )
+            for row in result.all()
+        ]
+
+    async def update_positions(self, positions: dict[str, int]) -> None:
+        if not positions:
+            return
+        stmt = (
+            update(ChunkModel.__table__)
+            .where(ChunkModel.__table__.c.id == bindparam("chunk_id"))
+            .values(position=bindparam("new_position"))
+        )
+        await self._session.execute(
+            stmt,
+            [
+                {"chunk_id": chunk_id, "new_position": position}
+                for chunk_id, position in positions.items()
+            ],
+        )
+        await self._session.flush()
+
+    async def delete_by_ids(self, chunk_ids: set[str]) -> None:
+        if not chunk_ids:
+            return
+        stmt = delete(ChunkModel).where(ChunkModel.id.in_(chunk_ids))
+        await self._session.execute(stmt)
+        await self._session.flush()
 
     async def delete_by_document_id(self, document_id: str) -> None:
         stmt = delete(ChunkModel).where(ChunkModel.document_id == document_id)
@@ -37,25 +392,171 @@ class PgChunkRepository(ChunkRepository):
         await self._session.flush()
 
 
-def _to_model(chunk: Chunk) -> ChunkModel:
-    return ChunkModel(
-        id=chunk.id,
-        document_id=chunk.document_id,
-        text=chunk.content.text,
-        token_count=chunk.content.token_count,
-        position=chunk.position,
-        embedding=list(chunk.embedding.vector) if chunk.embedding else None,
-    )
+def _to_records(chunks: list[Chunk]) -> Iterator[tuple[Any, ...]]:
+    for chunk in chunks:
+        yield (
+            chunk.id,
+            chunk.document_id,
+            chunk.content.text,
+            chunk.content.token_count,
+            chunk.position,
+            embedding_to_pgvector(chunk.embedding) if chunk.embedding else None,
+        )
 
 
-def _to_entity(model: ChunkModel) -> Chunk:
+def _to_entity(row: Row[Any]) -> Chunk:
     embedding = None
-    if model.embedding is not None:
-        embedding = Embedding.from_list(list(model.embedding))
+    if row.embedding is not None:
+        embedding = embedding_from_pgvector(row.embedding)
     return Chunk(
-        id=model.id,
-        document_id=model.document_id,
-        content=ChunkContent(text=model.text, token_count=model.token_count),
-        position=model.position,
+        id=row.id,
+        document_id=row.document_id,
+        content=ChunkContent(text=row.text, token_count=row.token_count),
+        position=row.position,
         embedding=embedding,
     )
+
+
+def _retrieved_columns(with_embeddings: bool) -> list[ColumnElement[Any]]:
+    columns: list[ColumnElement[Any]] = [
+        ChunkModel.id,
+        ChunkModel.document_id,
+        ChunkModel.text,
+        ChunkModel.token_count,
+        ChunkModel.position,
+    ]
+    if with_embeddings:
+        columns.append(vector_send(ChunkModel.embedding).label("embedding"))
+    return columns
+
+
+def _vector_literal(embedding: Embedding) -> str:
+    """pgvector's text input format; float32 values round-trip exactly."""
+    return "[" + ",".join(map(str, embedding.vector)) + "]"
+
+
+def _document_conditions(
+    search_filter: SearchFilter | None,
+) -> list[ColumnElement[bool]]:
+    if search_filter is None:
+        return []
+    conditions: list[ColumnElement[bool]] = []
+    if search_filter.document_ids:
+        conditions.append(DocumentModel.id.in_(sorted(search_filter.document_ids)))
+    if search_filter.source_types:
+        conditions.append(
+            DocumentModel.source_type.in_(sorted(search_filter.source_types))
+        )
+    if prefix := search_filter.source_prefix:
+        conditions.append(DocumentModel.source.startswith(prefix, autoescape=True))
+    return conditions
+
+
+def _nearest(
+    columns: list[ColumnElement[Any]],
+    query: Embedding | ColumnElement[Any],
+    top_k: int,
+    profile: SearchProfile | None,
+    scope: _Scope | None,
+) -> Select[Any]:
+    """Select `columns` and exact `distance` of the `top_k` closest chunks.
+
+    Candidates come from the profile's quantized HNSW index and are then
+    re-ranked on full-precision vectors. A profile's `min_score` becomes an
+    exact distance bound in the WHERE clause, so the index scan, not the
+    caller, discards weak hits. An exact scope ranks its candidates in a
+    materialized CTE, which the HNSW index cannot serve, so the planner
+    fetches them through the document_id btree instead.
+
+    `query` is either an embedding or a vector column of an enclosing
+    query, for which the statement is correlated, as in a LATERAL join.
+    """
+    profile = profile or SearchProfile()
+    correlated = not isinstance(query, Embedding)
+    distance_expr = ChunkModel.embedding.cosine_distance(
+        query if correlated else query.to_list()
+    )
+    stmt = select(*columns, distance_expr.label("distance")).where(
+        ChunkModel.embedding.isnot(None)
+    )
+    if correlated:
+        stmt = stmt.correlate_except(ChunkModel)
+    if scope is not None:
+        stmt = stmt.where(ChunkModel.document_id.in_(scope.document_ids))
+    if profile.min_score is not None:
+        stmt = stmt.where(distance_expr <= 1.0 - profile.min_score)
+
+    if scope is not None and scope.exact:
+        exact = stmt.cte("candidates").prefix_with("MATERIALIZED")
+        return select(exact).order_by(exact.c.distance).limit(top_k)
+    if profile.first_pass == "exact":
+        return stmt.order_by(distance_expr).limit(top_k)
+    candidates = (
+        stmt.order_by(_first_pass_distance(profile.first_pass, query))
+        .limit(max(top_k, profile.rerank_candidates))
+        .subquery()
+    )
+    return select(candidates).order_by(candidates.c.distance).limit(top_k)
+
+
+def _first_pass_distance(
+    first_pass: FirstPass, query: Embedding | ColumnElement[Any]
+) -> ColumnElement[float]:
+    """Distance expression served by the first-pass index of `first_pass`.
+
+    The query side of an embedding is quantized here, that of a vector
+    column in SQL the same way the indexes quantize stored vectors.
+    """
+    if not isinstance(query, Embedding):
+        if first_pass == "short":
+            return ChunkModel.embedding_short.cosine_distance(
+                func.l2_normalize(func.subvector(query, 1, EMBEDDING_SHORT_DIMENSION))
+            )
+        if first_pass == "halfvec":
+            return cast(ChunkModel.embedding, HALFVEC_TYPE).cosine_distance(
+                cast(query, HALFVEC_TYPE)
+            )
+        return binary_quantize(ChunkModel.embedding).hamming_distance(
+            binary_quantize(query)
+        )
+    if first_pass == "short":
+        return ChunkModel.embedding_short.cosine_distance(
+            query.truncate(EMBEDDING_SHORT_DIMENSION).to_list()
+        )
+    if first_pass == "halfvec":
+        return cast(ChunkModel.embedding, HALFVEC_TYPE).cosine_distance(
+            query.to_list()
+        )
+    bits = "".join("1" if value > 0 else "0" for value in query.vector)
+    return binary_quantize(ChunkModel.embedding).hamming_distance(bits)
+
+
+def _profile_for(
+    profile: SearchProfile | None, scope: _Scope | None
+) -> SearchProfile | None:
+    """Enable iterative scans for filtered HNSW searches.
+
+    Without them the index returns `ef_search` candidates and the filter
+    may leave fewer than `top_k` of them.
+    """
+    if scope is None or scope.exact:
+        return profile
+    profile = profile or SearchProfile()
+    if profile.iterative_scan != "off":
+        return profile
+    return replace(profile, iterative_scan="relaxed_order")
+
+
+def _to_retrieved(row: Row[Any], score: float) -> RetrievedChunk:
+    embedding = getattr(row, "embedding", None)
+    return RetrievedChunk(
+        chunk=Chunk(
+            id=row.id,
+            document_id=row.document_id,
+            content=ChunkContent(text=row.text, token_count=row.token_count),
+            position=row.position,
+            embedding=embedding_from_pgvector(embedding) if embedding else None,
+        ),
+        score=score,
+        document_title=row.title,
+    )
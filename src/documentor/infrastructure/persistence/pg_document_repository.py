@@ -1,4 +1,4 @@
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from documentor.domain.models.document import Document, SourceType
@@ -16,6 +16,21 @@ class PgDocumentRepository(DocumentRepository):
         await self._session.flush()
         return document
 
+    async def update(self, document: Document) -> Document:
+        stmt = (
+            update(DocumentModel)
+            .where(DocumentModel.id == document.id)
+            .values(
+                title=document.title,
+                source_type=document.source_type.value,
+                chunk_count=document.chunk_count,
+                updated_at=document.updated_at,
+            )
+        )
+        await self._session.execute(stmt)
+        await self._session.flush()
+        return document
+
     async def find_by_id(self, document_id: str) -> Document | None:
         model = await self._session.get(DocumentModel, document_id)
         if model is None:
@@ -59,6 +74,7 @@ def _to_model(document: Document) -> DocumentModel:
         title=document.title,
         source_type=document.source_type.value,
         created_at=document.created_at,
+        updated_at=document.updated_at,
         chunk_count=document.chunk_count,
     )
 
@@ -70,5 +86,6 @@ def _to_entity(model: DocumentModel) -> Document:
         title=model.title,
         source_type=SourceType(model.source_type),
         created_at=model.created_at,
+        updated_at=model.updated_at,
         chunk_count=model.chunk_count,
     )
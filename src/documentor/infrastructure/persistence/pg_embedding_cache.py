@@ -0,0 +1,118 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from documentor.domain.models.chunk import Embedding
+from documentor.infrastructure.cache import CacheStats
+from documentor.infrastructure.persistence.orm_models import EmbeddingCacheModel
+from documentor.infrastructure.persistence.vector_codec import (
+    embedding_from_pgvector,
+    vector_send,
+)
+
+_DEFAULT_EVICTION_INTERVAL = 1000
+
+
+class PgEmbeddingCache:
+    """Content-addressed embedding store keyed on (model, sha256(text)).
+
+    The cache manages its own short transactions so entries survive even
+    when the caller's unit of work is rolled back. Eviction runs after every
+    ``eviction_interval`` written entries: rows older than ``max_age`` are
+    dropped, then the oldest rows beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_entries: int | None = None,
+        max_age: timedelta | None = None,
+        eviction_interval: int = _DEFAULT_EVICTION_INTERVAL,
+    ) -> None:
+        self._session_factory = session_factory
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self._eviction_interval = eviction_interval
+        self._writes_since_eviction = 0
+        self.stats = CacheStats()
+
+    async def get_many(self, model: str, text_hashes: set[str]) -> dict[str, Embedding]:
+        if not text_hashes:
+            return {}
+        stmt = select(
+            EmbeddingCacheModel.text_hash, vector_send(EmbeddingCacheModel.embedding)
+        ).where(
+            EmbeddingCacheModel.model == model,
+            EmbeddingCacheModel.text_hash.in_(text_hashes),
+        )
+        cutoff = self._cutoff()
+        if cutoff is not None:
+            stmt = stmt.where(EmbeddingCacheModel.created_at >= cutoff)
+
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            found = {
+                text_hash: embedding_from_pgvector(vector)
+                for text_hash, vector in result.all()
+            }
+
+        self.stats.record(hits=len(found), misses=len(text_hashes) - len(found))
+        return found
+
+    async def put_many(self, model: str, embeddings: dict[str, Embedding]) -> None:
+        if not embeddings:
+            return
+        now = datetime.now(UTC)
+        stmt = insert(EmbeddingCacheModel).on_conflict_do_nothing(
+            index_elements=["model", "text_hash"]
+        )
+        rows = [
+            {
+                "model": model,
+                "text_hash": text_hash,
+                "embedding": embedding.to_list(),
+                "created_at": now,
+            }
+            for text_hash, embedding in embeddings.items()
+        ]
+        async with self._session_factory() as session:
+            await session.execute(stmt, rows)
+            await session.commit()
+
+        self._writes_since_eviction += len(rows)
+        if self._writes_since_eviction >= self._eviction_interval:
+            await self.evict()
+
+    async def evict(self) -> None:
+        """Drop expired entries, then the oldest entries beyond the size cap."""
+        self._writes_since_eviction = 0
+        async with self._session_factory() as session:
+            cutoff = self._cutoff()
+            if cutoff is not None:
+                await session.execute(
+                    delete(EmbeddingCacheModel).where(
+                        EmbeddingCacheModel.created_at < cutoff
+                    )
+                )
+            if self._max_entries is not None:
+                overflow = (
+                    select(EmbeddingCacheModel.model, EmbeddingCacheModel.text_hash)
+                    .order_by(EmbeddingCacheModel.created_at.desc())
+                    .offset(self._max_entries)
+                )
+                await session.execute(
+                    delete(EmbeddingCacheModel).where(
+                        tuple_(
+                            EmbeddingCacheModel.model, EmbeddingCacheModel.text_hash
+                        ).in_(overflow)
+                    )
+                )
+            await session.commit()
+
+    def _cutoff(self) -> datetime | None:
+        if self._max_age is None:
+            return None
+        return datetime.now(UTC) - self._max_age
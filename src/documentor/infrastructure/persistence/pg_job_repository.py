@@ -0,0 +1,142 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from documentor.domain.models.ingestion_job import IngestionJob, JobStatus
+from documentor.domain.repositories.job_repository import JobRepository
+from documentor.infrastructure.persistence.orm_models import IngestionJobModel
+
+
+class PgJobRepository(JobRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def save(self, job: IngestionJob) -> IngestionJob:
+        self._session.add(_to_model(job))
+        await self._session.flush()
+        return job
+
+    async def update(self, job: IngestionJob) -> IngestionJob:
+        values: dict[str, object] = {
+            "status": job.status.value,
+            "attempts": job.attempts,
+            "chunks_processed": job.chunks_processed,
+            "document_id": job.document_id,
+            "error": job.error,
+            "updated_at": job.updated_at,
+        }
+        if job.is_finished:
+            # The uploaded bytes are only needed until the job has run.
+            values["payload"] = None
+            values["locked_until"] = None
+        await self._update_claimed(job, values)
+        return job
+
+    async def find_by_id(self, job_id: str) -> IngestionJob | None:
+        model = await self._session.get(IngestionJobModel, job_id)
+        if model is None:
+            return None
+        return _to_entity(model)
+
+    async def claim_next(self, lease: timedelta) -> IngestionJob | None:
+        runnable = or_(
+            IngestionJobModel.status == JobStatus.QUEUED.value,
+            and_(
+                IngestionJobModel.status == JobStatus.RUNNING.value,
+                IngestionJobModel.locked_until < func.now(),
+            ),
+        )
+        stmt = (
+            select(IngestionJobModel)
+            .where(runnable)
+            .order_by(IngestionJobModel.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one_or_none()
+        if model is None:
+            return None
+
+        now = datetime.now(UTC)
+        model.status = JobStatus.RUNNING.value
+        model.attempts += 1
+        model.locked_until = now + lease
+        model.updated_at = now
+        await self._session.flush()
+        return _to_entity(model)
+
+    async def record_progress(
+        self, job: IngestionJob, chunks_processed: int, lease: timedelta
+    ) -> bool:
+        now = datetime.now(UTC)
+        return await self._update_claimed(
+            job,
+            {
+                "chunks_processed": chunks_processed,
+                "locked_until": now + lease,
+                "updated_at": now,
+            },
+        )
+
+    async def renew_lease(self, job: IngestionJob, lease: timedelta) -> bool:
+        now = datetime.now(UTC)
+        return await self._update_claimed(
+            job, {"locked_until": now + lease, "updated_at": now}
+        )
+
+    async def _update_claimed(
+        self, job: IngestionJob, values: dict[str, object]
+    ) -> bool:
+        # Every claim increments `attempts`, so a mismatch means the lease
+        # expired and another worker owns the job now.
+        stmt = (
+            update(IngestionJobModel)
+            .where(
+                IngestionJobModel.id == job.id,
+                IngestionJobModel.attempts == job.attempts,
+            )
+            .values(**values)
+        )
+        result = await self._session.execute(stmt)
+        await self._session.flush()
+        return result.rowcount > 0
+
+
+def _to_model(job: IngestionJob) -> IngestionJobModel:
+    return IngestionJobModel(
+        id=job.id,
+        source=job.source,
+        title=job.title,
+        on_duplicate=job.on_duplicate,
+        commit_mode=job.commit,
+        filename=job.filename,
+        payload=job.payload,
+        status=job.status.value,
+        attempts=job.attempts,
+        chunks_processed=job.chunks_processed,
+        document_id=job.document_id,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
+
+
+def _to_entity(model: IngestionJobModel) -> IngestionJob:
+    return IngestionJob(
+        id=model.id,
+        source=model.source,
+        status=JobStatus(model.status),
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+        title=model.title,
+        on_duplicate=model.on_duplicate,  # type: ignore[arg-type]
+        commit=model.commit_mode,  # type: ignore[arg-type]
+        filename=model.filename,
+        payload=model.payload,
+        attempts=model.attempts,
+        chunks_processed=model.chunks_processed,
+        document_id=model.document_id,
+        error=model.error,
+    )
@@ -1,5 +1,5 @@
 from types import TracebackType
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -8,16 +8,31 @@ from documentor.infrastructure.persistence.pg_chunk_repository import PgChunkRep
 from documentor.infrastructure.persistence.pg_document_repository import (
     PgDocumentRepository,
 )
+from documentor.infrastructure.persistence.pg_job_repository import PgJobRepository
+from documentor.infrastructure.persistence.snapshot_chunk_repository import (
+    SnapshotChunkRepository,
+)
+
+if TYPE_CHECKING:
+    from documentor.infrastructure.persistence.vector_snapshot import VectorSnapshot
 
 
 class PgUnitOfWork(UnitOfWork):
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        vector_snapshot: "VectorSnapshot | None" = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._vector_snapshot = vector_snapshot
 
     async def __aenter__(self) -> Self:
         self._session = self._session_factory()
         self.documents = PgDocumentRepository(self._session)
         self.chunks = PgChunkRepository(self._session)
+        if self._vector_snapshot is not None:
+            self.chunks = SnapshotChunkRepository(self.chunks, self._vector_snapshot)
+        self.jobs = PgJobRepository(self._session)
         return self
 
     async def __aexit__(
@@ -0,0 +1,160 @@
+import asyncio
+from collections.abc import Sequence
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from documentor.domain.models.chunk import (
+    Chunk,
+    Embedding,
+    RetrievedChunk,
+    SearchFilter,
+    SearchProfile,
+)
+from documentor.domain.repositories.chunk_repository import ChunkRepository
+from documentor.infrastructure.persistence.pg_chunk_repository import PgChunkRepository
+
+if TYPE_CHECKING:
+    from documentor.infrastructure.persistence.vector_snapshot import VectorSnapshot
+
+
+class SnapshotChunkRepository(ChunkRepository):
+    """Answer unfiltered vector searches from a `VectorSnapshot`.
+
+    The snapshot ranks every chunk exactly in-process; only the winning rows
+    are then loaded from Postgres. Filtered searches, and all searches until
+    the first snapshot is written, go to the wrapped repository, as do writes.
+    """
+
+    def __init__(self, inner: PgChunkRepository, snapshot: "VectorSnapshot") -> None:
+        self._inner = inner
+        self._snapshot = snapshot
+
+    async def save_all(self, chunks: list[Chunk]) -> list[Chunk]:
+        return await self._inner.save_all(chunks)
+
+    async def search_similar(
+        self,
+        embedding: Embedding,
+        top_k: int = 5,
+        profile: SearchProfile | None = None,
+        search_filter: SearchFilter | None = None,
+    ) -> list[tuple[Chunk, float]]:
+        if not self._serves(search_filter):
+            return await self._inner.search_similar(
+                embedding, top_k, profile, search_filter
+            )
+        hits = await asyncio.to_thread(
+            self._snapshot.search,
+            embedding,
+            top_k,
+            min_score=profile.min_score if profile else None,
+            with_vectors=True,
+        )
+        vectors = {hit.chunk_id: hit.embedding for hit in hits}
+        results = await self._inner.find_retrieved(
+            {hit.chunk_id: hit.score for hit in hits}
+        )
+        for result in results:
+            result.chunk.set_embedding(vectors[result.chunk.id])
+        return [(result.chunk, result.score) for result in results]
+
+    async def retrieve(
+        self,
+        embedding: Embedding,
+        top_k: int = 5,
+        profile: SearchProfile | None = None,
+        search_filter: SearchFilter | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        if not self._serves(search_filter):
+            return await self._inner.retrieve(
+                embedding, top_k, profile, search_filter, with_embeddings
+            )
+        hits = await asyncio.to_thread(
+            self._snapshot.search,
+            embedding,
+            top_k,
+            min_score=profile.min_score if profile else None,
+            with_vectors=with_embeddings,
+        )
+        results = await self._inner.find_retrieved(
+            {hit.chunk_id: hit.score for hit in hits}
+        )
+        if with_embeddings:
+            vectors = {hit.chunk_id: hit.embedding for hit in hits}
+            for result in results:
+                result.chunk.set_embedding(vectors[result.chunk.id])
+        return results
+
+    async def retrieve_batch(
+        self,
+        embeddings: Sequence[Embedding],
+        top_k: int = 5,
+        profile: SearchProfile | None = None,
+        search_filter: SearchFilter | None = None,
+        with_embeddings: bool = False,
+    ) -> list[list[RetrievedChunk]]:
+        """Rank every embedding on the snapshot, then load all hits at once."""
+        if not self._serves(search_filter):
+            return await self._inner.retrieve_batch(
+                embeddings, top_k, profile, search_filter, with_embeddings
+            )
+        batches = await asyncio.to_thread(
+            lambda: [
+                self._snapshot.search(
+                    embedding,
+                    top_k,
+                    min_score=profile.min_score if profile else None,
+                    with_vectors=with_embeddings,
+                )
+                for embedding in embeddings
+            ]
+        )
+        chunk_ids = {hit.chunk_id for hits in batches for hit in hits}
+        loaded = {
+            result.chunk.id: result
+            for result in await self._inner.find_retrieved(
+                dict.fromkeys(chunk_ids, 0.0)
+            )
+        }
+        if with_embeddings:
+            for hits in batches:
+                for hit in hits:
+                    if hit.chunk_id in loaded and hit.embedding is not None:
+                        loaded[hit.chunk_id].chunk.set_embedding(hit.embedding)
+        return [
+            [
+                replace(loaded[hit.chunk_id], score=hit.score)
+                for hit in hits
+                if hit.chunk_id in loaded
+            ]
+            for hits in batches
+        ]
+
+    async def search_fulltext(
+        self,
+        query: str,
+        top_k: int = 5,
+        search_filter: SearchFilter | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        return await self._inner.search_fulltext(
+            query, top_k, search_filter, with_embeddings
+        )
+
+    async def find_by_document_id(self, document_id: str) -> list[Chunk]:
+        return await self._inner.find_by_document_id(document_id)
+
+    async def update_positions(self, positions: dict[str, int]) -> None:
+        await self._inner.update_positions(positions)
+
+    async def delete_by_ids(self, chunk_ids: set[str]) -> None:
+        await self._inner.delete_by_ids(chunk_ids)
+
+    async def delete_by_document_id(self, document_id: str) -> None:
+        await self._inner.delete_by_document_id(document_id)
+
+    def _serves(self, search_filter: SearchFilter | None) -> bool:
+        if search_filter is not None and not search_filter.is_empty:
+            return False
+        return self._snapshot.ready
@@ -0,0 +1,68 @@
+import struct
+import sys
+from array import array
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from asyncpg import Connection
+from sqlalchemy import func
+from sqlalchemy.sql.elements import ColumnElement
+
+from documentor.domain.models.chunk import Embedding
+
+_HEADER = struct.Struct(">HH")
+
+
+def vector_send(column: Any) -> ColumnElement[bytes]:
+    """Select a vector column in pgvector's binary wire format (bytea).
+
+    The server ships 4 bytes per dimension instead of the text form, and the
+    client decodes it without building Python floats.
+    """
+    return func.vector_send(column)
+
+
+def embedding_from_pgvector(data: bytes) -> Embedding:
+    """Decode pgvector's binary format.
+
+    The payload is a uint16 dimension, an unused uint16, then big-endian
+    float32 values.
+    """
+    dimension, _unused = _HEADER.unpack_from(data)
+    vector = array("f")
+    vector.frombytes(memoryview(data)[_HEADER.size :])
+    if sys.byteorder != "big":
+        vector.byteswap()
+    if len(vector) != dimension:
+        raise ValueError(
+            f"pgvector payload has {len(vector)} values, header says {dimension}"
+        )
+    return Embedding.from_buffer(vector)
+
+
+def embedding_to_pgvector(embedding: Embedding) -> bytes:
+    """Encode an embedding in pgvector's binary format, straight from its buffer."""
+    if sys.byteorder == "big":
+        values = embedding.vector.tobytes()
+    else:
+        swapped = array("f", embedding.vector.tobytes())
+        swapped.byteswap()
+        values = swapped.tobytes()
+    return _HEADER.pack(embedding.dimension, 0) + values
+
+
+@asynccontextmanager
+async def binary_vector_codec(connection: Connection) -> AsyncIterator[None]:
+    """Make asyncpg pass pre-encoded pgvector payloads through as-is.
+
+    Binary COPY needs a binary codec for every column. It is registered only
+    for the block: other statements bind vectors in pgvector's text format.
+    """
+    await connection.set_type_codec(
+        "vector", encoder=bytes, decoder=bytes, format="binary"
+    )
+    try:
+        yield
+    finally:
+        await connection.reset_type_codec("vector")
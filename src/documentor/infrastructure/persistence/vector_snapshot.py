@@ -0,0 +1,358 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from documentor.domain.models.chunk import Embedding
+from documentor.infrastructure.persistence.orm_models import ChunkModel, DocumentModel
+from documentor.infrastructure.persistence.vector_codec import vector_send
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST = "manifest.json"
+_LOCK = ".lock"
+# pgvector's binary format: uint16 dimension and uint16 unused, then the
+# values as big-endian float32.
+_PGVECTOR_HEADER_BYTES = 4
+_PGVECTOR_DTYPE = np.dtype(">f4")
+_FETCH_BATCH_ROWS = 2048
+_COPY_BLOCK_ROWS = 16384
+
+
+@dataclass(frozen=True)
+class SnapshotHit:
+    chunk_id: str
+    score: float
+    embedding: Embedding | None = None
+
+
+@dataclass(frozen=True)
+class _Generation:
+    file_id: tuple[int, int]
+    number: int
+    vectors: np.ndarray
+    chunk_ids: list[str]
+    document_ids: list[str]
+    documents: dict[str, str]
+
+
+class VectorSnapshot:
+    """Exact cosine search over a memory-mapped float32 copy of all embeddings.
+
+    A generation is a raw ``(rows, dimension)`` float32 file of unit-length
+    vectors plus a JSON sidecar with each row's chunk and document id, and
+    ``manifest.json`` names the current one. Readers map the file read-only,
+    so every process of the host shares the same page cache. `refresh` only
+    fetches the chunks of documents added, re-ingested or deleted since the
+    last generation, and re-maps the current one in a worker thread:
+    searches never touch the files themselves.
+    """
+
+    def __init__(self, directory: Path, dimension: int) -> None:
+        self._directory = directory
+        self._dimension = dimension
+        self._current: _Generation | None = None
+        directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def ready(self) -> bool:
+        return self._current is not None
+
+    async def reload(self) -> None:
+        """Map the current generation if the manifest changed."""
+        await asyncio.to_thread(self._load)
+
+    def search(
+        self,
+        embedding: Embedding,
+        top_k: int,
+        *,
+        min_score: float | None = None,
+        with_vectors: bool = False,
+    ) -> list[SnapshotHit]:
+        """Return the `top_k` rows closest to `embedding`, best first.
+
+        One matrix-vector product scores every row; `argpartition` picks the
+        top rows without sorting the rest. CPU-bound: call it off the loop.
+        """
+        generation = self._current
+        if generation is None or not generation.chunk_ids or top_k <= 0:
+            return []
+        query = np.frombuffer(embedding.vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if not norm:
+            return []
+        scores = generation.vectors @ (query / norm)
+
+        k = min(top_k, len(scores))
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        if min_score is not None:
+            top = top[scores[top] >= min_score]
+        return [
+            SnapshotHit(
+                chunk_id=generation.chunk_ids[row],
+                score=float(scores[row]),
+                embedding=(
+                    Embedding.from_buffer(np.array(generation.vectors[row]))
+                    if with_vectors
+                    else None
+                ),
+            )
+            for row in top
+        ]
+
+    async def refresh(self, session_factory: async_sessionmaker[AsyncSession]) -> bool:
+        """Write a new generation if documents changed; return whether one was written.
+
+        A document's version is its `updated_at` and `chunk_count`, which
+        both change when an ingestion or re-ingestion completes. Only one
+        process refreshes at a time; the others skip the round and only
+        `reload` the generation it wrote.
+        """
+        with self._refresh_lock() as acquired:
+            if not acquired:
+                await self.reload()
+                return False
+            current = await asyncio.to_thread(self._load)
+            known = current.documents if current is not None else {}
+            async with session_factory() as session:
+                versions = await _document_versions(session)
+                changed = {
+                    doc_id
+                    for doc_id, version in versions.items()
+                    if known.get(doc_id) != version
+                }
+                removed = known.keys() - versions.keys()
+                if current is not None and not changed and not removed:
+                    return False
+                await self._write(
+                    current, versions, _stream_embeddings(session, changed), changed
+                )
+        return True
+
+    async def _write(
+        self,
+        current: _Generation | None,
+        versions: dict[str, str],
+        fetched: AsyncIterator[list[tuple[str, str, bytes]]],
+        changed: set[str],
+    ) -> None:
+        number = current.number + 1 if current is not None else 1
+        vectors_name = f"vectors-{number}.f32"
+        ids_name = f"ids-{number}.json"
+        chunk_ids: list[str] = []
+        document_ids: list[str] = []
+
+        out = await asyncio.to_thread(open, self._directory / vectors_name, "wb")
+        try:
+            if current is not None:
+                kept = await asyncio.to_thread(
+                    _copy_kept_rows, out, current, versions, changed
+                )
+                chunk_ids.extend(current.chunk_ids[row] for row in kept)
+                document_ids.extend(current.document_ids[row] for row in kept)
+
+            async for batch in fetched:
+                rows = np.stack([_decode(data) for _, _, data in batch])
+                rows = rows.astype(np.float32)
+                norms = np.linalg.norm(rows, axis=1, keepdims=True)
+                rows = np.divide(rows, norms, out=np.zeros_like(rows), where=norms > 0)
+                await asyncio.to_thread(out.write, rows.tobytes())
+                chunk_ids.extend(chunk_id for chunk_id, _, _ in batch)
+                document_ids.extend(doc_id for _, doc_id, _ in batch)
+        finally:
+            await asyncio.to_thread(out.close)
+
+        sidecar = {
+            "chunk_ids": chunk_ids,
+            "document_ids": document_ids,
+            "documents": versions,
+        }
+        manifest = {
+            "generation": number,
+            "dimension": self._dimension,
+            "rows": len(chunk_ids),
+            "vectors": vectors_name,
+            "ids": ids_name,
+        }
+        await asyncio.to_thread(self._publish, number, sidecar, manifest)
+
+    def _publish(
+        self, number: int, sidecar: dict[str, object], manifest: dict[str, object]
+    ) -> None:
+        """Write the sidecar, switch the manifest to it and map the generation."""
+        (self._directory / f"ids-{number}.json").write_text(json.dumps(sidecar))
+        staging = self._directory / f"{_MANIFEST}.tmp"
+        staging.write_text(json.dumps(manifest))
+        os.replace(staging, self._directory / _MANIFEST)
+        self._remove_generations_before(number - 1)
+        self._load()
+
+    def _load(self) -> _Generation | None:
+        """Return the current generation, re-mapping it if the manifest changed."""
+        try:
+            stat = (self._directory / _MANIFEST).stat()
+        except FileNotFoundError:
+            return None
+        file_id = (stat.st_ino, stat.st_mtime_ns)
+        if self._current is not None and self._current.file_id == file_id:
+            return self._current
+        try:
+            self._current = self._open(file_id)
+        except FileNotFoundError:
+            # Replaced and cleaned up by a concurrent refresh; retry on next reload.
+            return self._current
+        return self._current
+
+    def _open(self, file_id: tuple[int, int]) -> _Generation:
+        manifest = json.loads((self._directory / _MANIFEST).read_text())
+        if manifest["dimension"] != self._dimension:
+            raise ValueError(
+                f"Snapshot dimension {manifest['dimension']} does not match "
+                f"{self._dimension}"
+            )
+        sidecar = json.loads((self._directory / manifest["ids"]).read_text())
+        shape = (manifest["rows"], self._dimension)
+        vectors = (
+            np.memmap(
+                self._directory / manifest["vectors"],
+                dtype=np.float32,
+                mode="r",
+                shape=shape,
+            )
+            if manifest["rows"]
+            else np.empty(shape, dtype=np.float32)
+        )
+        return _Generation(
+            file_id=file_id,
+            number=manifest["generation"],
+            vectors=vectors,
+            chunk_ids=sidecar["chunk_ids"],
+            document_ids=sidecar["document_ids"],
+            documents=sidecar["documents"],
+        )
+
+    def _remove_generations_before(self, number: int) -> None:
+        # The previous generation is kept for readers still opening it;
+        # mappings of deleted files stay valid until they are dropped.
+        for pattern in ("vectors-*.f32", "ids-*.json"):
+            for path in self._directory.glob(pattern):
+                generation = int(path.stem.split("-")[1])
+                if generation < number:
+                    path.unlink(missing_ok=True)
+
+    @contextmanager
+    def _refresh_lock(self) -> Iterator[bool]:
+        with open(self._directory / _LOCK, "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class VectorSnapshotRefresher:
+    """Refresh a `VectorSnapshot` every `interval` seconds in the background."""
+
+    def __init__(
+        self,
+        snapshot: VectorSnapshot,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        interval: float,
+    ) -> None:
+        self._snapshot = snapshot
+        self._session_factory = session_factory
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="vector-snapshot-refresh")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._snapshot.refresh(self._session_factory)
+            except Exception:
+                logger.exception("Vector snapshot refresh failed")
+            await asyncio.sleep(self._interval)
+
+
+async def _document_versions(session: AsyncSession) -> dict[str, str]:
+    result = await session.execute(
+        select(DocumentModel.id, DocumentModel.updated_at, DocumentModel.chunk_count)
+    )
+    return {
+        row.id: f"{row.updated_at.isoformat()}/{row.chunk_count}"
+        for row in result.all()
+    }
+
+
+async def _stream_embeddings(
+    session: AsyncSession, document_ids: set[str]
+) -> AsyncIterator[list[tuple[str, str, bytes]]]:
+    """Yield (chunk id, document id, pgvector bytes) of the given documents."""
+    if not document_ids:
+        return
+    stmt = (
+        select(
+            ChunkModel.id,
+            ChunkModel.document_id,
+            vector_send(ChunkModel.embedding).label("embedding"),
+        )
+        .where(
+            ChunkModel.document_id.in_(sorted(document_ids)),
+            ChunkModel.embedding.isnot(None),
+        )
+        .execution_options(yield_per=_FETCH_BATCH_ROWS)
+    )
+    result = await session.stream(stmt)
+    async for partition in result.partitions():
+        yield [(row.id, row.document_id, row.embedding) for row in partition]
+
+
+def _copy_kept_rows(
+    out: BinaryIO,
+    current: _Generation,
+    versions: dict[str, str],
+    changed: set[str],
+) -> np.ndarray:
+    """Copy the rows of unchanged documents to `out`; return their indexes."""
+    keep = np.fromiter(
+        (
+            doc_id in versions and doc_id not in changed
+            for doc_id in current.document_ids
+        ),
+        dtype=bool,
+        count=len(current.document_ids),
+    )
+    for start in range(0, len(keep), _COPY_BLOCK_ROWS):
+        block = slice(start, start + _COPY_BLOCK_ROWS)
+        out.write(current.vectors[block][keep[block]].tobytes())
+    return np.flatnonzero(keep)
+
+
+def _decode(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype=_PGVECTOR_DTYPE, offset=_PGVECTOR_HEADER_BYTES)
@@ -0,0 +1,97 @@
+import asyncio
+import re
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from documentor.domain.models.chunk import Embedding
+from documentor.infrastructure.cache import CacheStats
+
+_WHITESPACE = re.compile(r"\s+")
+# Per-entry bookkeeping beyond the float32 buffer: the key string, the
+# OrderedDict node, the Embedding and its memoryview.
+_ENTRY_OVERHEAD_BYTES = 400
+
+
+def normalize_query(text: str) -> str:
+    """Collapse whitespace and case so trivially different queries share a key."""
+    return _WHITESPACE.sub(" ", text).strip().casefold()
+
+
+@dataclass(frozen=True)
+class _Entry:
+    embedding: Embedding
+    expires_at: float
+    size: int
+
+
+class QueryEmbeddingCache:
+    """In-process LRU cache of query embeddings with a TTL and a memory bound.
+
+    Entries expire ``ttl`` seconds after they are stored, and the least
+    recently used entries are evicted once the estimated footprint exceeds
+    ``max_bytes``. With ``normalize``, keys are whitespace- and
+    case-normalized. Not shared between processes.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        ttl: float,
+        normalize: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._normalize = normalize
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self.stats = CacheStats()
+        # Embeddings being computed, so concurrent misses share one call.
+        self.in_flight: dict[str, asyncio.Task[Embedding]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def key(self, text: str) -> str:
+        return normalize_query(text) if self._normalize else text
+
+    def get(self, text: str) -> Embedding | None:
+        key = self.key(text)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self.stats.record(misses=1)
+            return None
+        self._entries.move_to_end(key)
+        self.stats.record(hits=1)
+        return entry.embedding
+
+    def put(self, text: str, embedding: Embedding) -> None:
+        key = self.key(text)
+        size = embedding.vector.nbytes + sys.getsizeof(key) + _ENTRY_OVERHEAD_BYTES
+        if size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(embedding, self._clock() + self._ttl, size)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key).size
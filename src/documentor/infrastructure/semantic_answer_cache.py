@@ -0,0 +1,111 @@
+import itertools
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from documentor.domain.models.answer import Answer
+from documentor.domain.models.chunk import Embedding
+from documentor.domain.services.answer_cache import AnswerCache, CachedAnswer
+from documentor.infrastructure.cache import CacheStats
+
+
+@dataclass(frozen=True)
+class _Entry:
+    embedding: Embedding
+    norm: float
+    cached: CachedAnswer
+    expires_at: float
+
+
+class SemanticAnswerCache(AnswerCache):
+    """In-process answer cache matched on question-embedding similarity.
+
+    A lookup returns the most similar unexpired entry whose cosine distance
+    to the query embedding is at most ``max_distance``. Entries expire after
+    ``ttl`` seconds and the least recently used are evicted beyond
+    ``max_entries``; an index from document id to entries makes
+    invalidation by document cheap. Lookups scan every entry, which is fine
+    for the few thousand entries this is sized for.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl: float,
+        max_distance: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._min_similarity = 1.0 - max_distance
+        self._clock = clock
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._by_document: dict[str, set[int]] = {}
+        self._ids = itertools.count()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def find_similar(self, embedding: Embedding) -> CachedAnswer | None:
+        now = self._clock()
+        norm = embedding.norm()
+        best_id: int | None = None
+        best_similarity = self._min_similarity
+        expired: list[int] = []
+        for entry_id, entry in self._entries.items():
+            if entry.expires_at <= now:
+                expired.append(entry_id)
+                continue
+            if entry.embedding.dimension != embedding.dimension:
+                continue
+            denominator = norm * entry.norm
+            if not denominator:
+                continue
+            similarity = embedding.dot(entry.embedding) / denominator
+            if similarity >= best_similarity:
+                best_id, best_similarity = entry_id, similarity
+        for entry_id in expired:
+            self._remove(entry_id)
+
+        if best_id is None:
+            self.stats.record(misses=1)
+            return None
+        self._entries.move_to_end(best_id)
+        self.stats.record(hits=1)
+        return self._entries[best_id].cached
+
+    async def store(
+        self,
+        embedding: Embedding,
+        answer: Answer,
+        document_ids: frozenset[str],
+        cached_at: datetime,
+    ) -> None:
+        entry_id = next(self._ids)
+        self._entries[entry_id] = _Entry(
+            embedding=embedding,
+            norm=embedding.norm(),
+            cached=CachedAnswer(answer, document_ids, cached_at),
+            expires_at=self._clock() + self._ttl,
+        )
+        for document_id in document_ids:
+            self._by_document.setdefault(document_id, set()).add(entry_id)
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+
+    async def invalidate_documents(self, document_ids: set[str]) -> None:
+        for document_id in document_ids:
+            for entry_id in list(self._by_document.get(document_id, ())):
+                self._remove(entry_id)
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        for document_id in entry.cached.document_ids:
+            ids = self._by_document[document_id]
+            ids.discard(entry_id)
+            if not ids:
+                del self._by_document[document_id]
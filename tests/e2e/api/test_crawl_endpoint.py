@@ -0,0 +1,86 @@
+import json
+from collections.abc import AsyncIterator
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from documentor.adapters.api.dependencies import get_crawl_documentation
+from documentor.adapters.api.main import create_app
+from documentor.application.dtos import CrawlDocumentationInput, CrawlPageResultDTO
+
+
+@pytest.fixture
+def mock_crawl_documentation() -> MagicMock:
+    mock = MagicMock()
+    mock.inputs = []
+
+    async def execute_stream(
+        input: CrawlDocumentationInput,
+    ) -> AsyncIterator[CrawlPageResultDTO]:
+        mock.inputs.append(input)
+        yield CrawlPageResultDTO(
+            url="https://example.com/docs/a",
+            status="ingested",
+            document_id="doc-1",
+            chunks_created=3,
+        )
+        yield CrawlPageResultDTO(
+            url="https://example.com/docs/b", status="failed", error="404"
+        )
+
+    mock.execute_stream = execute_stream
+    return mock
+
+
+@pytest_asyncio.fixture
+async def crawl_client(mock_crawl_documentation: MagicMock) -> AsyncClient:
+    app = create_app()
+    app.dependency_overrides[get_crawl_documentation] = lambda: (
+        mock_crawl_documentation
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_crawl_should_stream_one_ndjson_line_per_page(
+    crawl_client: AsyncClient, mock_crawl_documentation: MagicMock
+) -> None:
+    response = await crawl_client.post(
+        "/ingest/crawl",
+        json={"url": "https://example.com/sitemap.xml", "max_pages": 20},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["status"] for line in lines] == ["ingested", "failed"]
+    assert lines[0]["chunks_created"] == 3
+    assert lines[1]["error"] == "404"
+    [input_dto] = mock_crawl_documentation.inputs
+    assert input_dto.max_pages == 20
+    assert input_dto.on_duplicate == "skip"
+
+
+@pytest.mark.asyncio
+async def test_crawl_should_return_422_when_url_is_not_http(
+    crawl_client: AsyncClient,
+) -> None:
+    response = await crawl_client.post("/ingest/crawl", json={"url": "file:///etc"})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_crawl_should_return_422_when_max_pages_out_of_range(
+    crawl_client: AsyncClient,
+) -> None:
+    response = await crawl_client.post(
+        "/ingest/crawl", json={"url": "https://example.com/", "max_pages": 0}
+    )
+
+    assert response.status_code == 422
@@ -112,6 +112,21 @@ async def test_ingest_should_pass_on_duplicate_to_use_case(
     )
 
 
+@pytest.mark.asyncio
+async def test_ingest_should_pass_commit_mode_to_use_case(
+    client: AsyncClient,
+    mock_ingest_documentation: AsyncMock,
+) -> None:
+    response = await client.post(
+        "/ingest/url",
+        json={"source": "https://example.com/docs", "commit": "batched"},
+    )
+
+    assert response.status_code == 200
+    call_input = mock_ingest_documentation.execute.call_args[0][0]
+    assert call_input.commit == "batched"
+
+
 @pytest.mark.asyncio
 async def test_list_documents_should_return_documents(
     client: AsyncClient,
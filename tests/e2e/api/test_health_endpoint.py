@@ -8,3 +8,18 @@ async def test_health_should_return_ok(client: AsyncClient) -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_cache_health_should_report_null_when_caches_disabled(
+    client: AsyncClient,
+) -> None:
+    response = await client.get("/health/caches")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "query_embedding": None,
+        "embedding": None,
+        "rewrite": None,
+        "answer": None,
+    }
@@ -0,0 +1,136 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from documentor.adapters.api.dependencies import get_enqueue_ingestion, get_job_status
+from documentor.adapters.api.main import create_app
+from documentor.application.dtos import EnqueueIngestionInput, JobDTO
+from documentor.domain.exceptions import JobNotFoundError
+
+
+def _make_job(job_id: str = "job-1", source: str = "https://example.com/docs") -> JobDTO:
+    now = datetime(2024, 1, 1, tzinfo=UTC)
+    return JobDTO(
+        id=job_id,
+        source=source,
+        status="queued",
+        created_at=now,
+        updated_at=now,
+        attempts=0,
+        chunks_processed=0,
+        document_id=None,
+        error=None,
+    )
+
+
+@pytest.fixture
+def mock_enqueue_ingestion() -> AsyncMock:
+    mock = AsyncMock()
+    mock.execute.return_value = _make_job()
+    mock.execute_many.side_effect = lambda inputs: [
+        _make_job(f"job-{i}", item.source) for i, item in enumerate(inputs)
+    ]
+    return mock
+
+
+@pytest.fixture
+def mock_job_status() -> AsyncMock:
+    mock = AsyncMock()
+    mock.execute.return_value = _make_job()
+    return mock
+
+
+@pytest_asyncio.fixture
+async def jobs_client(
+    mock_enqueue_ingestion: AsyncMock, mock_job_status: AsyncMock
+) -> AsyncClient:
+    app = create_app()
+    app.dependency_overrides[get_enqueue_ingestion] = lambda: mock_enqueue_ingestion
+    app.dependency_overrides[get_job_status] = lambda: mock_job_status
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_enqueue_url_should_return_202_with_job_id(
+    jobs_client: AsyncClient,
+    mock_enqueue_ingestion: AsyncMock,
+) -> None:
+    response = await jobs_client.post(
+        "/jobs/url",
+        json={"source": "https://example.com/docs", "on_duplicate": "replace"},
+    )
+
+    assert response.status_code == 202
+    assert response.json()["id"] == "job-1"
+    assert response.json()["status"] == "queued"
+    mock_enqueue_ingestion.execute.assert_awaited_once_with(
+        EnqueueIngestionInput(source="https://example.com/docs", on_duplicate="replace")
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_batch_should_return_one_job_per_source(
+    jobs_client: AsyncClient,
+) -> None:
+    response = await jobs_client.post(
+        "/jobs/batch",
+        json={
+            "sources": [
+                {"source": "https://example.com/a"},
+                {"source": "https://example.com/b"},
+            ]
+        },
+    )
+
+    assert response.status_code == 202
+    assert [job["source"] for job in response.json()] == [
+        "https://example.com/a",
+        "https://example.com/b",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_batch_should_return_422_when_source_invalid(
+    jobs_client: AsyncClient,
+) -> None:
+    response = await jobs_client.post(
+        "/jobs/batch", json={"sources": [{"source": "ftp://example.com/a"}]}
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_enqueue_file_should_store_upload_in_job(
+    jobs_client: AsyncClient,
+    mock_enqueue_ingestion: AsyncMock,
+) -> None:
+    response = await jobs_client.post(
+        "/jobs/file",
+        files={"file": ("guide.md", b"# Guide\n\nHello", "text/markdown")},
+    )
+
+    assert response.status_code == 202
+    enqueued = mock_enqueue_ingestion.execute.call_args[0][0]
+    assert enqueued.filename == "guide.md"
+    assert enqueued.payload == b"# Guide\n\nHello"
+    assert enqueued.source.startswith("sha256:")
+
+
+@pytest.mark.asyncio
+async def test_get_job_should_return_404_when_job_missing(
+    jobs_client: AsyncClient,
+    mock_job_status: AsyncMock,
+) -> None:
+    mock_job_status.execute.side_effect = JobNotFoundError("missing")
+
+    response = await jobs_client.get("/jobs/missing")
+
+    assert response.status_code == 404
+    assert "missing" in response.json()["detail"]
@@ -1,11 +1,20 @@
+import json
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock
 
 import pytest
 from httpx import AsyncClient
 
-from documentor.application.dtos import AskQuestionInput
+from documentor.application.dtos import (
+    AnswerDTO,
+    AskQuestionBatchInput,
+    AskQuestionInput,
+    BatchAnswerDTO,
+)
 from documentor.domain.exceptions import LLMGenerationError
+from documentor.domain.models.chunk import SearchFilter
 from documentor.domain.models.conversation import ConversationMessage
+from documentor.domain.models.document import SourceType
 
 
 @pytest.mark.asyncio
@@ -106,3 +115,89 @@ async def test_ask_should_return_422_when_history_message_has_empty_content(
     )
 
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_ask_should_pass_search_filters_to_use_case(
+    client: AsyncClient,
+    mock_ask_question: AsyncMock,
+) -> None:
+    response = await client.post(
+        "/ask",
+        json={
+            "question": "How do I configure it?",
+            "filters": {
+                "document_ids": ["doc-1"],
+                "source_types": ["url"],
+                "source_prefix": "https://docs.example.com/",
+            },
+        },
+    )
+
+    assert response.status_code == 200
+    mock_ask_question.execute.assert_called_once_with(
+        AskQuestionInput(
+            question_text="How do I configure it?",
+            search_filter=SearchFilter(
+                document_ids=frozenset({"doc-1"}),
+                source_types=frozenset({SourceType.URL}),
+                source_prefix="https://docs.example.com/",
+            ),
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_ask_should_return_422_when_filter_source_type_is_unknown(
+    client: AsyncClient,
+) -> None:
+    response = await client.post(
+        "/ask",
+        json={"question": "What?", "filters": {"source_types": ["ftp"]}},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_ask_batch_should_stream_one_ndjson_line_per_answer(
+    client: AsyncClient,
+    mock_ask_question: AsyncMock,
+) -> None:
+    inputs: list[AskQuestionBatchInput] = []
+
+    async def execute_batch(
+        input: AskQuestionBatchInput,
+    ) -> AsyncIterator[BatchAnswerDTO]:
+        inputs.append(input)
+        yield BatchAnswerDTO(index=1, answer=AnswerDTO(text="Second", sources=[]))
+        yield BatchAnswerDTO(index=0, error="LLM service unavailable")
+
+    mock_ask_question.execute_batch = execute_batch
+
+    response = await client.post(
+        "/ask/batch",
+        json={"questions": ["First?", "Second?"], "filters": {"source_types": ["url"]}},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"index": 1, "answer": {"text": "Second", "sources": []}, "error": None},
+        {"index": 0, "answer": None, "error": "LLM service unavailable"},
+    ]
+    assert inputs == [
+        AskQuestionBatchInput(
+            questions=("First?", "Second?"),
+            search_filter=SearchFilter(source_types=frozenset({SourceType.URL})),
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ask_batch_should_return_422_when_a_question_is_empty(
+    client: AsyncClient,
+) -> None:
+    response = await client.post("/ask/batch", json={"questions": ["Fine?", ""]})
+
+    assert response.status_code == 422
@@ -0,0 +1,60 @@
+import re
+from collections.abc import Sequence
+from datetime import datetime
+
+from documentor.domain.models.answer import Answer
+from documentor.domain.models.chunk import Embedding
+from documentor.domain.services.answer_cache import AnswerCache, CachedAnswer
+from documentor.domain.services.tokenizer import Tokenizer
+
+# Newlines split off as their own tokens, as in tiktoken's pre-tokenizer.
+_PIECE_PATTERN = re.compile(r"[\r\n]+|[^\S\r\n]*\S+|\s+")
+
+
+class WordTokenizer(Tokenizer):
+    """Deterministic stand-in for tiktoken: one token per word, leading whitespace included."""
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._pieces: list[str] = []
+
+    def encode(self, text: str) -> list[int]:
+        tokens: list[int] = []
+        for piece in _PIECE_PATTERN.findall(text):
+            if piece not in self._ids:
+                self._ids[piece] = len(self._pieces)
+                self._pieces.append(piece)
+            tokens.append(self._ids[piece])
+        return tokens
+
+    def decode(self, tokens: Sequence[int]) -> str:
+        return "".join(self._pieces[token] for token in tokens)
+
+
+class ListAnswerCache(AnswerCache):
+    """Answer cache over a plain list, matching at cosine similarity >= 0.99."""
+
+    def __init__(self) -> None:
+        self.entries: list[tuple[Embedding, CachedAnswer]] = []
+
+    async def find_similar(self, embedding: Embedding) -> CachedAnswer | None:
+        for cached_embedding, cached in self.entries:
+            if embedding.cosine_similarity(cached_embedding) >= 0.99:
+                return cached
+        return None
+
+    async def store(
+        self,
+        embedding: Embedding,
+        answer: Answer,
+        document_ids: frozenset[str],
+        cached_at: datetime,
+    ) -> None:
+        self.entries.append((embedding, CachedAnswer(answer, document_ids, cached_at)))
+
+    async def invalidate_documents(self, document_ids: set[str]) -> None:
+        self.entries = [
+            (embedding, cached)
+            for embedding, cached in self.entries
+            if not cached.document_ids & document_ids
+        ]
@@ -1,8 +1,16 @@
+import random
+
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from documentor.domain.models.chunk import Chunk, ChunkContent, Embedding
+from documentor.domain.models.chunk import (
+    Chunk,
+    ChunkContent,
+    Embedding,
+    SearchFilter,
+    SearchProfile,
+)
 from documentor.domain.models.document import Document, SourceType
 from documentor.infrastructure.persistence.pg_chunk_repository import (
     PgChunkRepository,
@@ -23,7 +31,7 @@ def _make_embedding(weight: float) -> Embedding:
     vector = [0.0] * DIMENSION
     vector[0] = weight
     vector[1] = 1.0 - weight
-    return Embedding(vector=tuple(vector), dimension=DIMENSION)
+    return Embedding.from_list(vector)
 
 
 @pytest_asyncio.fixture
@@ -154,3 +162,381 @@ async def test_search_similar_should_return_empty_when_no_chunks(
     results = await repository.search_similar(query_embedding, top_k=5)
 
     assert results == []
+
+
+@pytest.mark.asyncio
+async def test_retrieve_should_return_projected_hits_with_document_title(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+) -> None:
+    chunks = [
+        Chunk(
+            id=f"chunk-retrieve-{i}",
+            document_id=document.id,
+            content=ChunkContent(text=f"Retrieved {i}", token_count=4),
+            position=i,
+            embedding=_make_embedding(float(i) / 10),
+        )
+        for i in range(4)
+    ]
+    await repository.save_all(chunks)
+    await session.commit()
+
+    results = await repository.retrieve(_make_embedding(1.0), top_k=2)
+
+    assert [r.chunk.id for r in results] == ["chunk-retrieve-3", "chunk-retrieve-2"]
+    assert results[0].score > results[1].score
+    assert all(r.document_title == "Test Doc" for r in results)
+    assert all(r.chunk.embedding is None for r in results)
+    assert results[0].chunk.content == ChunkContent(text="Retrieved 3", token_count=4)
+
+
+@pytest.mark.asyncio
+async def test_retrieve_should_load_embeddings_when_asked(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+) -> None:
+    embedding = _make_embedding(0.7)
+    await repository.save_all(
+        [
+            Chunk(
+                id="chunk-with-vector",
+                document_id=document.id,
+                content=ChunkContent(text="With vector", token_count=2),
+                position=0,
+                embedding=embedding,
+            )
+        ]
+    )
+    await session.commit()
+
+    [result] = await repository.retrieve(
+        _make_embedding(1.0), top_k=1, with_embeddings=True
+    )
+
+    assert result.chunk.embedding == embedding
+    assert result.document_title == "Test Doc"
+
+
+@pytest.mark.asyncio
+async def test_retrieve_should_apply_profile_min_score_in_query(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+) -> None:
+    chunks = [
+        Chunk(
+            id=f"chunk-profile-{i}",
+            document_id=document.id,
+            content=ChunkContent(text=f"Profile {i}", token_count=4),
+            position=i,
+            embedding=_make_embedding(float(i) / 10),
+        )
+        for i in range(4)
+    ]
+    await repository.save_all(chunks)
+    await session.commit()
+    query = _make_embedding(0.3)
+    [best, *_] = await repository.retrieve(query, top_k=4)
+
+    results = await repository.retrieve(
+        query,
+        top_k=4,
+        profile=SearchProfile(
+            ef_search=100,
+            iterative_scan="relaxed_order",
+            min_score=best.score - 1e-6,
+        ),
+    )
+
+    assert [r.chunk.id for r in results] == [best.chunk.id]
+
+
+def _clustered_embeddings(
+    rng: random.Random, clusters: int, size: int
+) -> tuple[list[list[float]], list[list[float]]]:
+    """`size` noisy points around each of `clusters` random centres."""
+    centres = [[rng.gauss(0, 1) for _ in range(DIMENSION)] for _ in range(clusters)]
+    points = [
+        [value + rng.gauss(0, 0.3) for value in centre]
+        for centre in centres
+        for _ in range(size)
+    ]
+    return centres, points
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("first_pass", ["halfvec", "bit", "short"])
+async def test_retrieve_should_match_exact_results_after_quantized_first_pass(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+    first_pass: str,
+) -> None:
+    centres, points = _clustered_embeddings(random.Random(0), clusters=10, size=8)
+    await repository.save_all(
+        [
+            Chunk(
+                id=f"chunk-quantized-{i}",
+                document_id=document.id,
+                content=ChunkContent(text=f"Point {i}", token_count=2),
+                position=i,
+                embedding=Embedding.from_list(point),
+            )
+            for i, point in enumerate(points)
+        ]
+    )
+    await session.commit()
+
+    recalls = []
+    for centre in centres:
+        query = Embedding.from_list(centre)
+        exact = await repository.retrieve(
+            query, profile=SearchProfile(first_pass="exact")
+        )
+        quantized = await repository.retrieve(
+            query, profile=SearchProfile(first_pass=first_pass, rerank_candidates=20)
+        )
+        found = {r.chunk.id for r in quantized} & {r.chunk.id for r in exact}
+        recalls.append(len(found) / len(exact))
+
+    assert sum(recalls) / len(recalls) >= 0.9
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("first_pass", ["exact", "halfvec", "bit", "short"])
+async def test_retrieve_batch_should_match_one_retrieve_per_embedding(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+    first_pass: str,
+) -> None:
+    centres, points = _clustered_embeddings(random.Random(1), clusters=4, size=6)
+    await repository.save_all(
+        [
+            Chunk(
+                id=f"chunk-batch-{i}",
+                document_id=document.id,
+                content=ChunkContent(text=f"Point {i}", token_count=2),
+                position=i,
+                embedding=Embedding.from_list(point),
+            )
+            for i, point in enumerate(points)
+        ]
+    )
+    await session.commit()
+    queries = [Embedding.from_list(centre) for centre in centres]
+    profile = SearchProfile(first_pass=first_pass, rerank_candidates=20)
+
+    batches = await repository.retrieve_batch(queries, top_k=3, profile=profile)
+
+    assert len(batches) == len(queries)
+    for query, batch in zip(queries, batches, strict=True):
+        single = await repository.retrieve(query, top_k=3, profile=profile)
+        assert [r.chunk.id for r in batch] == [r.chunk.id for r in single]
+        assert [r.score for r in batch] == pytest.approx([r.score for r in single])
+        assert all(r.document_title == "Test Doc" for r in batch)
+
+
+@pytest.mark.asyncio
+async def test_retrieve_batch_should_return_empty_lists_for_unmatched_filter(
+    repository: PgChunkRepository,
+) -> None:
+    batches = await repository.retrieve_batch(
+        [_make_embedding(1.0), _make_embedding(0.0)],
+        search_filter=SearchFilter(document_ids=frozenset({"missing"})),
+    )
+
+    assert batches == [[], []]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_should_only_return_chunks_of_filtered_documents(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+) -> None:
+    other = Document.create(
+        source="https://other.example.org/guide",
+        title="Other Doc",
+        source_type=SourceType.URL,
+        chunk_count=2,
+    )
+    await PgDocumentRepository(session).save(other)
+    chunks = [
+        Chunk(
+            id=f"chunk-filter-{doc.title}-{i}",
+            document_id=doc.id,
+            content=ChunkContent(text=f"{doc.title} {i}", token_count=3),
+            position=i,
+            embedding=_make_embedding(0.5 + i / 10),
+        )
+        for doc in (document, other)
+        for i in range(2)
+    ]
+    await repository.save_all(chunks)
+    await session.commit()
+    query = _make_embedding(0.5)
+
+    by_id = await repository.retrieve(
+        query, search_filter=SearchFilter(document_ids=frozenset({other.id}))
+    )
+    by_prefix = await repository.retrieve(
+        query, search_filter=SearchFilter(source_prefix="https://example.com/")
+    )
+    by_type = await repository.retrieve(
+        query, search_filter=SearchFilter(source_types=frozenset({SourceType.FILE}))
+    )
+
+    assert {r.document_title for r in by_id} == {"Other Doc"}
+    assert len(by_id) == 2
+    assert {r.document_title for r in by_prefix} == {"Test Doc"}
+    assert by_type == []
+
+
+@pytest.mark.asyncio
+async def test_search_fulltext_should_rank_chunks_matching_more_terms_first(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+) -> None:
+    texts = [
+        "Set ERR_POOL_EXHAUSTED handling in the connection pool",
+        "The connection pool is configured at startup",
+        "Unrelated text about templates",
+    ]
+    chunks = [
+        Chunk(
+            id=f"chunk-fulltext-{i}",
+            document_id=document.id,
+            content=ChunkContent(text=text, token_count=8),
+            position=i,
+            embedding=_make_embedding(0.1),
+        )
+        for i, text in enumerate(texts)
+    ]
+    await repository.save_all(chunks)
+    await session.commit()
+
+    results = await repository.search_fulltext(
+        "what does err_pool_exhausted mean for the pool?", top_k=5
+    )
+
+    assert [r.chunk.id for r in results] == ["chunk-fulltext-0", "chunk-fulltext-1"]
+    assert all(0.0 < r.score < 1.0 for r in results)
+    assert all(r.document_title == "Test Doc" for r in results)
+    assert all(r.chunk.embedding is None for r in results)
+    assert await repository.search_fulltext("?!") == []
+
+    with_embeddings = await repository.search_fulltext(
+        "err_pool_exhausted", top_k=1, with_embeddings=True
+    )
+    assert with_embeddings[0].chunk.embedding == _make_embedding(0.1)
+
+
+@pytest.mark.asyncio
+async def test_find_by_document_id_should_return_chunks_ordered_by_position(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+) -> None:
+    chunks = [
+        Chunk(
+            id=f"chunk-doc-{i}",
+            document_id=document.id,
+            content=ChunkContent(text=f"Chunk {i}", token_count=5),
+            position=position,
+            embedding=_make_embedding(0.5),
+        )
+        for i, position in enumerate([2, 0, 1])
+    ]
+    await repository.save_all(chunks)
+    await session.commit()
+
+    found = await repository.find_by_document_id(document.id)
+
+    assert [chunk.id for chunk in found] == [
+        "chunk-doc-1",
+        "chunk-doc-2",
+        "chunk-doc-0",
+    ]
+    assert all(chunk.embedding is None for chunk in found)
+
+
+@pytest.mark.asyncio
+async def test_update_positions_and_delete_by_ids_should_modify_only_given_chunks(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+) -> None:
+    chunks = [
+        Chunk(
+            id=f"chunk-diff-{i}",
+            document_id=document.id,
+            content=ChunkContent(text=f"Chunk {i}", token_count=5),
+            position=i,
+            embedding=_make_embedding(0.5),
+        )
+        for i in range(3)
+    ]
+    await repository.save_all(chunks)
+    await session.commit()
+
+    await repository.delete_by_ids({"chunk-diff-0"})
+    await repository.update_positions({"chunk-diff-1": 0, "chunk-diff-2": 1})
+    await session.commit()
+
+    found = await repository.find_by_document_id(document.id)
+    assert [(chunk.id, chunk.position) for chunk in found] == [
+        ("chunk-diff-1", 0),
+        ("chunk-diff-2", 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_save_all_should_insert_every_batch_within_one_transaction(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+) -> None:
+    batches = [
+        [
+            Chunk(
+                id=f"chunk-batch-{batch}-{i}",
+                document_id=document.id,
+                content=ChunkContent(text=f"Batch {batch} chunk {i}", token_count=5),
+                position=batch * 2 + i,
+                embedding=_make_embedding(0.5),
+            )
+            for i in range(2)
+        ]
+        for batch in range(2)
+    ]
+    for batch in batches:
+        await repository.save_all(batch)
+    await session.commit()
+
+    found = await repository.find_by_document_id(document.id)
+    assert [chunk.position for chunk in found] == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_save_all_should_discard_chunks_when_transaction_rolls_back(
+    repository: PgChunkRepository,
+    document: Document,
+    session: AsyncSession,
+) -> None:
+    chunk = Chunk(
+        id="chunk-rollback",
+        document_id=document.id,
+        content=ChunkContent(text="Rolled back", token_count=5),
+        position=0,
+        embedding=_make_embedding(0.5),
+    )
+
+    await repository.save_all([chunk])
+    await session.rollback()
+
+    assert await repository.find_by_document_id(document.id) == []
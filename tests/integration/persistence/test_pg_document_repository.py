@@ -115,3 +115,32 @@ async def test_list_all_should_return_all_saved_documents(
     ids = {d.id for d in documents}
     assert doc1.id in ids
     assert doc2.id in ids
+
+
+@pytest.mark.asyncio
+async def test_update_should_persist_changed_fields_and_keep_id(
+    repository: PgDocumentRepository,
+    session: AsyncSession,
+) -> None:
+    document = Document.create(
+        source="https://example.com/update",
+        title="Old Title",
+        source_type=SourceType.URL,
+        chunk_count=2,
+    )
+    await repository.save(document)
+    await session.commit()
+
+    document.title = "New Title"
+    document.chunk_count = 7
+    document.touch()
+    await repository.update(document)
+    await session.commit()
+    session.expire_all()
+
+    found = await repository.find_by_id(document.id)
+    assert found is not None
+    assert found.title == "New Title"
+    assert found.chunk_count == 7
+    assert found.created_at == document.created_at
+    assert found.updated_at == document.updated_at
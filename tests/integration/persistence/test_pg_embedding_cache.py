@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from documentor.domain.models.chunk import Embedding
+from documentor.infrastructure.persistence.orm_models import EmbeddingCacheModel
+from documentor.infrastructure.persistence.pg_embedding_cache import PgEmbeddingCache
+
+DIMENSION = 1536
+
+
+def _make_embedding(value: float) -> Embedding:
+    vector = [0.0] * DIMENSION
+    vector[0] = value
+    return Embedding.from_list(vector)
+
+
+async def _count_rows(session_factory: async_sessionmaker[AsyncSession]) -> int:
+    async with session_factory() as session:
+        result = await session.execute(
+            select(func.count()).select_from(EmbeddingCacheModel)
+        )
+        return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_put_many_then_get_many_should_round_trip_embeddings(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    cache = PgEmbeddingCache(session_factory)
+
+    await cache.put_many("model-a", {"h1": _make_embedding(0.5)})
+    found = await cache.get_many("model-a", {"h1", "h2"})
+
+    assert set(found) == {"h1"}
+    assert found["h1"].vector[0] == pytest.approx(0.5)
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_get_many_should_isolate_entries_by_model(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    cache = PgEmbeddingCache(session_factory)
+
+    await cache.put_many("model-a", {"h1": _make_embedding(0.5)})
+
+    assert await cache.get_many("model-b", {"h1"}) == {}
+
+
+@pytest.mark.asyncio
+async def test_put_many_should_ignore_existing_entries(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    cache = PgEmbeddingCache(session_factory)
+
+    await cache.put_many("model-a", {"h1": _make_embedding(0.5)})
+    await cache.put_many("model-a", {"h1": _make_embedding(0.9)})
+
+    found = await cache.get_many("model-a", {"h1"})
+    assert found["h1"].vector[0] == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_evict_should_drop_entries_beyond_max_entries(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    cache = PgEmbeddingCache(session_factory, max_entries=2, eviction_interval=3)
+
+    await cache.put_many(
+        "model-a",
+        {f"h{i}": _make_embedding(float(i) / 10) for i in range(3)},
+    )
+
+    assert await _count_rows(session_factory) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_many_should_ignore_entries_older_than_max_age(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    cache = PgEmbeddingCache(session_factory, max_age=timedelta(days=1))
+    await cache.put_many("model-a", {"h1": _make_embedding(0.5)})
+    async with session_factory() as session:
+        await session.execute(
+            update(EmbeddingCacheModel).values(
+                created_at=func.now() - timedelta(days=2)
+            )
+        )
+        await session.commit()
+
+    assert await cache.get_many("model-a", {"h1"}) == {}
+
+    await cache.evict()
+    assert await _count_rows(session_factory) == 0
@@ -0,0 +1,144 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from documentor.domain.models.ingestion_job import IngestionJob, JobStatus
+from documentor.infrastructure.persistence.orm_models import IngestionJobModel
+from documentor.infrastructure.persistence.pg_job_repository import PgJobRepository
+
+LEASE = timedelta(minutes=5)
+
+
+async def _save(
+    session_factory: async_sessionmaker[AsyncSession], *jobs: IngestionJob
+) -> None:
+    async with session_factory() as session:
+        repository = PgJobRepository(session)
+        for job in jobs:
+            await repository.save(job)
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_save_should_persist_file_job_when_valid(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    job = IngestionJob.create(
+        source="sha256:abc", commit="batched", filename="a.md", payload=b"# A"
+    )
+    await _save(session_factory, job)
+
+    async with session_factory() as session:
+        found = await PgJobRepository(session).find_by_id(job.id)
+
+    assert found is not None
+    assert found.status == JobStatus.QUEUED
+    assert found.commit == "batched"
+    assert found.filename == "a.md"
+    assert found.payload == b"# A"
+
+
+@pytest.mark.asyncio
+async def test_claim_next_should_skip_jobs_locked_by_another_worker(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    first = IngestionJob.create(source="https://example.com/a")
+    second = IngestionJob.create(source="https://example.com/b")
+    await _save(session_factory, first, second)
+
+    async with session_factory() as a, session_factory() as b:
+        claimed_a = await PgJobRepository(a).claim_next(LEASE)
+        claimed_b = await PgJobRepository(b).claim_next(LEASE)
+        await a.commit()
+        await b.commit()
+
+    assert claimed_a is not None and claimed_b is not None
+    assert {claimed_a.id, claimed_b.id} == {first.id, second.id}
+    assert claimed_a.status == JobStatus.RUNNING
+    assert claimed_a.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_claim_next_should_reclaim_running_job_when_lease_expired(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    job = IngestionJob.create(source="https://example.com/a")
+    await _save(session_factory, job)
+
+    async with session_factory() as session:
+        repository = PgJobRepository(session)
+        assert await repository.claim_next(LEASE) is not None
+        await session.commit()
+        assert await repository.claim_next(LEASE) is None
+        await session.execute(
+            update(IngestionJobModel).values(
+                locked_until=IngestionJobModel.locked_until - timedelta(hours=1)
+            )
+        )
+        reclaimed = await repository.claim_next(LEASE)
+        await session.commit()
+
+    assert reclaimed is not None
+    assert reclaimed.id == job.id
+    assert reclaimed.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_update_should_drop_payload_when_job_finished(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    job = IngestionJob.create(source="sha256:abc", filename="a.md", payload=b"# A")
+    await _save(session_factory, job)
+
+    async with session_factory() as session:
+        repository = PgJobRepository(session)
+        assert await repository.record_progress(job, 3, LEASE)
+        job.succeed("doc-1", chunks_processed=5)
+        await repository.update(job)
+        await session.commit()
+
+    async with session_factory() as session:
+        found = await PgJobRepository(session).find_by_id(job.id)
+
+    assert found is not None
+    assert found.status == JobStatus.SUCCEEDED
+    assert found.chunks_processed == 5
+    assert found.document_id == "doc-1"
+    assert found.payload is None
+
+
+@pytest.mark.asyncio
+async def test_update_should_ignore_worker_whose_claim_was_taken_over(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _save(session_factory, IngestionJob.create(source="https://example.com/a"))
+
+    async with session_factory() as session:
+        repository = PgJobRepository(session)
+        stale = await repository.claim_next(LEASE)
+        assert stale is not None
+        await session.execute(
+            update(IngestionJobModel).values(
+                locked_until=IngestionJobModel.locked_until - timedelta(hours=1)
+            )
+        )
+        current = await repository.claim_next(LEASE)
+        assert current is not None
+        await session.commit()
+
+        assert not await repository.renew_lease(stale, LEASE)
+        assert not await repository.record_progress(stale, 7, LEASE)
+        stale.fail("Unexpected error during ingestion")
+        await repository.update(stale)
+        assert await repository.renew_lease(current, LEASE)
+        await session.commit()
+
+    async with session_factory() as session:
+        found = await PgJobRepository(session).find_by_id(current.id)
+
+    assert found is not None
+    assert found.status == JobStatus.RUNNING
+    assert found.attempts == 2
+    assert found.chunks_processed == 0
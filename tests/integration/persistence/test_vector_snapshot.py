@@ -0,0 +1,138 @@
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from documentor.domain.models.chunk import Chunk, ChunkContent, Embedding
+from documentor.domain.models.document import Document, SourceType
+from documentor.infrastructure.persistence.pg_chunk_repository import (
+    PgChunkRepository,
+)
+from documentor.infrastructure.persistence.pg_document_repository import (
+    PgDocumentRepository,
+)
+from documentor.infrastructure.persistence.vector_snapshot import VectorSnapshot
+
+DIMENSION = 1536
+
+
+def _axis_embedding(axis: int) -> Embedding:
+    vector = [0.0] * DIMENSION
+    vector[axis] = 1.0
+    return Embedding.from_list(vector)
+
+
+async def _ingest(
+    session_factory: async_sessionmaker[AsyncSession], source: str, axes: list[int]
+) -> Document:
+    async with session_factory() as session:
+        document = Document.create(
+            source=source,
+            title=source,
+            source_type=SourceType.URL,
+            chunk_count=len(axes),
+        )
+        await PgDocumentRepository(session).save(document)
+        await PgChunkRepository(session).save_all(
+            [
+                Chunk(
+                    id=f"{source}-{axis}",
+                    document_id=document.id,
+                    content=ChunkContent(text=f"Chunk on axis {axis}", token_count=4),
+                    position=position,
+                    embedding=_axis_embedding(axis),
+                )
+                for position, axis in enumerate(axes)
+            ]
+        )
+        await session.commit()
+    return document
+
+
+@pytest_asyncio.fixture
+async def snapshot(tmp_path: Path) -> VectorSnapshot:
+    return VectorSnapshot(tmp_path, DIMENSION)
+
+
+@pytest.mark.asyncio
+async def test_refresh_should_make_chunks_searchable(
+    snapshot: VectorSnapshot,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _ingest(session_factory, "doc-a", [0, 1, 2])
+
+    assert not snapshot.ready
+    assert await snapshot.refresh(session_factory)
+
+    hits = snapshot.search(_axis_embedding(1), top_k=2)
+    assert hits[0].chunk_id == "doc-a-1"
+    assert hits[0].score == pytest.approx(1.0)
+    assert hits[1].score == pytest.approx(0.0)
+
+
+@pytest.mark.asyncio
+async def test_refresh_should_skip_when_nothing_changed(
+    snapshot: VectorSnapshot,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _ingest(session_factory, "doc-a", [0])
+    await snapshot.refresh(session_factory)
+
+    assert not await snapshot.refresh(session_factory)
+
+
+@pytest.mark.asyncio
+async def test_refresh_should_apply_added_and_deleted_documents(
+    snapshot: VectorSnapshot,
+    session_factory: async_sessionmaker[AsyncSession],
+    tmp_path: Path,
+) -> None:
+    first = await _ingest(session_factory, "doc-a", [0, 1])
+    await snapshot.refresh(session_factory)
+
+    await _ingest(session_factory, "doc-b", [2])
+    async with session_factory() as session:
+        await PgDocumentRepository(session).delete(first.id)
+        await session.commit()
+    assert await snapshot.refresh(session_factory)
+
+    reader = VectorSnapshot(tmp_path, DIMENSION)
+    assert not reader.ready
+    await reader.reload()
+    hits = reader.search(_axis_embedding(2), top_k=5)
+    assert [hit.chunk_id for hit in hits] == ["doc-b-2"]
+
+
+@pytest.mark.asyncio
+async def test_search_should_apply_min_score_and_return_vectors(
+    snapshot: VectorSnapshot,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _ingest(session_factory, "doc-a", [0, 1])
+    await snapshot.refresh(session_factory)
+
+    hits = snapshot.search(
+        _axis_embedding(0), top_k=5, min_score=0.5, with_vectors=True
+    )
+
+    assert [hit.chunk_id for hit in hits] == ["doc-a-0"]
+    assert hits[0].embedding == _axis_embedding(0)
+
+
+@pytest.mark.asyncio
+async def test_find_retrieved_should_order_by_score_and_skip_missing_ids(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _ingest(session_factory, "doc-a", [0, 1])
+
+    async with session_factory() as session:
+        results = await PgChunkRepository(session).find_retrieved(
+            {"doc-a-0": 0.2, "doc-a-1": 0.9, "missing": 1.0}
+        )
+
+    assert [(r.chunk.id, r.score) for r in results] == [
+        ("doc-a-1", 0.9),
+        ("doc-a-0", 0.2),
+    ]
+    assert results[0].document_title == "doc-a"
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -7,7 +7,9 @@ from documentor.application.use_cases.ingest_documentation import IngestDocument
 from documentor.domain.models.chunk import Embedding
 from documentor.domain.models.document import SourceType
 from documentor.domain.services.document_loader_service import LoadedDocument
+from documentor.domain.services.text_chunker import TextChunker
 from documentor.infrastructure.persistence.pg_unit_of_work import PgUnitOfWork
+from tests.fakes import WordTokenizer
 
 
 @pytest.mark.asyncio
@@ -24,7 +26,6 @@ async def test_ingest_should_save_document_and_chunks_when_using_real_db(
     embedding = Embedding.from_list([0.1] * 1536)
     embedding_service = AsyncMock()
     embedding_service.embed_batch.return_value = [embedding]
-    embedding_service.count_tokens = Mock(return_value=100)
 
     uow = PgUnitOfWork(session_factory)
 
@@ -32,6 +33,7 @@ async def test_ingest_should_save_document_and_chunks_when_using_real_db(
         loader=loader,
         embedding_service=embedding_service,
         uow=uow,
+        chunker=TextChunker(WordTokenizer()),
     )
 
     result = await use_case.execute(
@@ -0,0 +1,23 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from documentor.adapters.worker.pool import IngestionWorkerPool
+
+
+@pytest.mark.asyncio
+async def test_pool_should_keep_processing_until_queue_is_empty() -> None:
+    process = AsyncMock()
+    process.execute.side_effect = ["job-1", RuntimeError("db down"), "job-2"] + [
+        None
+    ] * 100
+    pool = IngestionWorkerPool(
+        Mock(return_value=process), workers=1, poll_interval=0.01
+    )
+
+    pool.start()
+    await asyncio.sleep(0.05)
+    await pool.stop()
+
+    assert process.execute.await_count >= 4
@@ -1,14 +1,27 @@
+import asyncio
 from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from documentor.application.dtos import AskQuestionInput
+from documentor.application.dtos import AskQuestionBatchInput, AskQuestionInput
 from documentor.application.use_cases.ask_question import AskQuestion
-from documentor.domain.exceptions import InvalidQuestionError
-from documentor.domain.models.chunk import Chunk, ChunkContent, Embedding
+from documentor.domain.exceptions import InvalidQuestionError, LLMGenerationError
+from documentor.domain.models.chunk import (
+    Chunk,
+    ChunkContent,
+    Embedding,
+    RetrievedChunk,
+    SearchFilter,
+    SearchProfile,
+)
 from documentor.domain.models.conversation import ConversationMessage
 from documentor.domain.models.document import Document, SourceType
+from tests.fakes import ListAnswerCache
+
+
+def _hit(chunk: Chunk, score: float) -> RetrievedChunk:
+    return RetrievedChunk(chunk=chunk, score=score, document_title="Python Docs")
 
 
 @pytest.fixture
@@ -50,7 +63,7 @@ def llm_service() -> AsyncMock:
 def uow(sample_chunk: Chunk, sample_document: Document) -> AsyncMock:
     mock = AsyncMock()
     mock.__aenter__.return_value = mock
-    mock.chunks.search_similar.return_value = [(sample_chunk, 0.95)]
+    mock.chunks.retrieve.return_value = [_hit(sample_chunk, 0.95)]
     mock.documents.find_by_ids.return_value = {
         sample_chunk.document_id: sample_document
     }
@@ -95,8 +108,8 @@ async def test_execute_should_embed_question_and_search_chunks_when_asking(
     await use_case.execute(input_dto)
 
     embedding_service.embed.assert_awaited_once_with("What is Python?")
-    uow.chunks.search_similar.assert_awaited_once()
-    call_args = uow.chunks.search_similar.call_args
+    uow.chunks.retrieve.assert_awaited_once()
+    call_args = uow.chunks.retrieve.call_args
     assert call_args[0][0] == Embedding.from_list([0.1, 0.2, 0.3])
     assert call_args[1]["top_k"] == 5
 
@@ -112,16 +125,21 @@ async def test_execute_should_raise_error_when_question_is_empty(
 
 
 @pytest.mark.asyncio
-async def test_execute_should_batch_lookup_document_titles_when_building_sources(
+async def test_execute_should_take_titles_from_search_and_release_uow_before_llm(
     use_case: AskQuestion,
     uow: AsyncMock,
-    sample_chunk: Chunk,
+    llm_service: AsyncMock,
 ) -> None:
-    input_dto = AskQuestionInput(question_text="What is Python?")
+    async def generate(*args: object) -> str:
+        assert uow.__aexit__.await_count == uow.__aenter__.await_count
+        return "Python is a popular programming language."
 
-    await use_case.execute(input_dto)
+    llm_service.generate.side_effect = generate
 
-    uow.documents.find_by_ids.assert_awaited_once_with({sample_chunk.document_id})
+    result = await use_case.execute(AskQuestionInput(question_text="What is Python?"))
+
+    assert result.sources[0].document_title == "Python Docs"
+    uow.documents.find_by_ids.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -131,7 +149,7 @@ async def test_execute_should_return_no_results_message_when_no_chunks_found(
 ) -> None:
     uow = AsyncMock()
     uow.__aenter__.return_value = uow
-    uow.chunks.search_similar.return_value = []
+    uow.chunks.retrieve.return_value = []
 
     use_case = AskQuestion(
         embedding_service=embedding_service,
@@ -167,8 +185,7 @@ async def test_execute_should_discard_low_relevance_chunks_when_below_threshold(
 
     uow = AsyncMock()
     uow.__aenter__.return_value = uow
-    uow.chunks.search_similar.return_value = [(high_chunk, 0.8), (low_chunk, 0.1)]
-    uow.documents.find_by_ids.return_value = {"doc-1": sample_document}
+    uow.chunks.retrieve.return_value = [_hit(high_chunk, 0.8), _hit(low_chunk, 0.1)]
 
     use_case = AskQuestion(
         embedding_service=embedding_service,
@@ -196,7 +213,7 @@ async def test_execute_should_return_no_results_when_all_chunks_below_threshold(
 
     uow = AsyncMock()
     uow.__aenter__.return_value = uow
-    uow.chunks.search_similar.return_value = [(low_chunk, 0.2)]
+    uow.chunks.retrieve.return_value = [_hit(low_chunk, 0.2)]
 
     use_case = AskQuestion(
         embedding_service=embedding_service,
@@ -259,7 +276,7 @@ async def test_execute_stream_should_yield_no_results_when_no_chunks_found(
 ) -> None:
     uow = AsyncMock()
     uow.__aenter__.return_value = uow
-    uow.chunks.search_similar.return_value = []
+    uow.chunks.retrieve.return_value = []
 
     use_case = AskQuestion(
         embedding_service=embedding_service,
@@ -449,3 +466,648 @@ async def test_execute_stream_should_not_call_rewrite_query_when_no_history(
 
     llm_service.rewrite_query.assert_not_awaited()
     embedding_service.embed.assert_awaited_once_with("What is Python?")
+
+
+@pytest.fixture
+def answer_cache() -> ListAnswerCache:
+    return ListAnswerCache()
+
+
+@pytest.fixture
+def cached_use_case(
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+    answer_cache: ListAnswerCache,
+) -> AskQuestion:
+    return AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        answer_cache=answer_cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_should_answer_similar_question_from_cache(
+    cached_use_case: AskQuestion,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    first = await cached_use_case.execute(
+        AskQuestionInput(question_text="What is Python?")
+    )
+    embedding_service.embed.return_value = Embedding.from_list([0.1, 0.2, 0.31])
+
+    second = await cached_use_case.execute(
+        AskQuestionInput(question_text="what's python")
+    )
+
+    assert second == first
+    llm_service.generate.assert_awaited_once()
+    uow.chunks.retrieve.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_should_regenerate_when_source_document_was_reingested(
+    cached_use_case: AskQuestion,
+    llm_service: AsyncMock,
+    sample_document: Document,
+) -> None:
+    await cached_use_case.execute(AskQuestionInput(question_text="What is Python?"))
+    sample_document.touch()
+
+    await cached_use_case.execute(AskQuestionInput(question_text="What is Python?"))
+
+    assert llm_service.generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_should_bypass_cache_when_history_provided(
+    cached_use_case: AskQuestion,
+    llm_service: AsyncMock,
+    answer_cache: ListAnswerCache,
+) -> None:
+    llm_service.rewrite_query.return_value = "What is Python?"
+    history = (ConversationMessage(role="user", content="Hi"),)
+
+    for _ in range(2):
+        await cached_use_case.execute(
+            AskQuestionInput(question_text="And Python?", conversation_history=history)
+        )
+
+    assert llm_service.generate.await_count == 2
+    assert answer_cache.entries == []
+
+
+@pytest.mark.asyncio
+async def test_execute_should_scope_search_and_bypass_cache_when_filtered(
+    cached_use_case: AskQuestion,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+    answer_cache: ListAnswerCache,
+) -> None:
+    scope = SearchFilter(document_ids=frozenset({"doc-1"}))
+    await cached_use_case.execute(AskQuestionInput(question_text="What is Python?"))
+
+    await cached_use_case.execute(
+        AskQuestionInput(question_text="What is Python?", search_filter=scope)
+    )
+
+    assert llm_service.generate.await_count == 2
+    assert uow.chunks.retrieve.call_args.kwargs["search_filter"] == scope
+    assert len(answer_cache.entries) == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_should_treat_empty_filter_as_unscoped(
+    use_case: AskQuestion,
+    uow: AsyncMock,
+) -> None:
+    await use_case.execute(
+        AskQuestionInput(question_text="What is Python?", search_filter=SearchFilter())
+    )
+
+    assert uow.chunks.retrieve.call_args.kwargs["search_filter"] is None
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_should_store_and_replay_cached_answer(
+    embedding_service: AsyncMock,
+    uow: AsyncMock,
+    answer_cache: ListAnswerCache,
+) -> None:
+    llm_service = AsyncMock()
+    llm_service.generate_stream = MagicMock(
+        side_effect=lambda q, c, h=(): _async_gen(["Hello", " world"])
+    )
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        answer_cache=answer_cache,
+    )
+    input_dto = AskQuestionInput(question_text="What is Python?")
+
+    first = [event async for event in use_case.execute_stream(input_dto)]
+    second = [event async for event in use_case.execute_stream(input_dto)]
+
+    llm_service.generate_stream.assert_called_once()
+    assert second[0] == {"type": "text", "content": "Hello world"}
+    assert second[1:] == [e for e in first if e["type"] != "text"]
+
+
+_HISTORY = (
+    ConversationMessage(role="user", content="What is Python?"),
+    ConversationMessage(role="assistant", content="A programming language."),
+)
+
+
+@pytest.mark.asyncio
+async def test_execute_should_search_raw_question_while_rewrite_is_in_flight(
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    raw_question_embedded = asyncio.Event()
+
+    async def rewrite(question, history) -> str:
+        # Only completes if the raw question is embedded concurrently.
+        await raw_question_embedded.wait()
+        return "How do I install Python packages with pip"
+
+    async def embed(text: str) -> Embedding:
+        raw_question_embedded.set()
+        return Embedding.from_list([0.1, 0.2, 0.3])
+
+    llm_service.rewrite_query.side_effect = rewrite
+    embedding_service.embed.side_effect = embed
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        speculative_retrieval=True,
+    )
+
+    await asyncio.wait_for(
+        use_case.execute(
+            AskQuestionInput(
+                question_text="And packages?", conversation_history=_HISTORY
+            )
+        ),
+        timeout=1,
+    )
+
+    assert [call.args[0] for call in embedding_service.embed.await_args_list] == [
+        "And packages?",
+        "How do I install Python packages with pip",
+    ]
+    assert uow.chunks.retrieve.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_should_keep_speculative_results_when_rewrite_is_trivial(
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    llm_service.rewrite_query.return_value = "how to install python packages"
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        speculative_retrieval=True,
+    )
+
+    result = await use_case.execute(
+        AskQuestionInput(
+            question_text="How to install Python packages?",
+            conversation_history=_HISTORY,
+        )
+    )
+
+    embedding_service.embed.assert_awaited_once_with("How to install Python packages?")
+    uow.chunks.retrieve.assert_awaited_once()
+    assert len(result.sources) == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_should_merge_speculative_and_rewritten_results(
+    sample_chunk: Chunk,
+    sample_document: Document,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    other_chunk = Chunk.create(
+        document_id="doc-1",
+        content=ChunkContent(text="pip installs packages.", token_count=3),
+        position=1,
+    )
+    uow.chunks.retrieve.side_effect = [
+        [_hit(sample_chunk, 0.5)],
+        [_hit(other_chunk, 0.9), _hit(sample_chunk, 0.7)],
+    ]
+    llm_service.rewrite_query.return_value = "How to install packages with pip"
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        speculative_retrieval=True,
+    )
+
+    result = await use_case.execute(
+        AskQuestionInput(question_text="And that?", conversation_history=_HISTORY)
+    )
+
+    assert [(s.chunk_id, s.relevance_score) for s in result.sources] == [
+        (other_chunk.id, 0.9),
+        (sample_chunk.id, 0.7),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_should_fuse_speculative_and_rewritten_results_by_rank(
+    sample_chunk: Chunk,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    other_chunk = Chunk.create(
+        document_id="doc-1",
+        content=ChunkContent(text="pip installs packages.", token_count=3),
+        position=1,
+    )
+    identifier_chunk = Chunk.create(
+        document_id="doc-1",
+        content=ChunkContent(text="ERR_PIP_TIMEOUT is raised.", token_count=4),
+        position=2,
+    )
+    uow.chunks.retrieve.side_effect = [
+        [_hit(sample_chunk, 0.5)],
+        [_hit(other_chunk, 0.9), _hit(sample_chunk, 0.7)],
+    ]
+    # Full-text ranks are far below similarities; merging by score would
+    # push the lexical-only hit last.
+    uow.chunks.search_fulltext.return_value = [_hit(identifier_chunk, 0.02)]
+    llm_service.rewrite_query.return_value = "How to install packages with pip"
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        speculative_retrieval=True,
+        hybrid_search=True,
+    )
+
+    result = await use_case.execute(
+        AskQuestionInput(question_text="And that?", conversation_history=_HISTORY)
+    )
+
+    assert uow.chunks.search_fulltext.await_count == 2
+    assert [s.chunk_id for s in result.sources] == [
+        sample_chunk.id,
+        identifier_chunk.id,
+        other_chunk.id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_should_fuse_fulltext_hits_in_hybrid_mode(
+    sample_chunk: Chunk,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    identifier_chunk = Chunk.create(
+        document_id="doc-1",
+        content=ChunkContent(text="ERR_POOL_EXHAUSTED is raised.", token_count=4),
+        position=1,
+    )
+    identifier_chunk.set_embedding(Embedding.from_list([0.3, 0.2, 0.1]))
+    uow.chunks.retrieve.return_value = [_hit(sample_chunk, 0.6)]
+    uow.chunks.search_fulltext.return_value = [
+        _hit(identifier_chunk, 0.4),
+        _hit(sample_chunk, 0.1),
+    ]
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        hybrid_search=True,
+    )
+
+    result = await use_case.execute(
+        AskQuestionInput(question_text="What is ERR_POOL_EXHAUSTED?")
+    )
+
+    uow.chunks.search_fulltext.assert_awaited_once_with(
+        "What is ERR_POOL_EXHAUSTED?",
+        top_k=5,
+        search_filter=None,
+        with_embeddings=True,
+    )
+    # The full-text hit reports its cosine similarity to the question
+    # (0.1 / 0.14), not its full-text rank.
+    assert [(s.chunk_id, s.relevance_score) for s in result.sources] == [
+        (sample_chunk.id, 0.6),
+        (identifier_chunk.id, pytest.approx(0.714, abs=1e-3)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_should_score_lexical_only_hit_ranked_first_by_similarity(
+    sample_chunk: Chunk,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    identifier_chunk = Chunk.create(
+        document_id="doc-1",
+        content=ChunkContent(text="ERR_POOL_EXHAUSTED is raised.", token_count=4),
+        position=1,
+    )
+    identifier_chunk.set_embedding(Embedding.from_list([0.3, 0.2, 0.1]))
+    # Below the relevance threshold: no vector hit survives.
+    uow.chunks.retrieve.return_value = [_hit(sample_chunk, 0.2)]
+    uow.chunks.search_fulltext.return_value = [_hit(identifier_chunk, 0.02)]
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        hybrid_search=True,
+    )
+
+    result = await use_case.execute(
+        AskQuestionInput(question_text="What is ERR_POOL_EXHAUSTED?")
+    )
+
+    [source] = result.sources
+    assert source.chunk_id == identifier_chunk.id
+    assert source.relevance_score == pytest.approx(0.714, abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_execute_should_not_search_fulltext_by_default(
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    use_case = AskQuestion(
+        embedding_service=embedding_service, llm_service=llm_service, uow=uow
+    )
+
+    await use_case.execute(AskQuestionInput(question_text="What is Python?"))
+
+    uow.chunks.search_fulltext.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_execute_should_search_with_profile_and_relevance_threshold(
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        search_profile=SearchProfile(ef_search=100, iterative_scan="relaxed_order"),
+    )
+
+    await use_case.execute(AskQuestionInput(question_text="What is Python?"))
+
+    assert uow.chunks.retrieve.call_args.kwargs["profile"] == SearchProfile(
+        ef_search=100, iterative_scan="relaxed_order", min_score=0.3
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_should_diversify_candidate_pool_with_mmr(
+    sample_chunk: Chunk,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    overlap = Chunk.create(
+        document_id="doc-1",
+        content=ChunkContent(text="Python is a language.", token_count=4),
+        position=1,
+    )
+    overlap.set_embedding(Embedding.from_list([0.1, 0.2, 0.3]))
+    distinct = Chunk.create(
+        document_id="doc-1",
+        content=ChunkContent(text="Install it with pip.", token_count=4),
+        position=5,
+    )
+    distinct.set_embedding(Embedding.from_list([0.3, -0.2, 0.0]))
+    uow.chunks.retrieve.return_value = [
+        _hit(sample_chunk, 0.9),
+        _hit(overlap, 0.88),
+        _hit(distinct, 0.7),
+    ]
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        diversify=True,
+        mmr_lambda=0.5,
+        mmr_candidates=12,
+    )
+
+    result = await use_case.execute(AskQuestionInput(question_text="What is Python?"))
+
+    kwargs = uow.chunks.retrieve.call_args.kwargs
+    assert (kwargs["top_k"], kwargs["with_embeddings"]) == (12, True)
+    assert [s.chunk_id for s in result.sources] == [
+        sample_chunk.id,
+        distinct.id,
+        overlap.id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_should_fit_context_budget_and_merge_adjacent_chunks(
+    sample_chunk: Chunk,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    next_chunk = Chunk.create(
+        document_id="doc-1",
+        content=ChunkContent(text="It was created by Guido.", token_count=5),
+        position=1,
+    )
+    large_chunk = Chunk.create(
+        document_id="doc-1",
+        content=ChunkContent(text="A very long reference section.", token_count=500),
+        position=9,
+    )
+    uow.chunks.retrieve.return_value = [
+        _hit(sample_chunk, 0.9),
+        _hit(large_chunk, 0.8),
+        _hit(next_chunk, 0.7),
+    ]
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        context_max_tokens=100,
+    )
+
+    result = await use_case.execute(AskQuestionInput(question_text="What is Python?"))
+
+    [passage] = llm_service.generate.call_args.args[1]
+    assert passage.content.text == (
+        "Python is a programming language.\n\nIt was created by Guido."
+    )
+    assert [s.chunk_id for s in result.sources] == [sample_chunk.id, next_chunk.id]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_should_embed_and_search_all_questions_at_once(
+    sample_chunk: Chunk,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    embeddings = [Embedding.from_list([1.0, 0.0]), Embedding.from_list([0.0, 1.0])]
+    embedding_service.embed_batch.return_value = embeddings
+    uow.chunks.retrieve_batch.return_value = [[_hit(sample_chunk, 0.9)], []]
+    use_case = AskQuestion(
+        embedding_service=embedding_service, llm_service=llm_service, uow=uow
+    )
+
+    results = [
+        result
+        async for result in use_case.execute_batch(
+            AskQuestionBatchInput(questions=("What is Python?", "Unrelated?"))
+        )
+    ]
+
+    embedding_service.embed_batch.assert_awaited_once_with(
+        ["What is Python?", "Unrelated?"]
+    )
+    embedding_service.embed.assert_not_awaited()
+    uow.chunks.retrieve_batch.assert_awaited_once()
+    assert uow.chunks.retrieve_batch.call_args.args[0] == embeddings
+    uow.chunks.retrieve.assert_not_awaited()
+    by_index = {result.index: result for result in results}
+    assert by_index[0].answer.text == "Python is a popular programming language."
+    assert by_index[1].answer.sources == []
+    llm_service.generate.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_should_report_failed_generation_and_continue(
+    sample_chunk: Chunk,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    embedding_service.embed_batch.return_value = [
+        Embedding.from_list([1.0, 0.0]),
+        Embedding.from_list([0.0, 1.0]),
+    ]
+    uow.chunks.retrieve_batch.return_value = [
+        [_hit(sample_chunk, 0.9)],
+        [_hit(sample_chunk, 0.8)],
+    ]
+    llm_service.generate.side_effect = [LLMGenerationError("overloaded"), "Answer"]
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        max_concurrent_generations=1,
+    )
+
+    results = [
+        result
+        async for result in use_case.execute_batch(
+            AskQuestionBatchInput(questions=("First?", "Second?"))
+        )
+    ]
+
+    assert [(r.index, r.error, r.answer and r.answer.text) for r in results] == [
+        (0, "overloaded", None),
+        (1, None, "Answer"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_should_bound_concurrent_generations(
+    sample_chunk: Chunk,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    embedding_service.embed_batch.return_value = [
+        Embedding.from_list([1.0, 0.0]) for _ in range(6)
+    ]
+    uow.chunks.retrieve_batch.return_value = [[_hit(sample_chunk, 0.9)]] * 6
+    running = 0
+    peak = 0
+
+    async def generate(*args: object) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "Answer"
+
+    llm_service.generate.side_effect = generate
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        max_concurrent_generations=2,
+    )
+
+    results = [
+        result
+        async for result in use_case.execute_batch(
+            AskQuestionBatchInput(questions=tuple(f"Q{i}?" for i in range(6)))
+        )
+    ]
+
+    assert sorted(result.index for result in results) == list(range(6))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_should_fan_out_compound_question_and_fuse_results(
+    sample_chunk: Chunk,
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    deploy_chunk = Chunk.create(
+        document_id="doc-2",
+        content=ChunkContent(text="Deploy with uvicorn.", token_count=4),
+        position=0,
+    )
+    embeddings = [Embedding.from_list([float(i), 1.0]) for i in range(3)]
+    embedding_service.embed_batch.return_value = embeddings
+    uow.chunks.retrieve_batch.return_value = [
+        [_hit(sample_chunk, 0.8), _hit(deploy_chunk, 0.7)],
+        [_hit(sample_chunk, 0.9)],
+        [_hit(deploy_chunk, 0.85)],
+    ]
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        fan_out=True,
+    )
+    question = "How do I install Python and how do I deploy my app?"
+
+    result = await use_case.execute(AskQuestionInput(question_text=question))
+
+    embedding_service.embed_batch.assert_awaited_once_with(
+        [question, "How do I install Python", "how do I deploy my app?"]
+    )
+    assert uow.chunks.retrieve_batch.call_args.args[0] == embeddings
+    uow.chunks.retrieve.assert_not_awaited()
+    assert [s.chunk_id for s in result.sources] == [sample_chunk.id, deploy_chunk.id]
+
+
+@pytest.mark.asyncio
+async def test_execute_should_keep_single_search_for_simple_question_in_fan_out(
+    embedding_service: AsyncMock,
+    llm_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    use_case = AskQuestion(
+        embedding_service=embedding_service,
+        llm_service=llm_service,
+        uow=uow,
+        fan_out=True,
+    )
+
+    await use_case.execute(AskQuestionInput(question_text="What is Python?"))
+
+    embedding_service.embed.assert_awaited_once_with("What is Python?")
+    embedding_service.embed_batch.assert_not_awaited()
+    uow.chunks.retrieve.assert_awaited_once()
+    uow.chunks.retrieve_batch.assert_not_awaited()
@@ -0,0 +1,143 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from documentor.application.dtos import (
+    CrawlDocumentationInput,
+    DocumentDTO,
+    IngestResultDTO,
+)
+from documentor.application.use_cases.crawl_documentation import CrawlDocumentation
+from documentor.domain.exceptions import InvalidDocumentError
+from documentor.domain.models.document import SourceType
+from documentor.domain.services.document_loader_service import LoadedDocument
+from documentor.domain.services.site_crawler import CrawledPage, SiteCrawler
+
+
+class _FakeCrawler(SiteCrawler):
+    def __init__(self, pages: list[CrawledPage]) -> None:
+        self._pages = pages
+        self.max_pages: int | None = None
+
+    async def crawl(
+        self, start_url: str, *, max_pages: int
+    ) -> AsyncIterator[CrawledPage]:
+        self.max_pages = max_pages
+        for page in self._pages:
+            yield page
+
+
+def _page(url: str) -> CrawledPage:
+    return CrawledPage(
+        url=url,
+        document=LoadedDocument(
+            content=f"content of {url}", title=url, source_type=SourceType.URL
+        ),
+    )
+
+
+def _result(source: str) -> IngestResultDTO:
+    return IngestResultDTO(
+        document=DocumentDTO(
+            id=f"doc-{source[-1]}",
+            source=source,
+            title=source,
+            source_type="url",
+            created_at=datetime(2024, 1, 1, tzinfo=UTC),
+            chunk_count=2,
+        ),
+        chunks_created=2,
+    )
+
+
+def _ingest_factory(loaded_sources: list[str]):
+    def factory(loader):
+        use_case = AsyncMock()
+
+        async def execute(input):
+            document = await loader.load(input.source)
+            if "bad" in input.source:
+                raise InvalidDocumentError("No extractable content")
+            if "race" in input.source:
+                raise RuntimeError("duplicate key value violates unique constraint")
+            loaded_sources.append(document.content)
+            return _result(input.source)
+
+        use_case.execute.side_effect = execute
+        return use_case
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_should_ingest_each_fetched_page() -> None:
+    loaded: list[str] = []
+    crawler = _FakeCrawler([_page("https://example.com/a"), _page("https://example.com/b")])
+    use_case = CrawlDocumentation(crawler, _ingest_factory(loaded))
+
+    results = [
+        result
+        async for result in use_case.execute_stream(
+            CrawlDocumentationInput(url="https://example.com/", max_pages=10)
+        )
+    ]
+
+    assert crawler.max_pages == 10
+    assert {r.url for r in results} == {"https://example.com/a", "https://example.com/b"}
+    assert all(r.status == "ingested" and r.chunks_created == 2 for r in results)
+    assert sorted(loaded) == [
+        "content of https://example.com/a",
+        "content of https://example.com/b",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_should_report_failed_pages_and_continue() -> None:
+    crawler = _FakeCrawler(
+        [
+            CrawledPage(url="https://example.com/404", error="Failed to load URL"),
+            _page("https://example.com/bad"),
+            _page("https://example.com/c"),
+        ]
+    )
+    use_case = CrawlDocumentation(crawler, _ingest_factory([]), max_concurrent_ingests=1)
+
+    results = {
+        result.url: result
+        async for result in use_case.execute_stream(
+            CrawlDocumentationInput(url="https://example.com/")
+        )
+    }
+
+    assert results["https://example.com/404"].status == "failed"
+    assert results["https://example.com/404"].error == "Failed to load URL"
+    assert results["https://example.com/bad"].error == "No extractable content"
+    assert results["https://example.com/c"].status == "ingested"
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_should_report_unexpected_errors_and_continue() -> None:
+    crawler = _FakeCrawler(
+        [
+            _page("https://example.com/a"),
+            _page("https://example.com/race"),
+            _page("https://example.com/c"),
+        ]
+    )
+    use_case = CrawlDocumentation(crawler, _ingest_factory([]))
+
+    results = {
+        result.url: result
+        async for result in use_case.execute_stream(
+            CrawlDocumentationInput(url="https://example.com/")
+        )
+    }
+
+    assert results["https://example.com/race"].status == "failed"
+    assert results["https://example.com/race"].error == (
+        "Unexpected error during ingestion"
+    )
+    assert results["https://example.com/a"].status == "ingested"
+    assert results["https://example.com/c"].status == "ingested"
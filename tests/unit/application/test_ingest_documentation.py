@@ -5,10 +5,16 @@ import pytest
 
 from documentor.application.dtos import IngestDocumentationInput
 from documentor.application.use_cases.ingest_documentation import IngestDocumentation
-from documentor.domain.exceptions import DuplicateDocumentError, InvalidDocumentError
-from documentor.domain.models.chunk import Embedding
+from documentor.domain.exceptions import (
+    DuplicateDocumentError,
+    EmbeddingGenerationError,
+    InvalidDocumentError,
+)
+from documentor.domain.models.chunk import Chunk, ChunkContent, Embedding
 from documentor.domain.models.document import Document, SourceType
 from documentor.domain.services.document_loader_service import LoadedDocument
+from documentor.domain.services.text_chunker import TextChunker
+from tests.fakes import WordTokenizer
 
 
 @pytest.fixture
@@ -40,16 +46,23 @@ def uow() -> AsyncMock:
     return mock
 
 
+@pytest.fixture
+def chunker(tokenizer: WordTokenizer) -> TextChunker:
+    return TextChunker(tokenizer)
+
+
 @pytest.fixture
 def use_case(
     loader: AsyncMock,
     embedding_service: AsyncMock,
     uow: AsyncMock,
+    chunker: TextChunker,
 ) -> IngestDocumentation:
     return IngestDocumentation(
         loader=loader,
         embedding_service=embedding_service,
         uow=uow,
+        chunker=chunker,
     )
 
 
@@ -137,6 +150,7 @@ async def test_execute_should_create_multiple_chunks_for_large_content(
     loader: AsyncMock,
     embedding_service: AsyncMock,
     uow: AsyncMock,
+    chunker: TextChunker,
 ) -> None:
     loader.load.return_value = LoadedDocument(
         content="word " * 1000,
@@ -151,6 +165,7 @@ async def test_execute_should_create_multiple_chunks_for_large_content(
         loader=loader,
         embedding_service=embedding_service,
         uow=uow,
+        chunker=chunker,
     )
 
     result = await use_case.execute(
@@ -162,19 +177,17 @@ async def test_execute_should_create_multiple_chunks_for_large_content(
 
 
 @pytest.mark.asyncio
-async def test_execute_should_use_embedding_service_token_count_when_creating_chunks(
+async def test_execute_should_use_chunker_token_count_when_creating_chunks(
     use_case: IngestDocumentation,
     embedding_service: AsyncMock,
     uow: AsyncMock,
 ) -> None:
-    embedding_service.count_tokens = Mock(return_value=42)
-
     input_dto = IngestDocumentationInput(source="https://example.com/docs")
     await use_case.execute(input_dto)
 
-    embedding_service.count_tokens.assert_called()
+    embedding_service.count_tokens.assert_not_called()
     saved_chunks = uow.chunks.save_all.call_args[0][0]
-    assert saved_chunks[0].content.token_count == 42
+    assert saved_chunks[0].content.token_count == 100
 
 
 @pytest.mark.asyncio
@@ -247,6 +260,7 @@ async def test_execute_should_replace_document_when_source_exists_and_replace(
 ) -> None:
     existing = _make_existing_document()
     uow.documents.find_by_source.return_value = existing
+    uow.chunks.find_by_document_id.return_value = []
 
     result = await use_case.execute(
         IngestDocumentationInput(
@@ -254,13 +268,100 @@ async def test_execute_should_replace_document_when_source_exists_and_replace(
         )
     )
 
-    uow.chunks.delete_by_document_id.assert_awaited_once_with("existing-doc-id")
-    uow.documents.delete.assert_awaited_once_with("existing-doc-id")
     loader.load.assert_awaited_once()
+    uow.documents.update.assert_awaited_once()
+    uow.documents.save.assert_not_awaited()
+    uow.documents.delete.assert_not_awaited()
     assert result.chunks_created == 1
+    assert result.document.id == "existing-doc-id"
     assert result.document.title == "Test Doc"
 
 
+def _make_stored_chunk(chunk_id: str, text: str, position: int) -> Chunk:
+    return Chunk(
+        id=chunk_id,
+        document_id="existing-doc-id",
+        content=ChunkContent(text=text, token_count=5),
+        position=position,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_should_apply_only_chunk_diff_when_replacing(
+    loader: AsyncMock,
+    embedding_service: AsyncMock,
+    uow: AsyncMock,
+    chunker: TextChunker,
+) -> None:
+    first = " ".join(f"a{i}" for i in range(500))
+    second = " ".join(f"b{i}" for i in range(500))
+    loader.load.return_value = LoadedDocument(
+        content=f"{first} {second}",
+        title="Updated Doc",
+        source_type=SourceType.URL,
+    )
+    text_chunks = [chunk.text for chunk in chunker.split(f"{first} {second}")]
+    uow.documents.find_by_source.return_value = _make_existing_document()
+    uow.chunks.find_by_document_id.return_value = [
+        _make_stored_chunk("stale", "outdated text", 0),
+        _make_stored_chunk("kept", text_chunks[0], 1),
+    ]
+    embedding_service.embed_batch.side_effect = lambda texts: [
+        Embedding.from_list([0.1, 0.2, 0.3]) for _ in texts
+    ]
+    use_case = IngestDocumentation(
+        loader=loader, embedding_service=embedding_service, uow=uow, chunker=chunker
+    )
+
+    result = await use_case.execute(
+        IngestDocumentationInput(
+            source="https://example.com/docs", on_duplicate="replace"
+        )
+    )
+
+    embedded = embedding_service.embed_batch.call_args[0][0]
+    assert embedded == text_chunks[1:]
+    uow.chunks.delete_by_ids.assert_awaited_once_with({"stale"})
+    uow.chunks.update_positions.assert_awaited_once_with({"kept": 0})
+    inserted = uow.chunks.save_all.call_args[0][0]
+    assert [chunk.position for chunk in inserted] == list(range(1, len(text_chunks)))
+    assert all(chunk.document_id == "existing-doc-id" for chunk in inserted)
+    uow.chunks.delete_by_document_id.assert_not_awaited()
+
+    updated = uow.documents.update.call_args[0][0]
+    assert updated.id == "existing-doc-id"
+    assert updated.title == "Updated Doc"
+    assert updated.chunk_count == len(text_chunks)
+    assert updated.updated_since(updated.created_at)
+    assert result.chunks_created == len(text_chunks) - 1
+    assert result.chunks_deleted == 1
+    assert result.chunks_unchanged == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_should_not_embed_when_replacing_unchanged_document(
+    use_case: IngestDocumentation,
+    embedding_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    uow.documents.find_by_source.return_value = _make_existing_document()
+    uow.chunks.find_by_document_id.return_value = [
+        _make_stored_chunk("kept", " ".join(["word"] * 100), 0),
+    ]
+
+    result = await use_case.execute(
+        IngestDocumentationInput(
+            source="https://example.com/docs", on_duplicate="replace"
+        )
+    )
+
+    embedding_service.embed_batch.assert_not_awaited()
+    uow.chunks.delete_by_ids.assert_awaited_once_with(set())
+    uow.chunks.update_positions.assert_awaited_once_with({})
+    assert result.chunks_created == 0
+    assert result.chunks_unchanged == 1
+
+
 @pytest.mark.asyncio
 async def test_execute_should_proceed_normally_when_source_is_new(
     use_case: IngestDocumentation,
@@ -316,3 +417,117 @@ async def test_execute_should_raise_error_when_loaded_content_is_whitespace(
         )
 
     uow.documents.save.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_execute_should_persist_chunks_in_batches_when_document_is_large(
+    loader: AsyncMock,
+    embedding_service: AsyncMock,
+    uow: AsyncMock,
+    chunker: TextChunker,
+) -> None:
+    loader.load.return_value = LoadedDocument(
+        content="word " * 2000,
+        title="Large Doc",
+        source_type=SourceType.URL,
+    )
+    embedding_service.embed_batch.side_effect = lambda texts: [
+        Embedding.from_list([0.1, 0.2, 0.3]) for _ in texts
+    ]
+    use_case = IngestDocumentation(
+        loader=loader,
+        embedding_service=embedding_service,
+        uow=uow,
+        chunker=chunker,
+        batch_size=2,
+    )
+
+    result = await use_case.execute(
+        IngestDocumentationInput(source="https://example.com/large")
+    )
+
+    assert result.chunks_created == 5
+    batches = [call.args[0] for call in uow.chunks.save_all.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    positions = [chunk.position for batch in batches for chunk in batch]
+    assert positions == [0, 1, 2, 3, 4]
+    assert all(chunk.has_embedding() for batch in batches for chunk in batch)
+    uow.commit.assert_awaited_once()
+    updated = uow.documents.update.call_args[0][0]
+    assert updated.chunk_count == 5
+
+
+@pytest.mark.asyncio
+async def test_execute_should_commit_each_batch_when_commit_is_batched(
+    loader: AsyncMock,
+    embedding_service: AsyncMock,
+    uow: AsyncMock,
+    chunker: TextChunker,
+) -> None:
+    loader.load.return_value = LoadedDocument(
+        content="word " * 2000,
+        title="Large Doc",
+        source_type=SourceType.URL,
+    )
+    embedding_service.embed_batch.side_effect = lambda texts: [
+        Embedding.from_list([0.1, 0.2, 0.3]) for _ in texts
+    ]
+    use_case = IngestDocumentation(
+        loader=loader,
+        embedding_service=embedding_service,
+        uow=uow,
+        chunker=chunker,
+        batch_size=2,
+    )
+
+    await use_case.execute(
+        IngestDocumentationInput(source="https://example.com/large", commit="batched")
+    )
+
+    # One commit per persisted batch plus the final commit.
+    assert uow.commit.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_execute_should_propagate_embedding_error_without_committing(
+    use_case: IngestDocumentation,
+    embedding_service: AsyncMock,
+    uow: AsyncMock,
+) -> None:
+    embedding_service.embed_batch.side_effect = EmbeddingGenerationError("down")
+
+    with pytest.raises(EmbeddingGenerationError, match="down"):
+        await use_case.execute(IngestDocumentationInput(source="https://example.com"))
+
+    uow.chunks.save_all.assert_not_awaited()
+    uow.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_execute_should_report_progress_after_each_batch(
+    loader: AsyncMock,
+    embedding_service: AsyncMock,
+    uow: AsyncMock,
+    chunker: TextChunker,
+) -> None:
+    loader.load.return_value = LoadedDocument(
+        content="word " * 2000,
+        title="Large Doc",
+        source_type=SourceType.URL,
+    )
+    embedding_service.embed_batch.side_effect = lambda texts: [
+        Embedding.from_list([0.1, 0.2, 0.3]) for _ in texts
+    ]
+    on_progress = AsyncMock()
+    use_case = IngestDocumentation(
+        loader=loader,
+        embedding_service=embedding_service,
+        uow=uow,
+        chunker=chunker,
+        batch_size=2,
+        on_progress=on_progress,
+    )
+
+    await use_case.execute(IngestDocumentationInput(source="https://example.com/large"))
+
+    assert [call.args[0] for call in on_progress.await_args_list] == [2, 4, 5]
@@ -0,0 +1,249 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from documentor.application.dtos import (
+    DocumentDTO,
+    EnqueueIngestionInput,
+    IngestDocumentationInput,
+    IngestResultDTO,
+)
+from documentor.application.use_cases.enqueue_ingestion import EnqueueIngestion
+from documentor.application.use_cases.get_job_status import GetJobStatus
+from documentor.application.use_cases.process_ingestion_job import (
+    ProcessIngestionJob,
+)
+from documentor.domain.exceptions import DocumentLoadError, JobNotFoundError
+from documentor.domain.models.ingestion_job import IngestionJob, JobStatus
+
+
+def _make_running_job(attempts: int = 1) -> IngestionJob:
+    job = IngestionJob.create(source="https://example.com/docs", title="Docs")
+    job.status = JobStatus.RUNNING
+    job.attempts = attempts
+    return job
+
+
+def _make_result(document_id: str = "doc-1", chunk_count: int = 4) -> IngestResultDTO:
+    return IngestResultDTO(
+        document=DocumentDTO(
+            id=document_id,
+            source="https://example.com/docs",
+            title="Docs",
+            source_type="url",
+            created_at=datetime(2024, 1, 1, tzinfo=UTC),
+            chunk_count=chunk_count,
+        ),
+        chunks_created=chunk_count,
+    )
+
+
+@pytest.fixture
+def uow() -> AsyncMock:
+    mock = AsyncMock()
+    mock.__aenter__.return_value = mock
+    mock.jobs.claim_next.return_value = None
+    return mock
+
+
+@pytest.fixture
+def ingest_use_case() -> AsyncMock:
+    mock = AsyncMock()
+    mock.execute.return_value = _make_result()
+    return mock
+
+
+@pytest.fixture
+def ingest_factory(ingest_use_case: AsyncMock) -> Mock:
+    return Mock(return_value=ingest_use_case)
+
+
+@pytest.fixture
+def use_case(uow: AsyncMock, ingest_factory: Mock) -> ProcessIngestionJob:
+    return ProcessIngestionJob(
+        uow=uow,
+        ingest_factory=ingest_factory,
+        lease=timedelta(seconds=30),
+        max_attempts=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_should_return_none_when_queue_is_empty(
+    use_case: ProcessIngestionJob,
+    uow: AsyncMock,
+    ingest_factory: Mock,
+) -> None:
+    assert await use_case.execute() is None
+    uow.jobs.claim_next.assert_awaited_once_with(timedelta(seconds=30))
+    ingest_factory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_should_mark_job_succeeded_when_ingestion_completes(
+    use_case: ProcessIngestionJob,
+    uow: AsyncMock,
+    ingest_use_case: AsyncMock,
+) -> None:
+    uow.jobs.claim_next.return_value = _make_running_job()
+
+    result = await use_case.execute()
+
+    assert result is not None
+    assert result.status == "succeeded"
+    assert result.document_id == "doc-1"
+    assert result.chunks_processed == 4
+    ingest_use_case.execute.assert_awaited_once_with(
+        IngestDocumentationInput(source="https://example.com/docs", title="Docs")
+    )
+    updated = uow.jobs.update.call_args[0][0]
+    assert updated.status == JobStatus.SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_execute_should_mark_job_failed_when_ingestion_raises_domain_error(
+    use_case: ProcessIngestionJob,
+    uow: AsyncMock,
+    ingest_use_case: AsyncMock,
+) -> None:
+    uow.jobs.claim_next.return_value = _make_running_job()
+    ingest_use_case.execute.side_effect = DocumentLoadError("404 Not Found")
+
+    result = await use_case.execute()
+
+    assert result is not None
+    assert result.status == "failed"
+    assert result.error == "404 Not Found"
+
+
+@pytest.mark.asyncio
+async def test_execute_should_hide_details_when_ingestion_fails_unexpectedly(
+    use_case: ProcessIngestionJob,
+    uow: AsyncMock,
+    ingest_use_case: AsyncMock,
+) -> None:
+    uow.jobs.claim_next.return_value = _make_running_job()
+    ingest_use_case.execute.side_effect = RuntimeError("secret connection string")
+
+    result = await use_case.execute()
+
+    assert result is not None
+    assert result.status == "failed"
+    assert result.error == "Unexpected error during ingestion"
+
+
+@pytest.mark.asyncio
+async def test_execute_should_abandon_job_when_attempts_exhausted(
+    use_case: ProcessIngestionJob,
+    uow: AsyncMock,
+    ingest_factory: Mock,
+) -> None:
+    uow.jobs.claim_next.return_value = _make_running_job(attempts=3)
+
+    result = await use_case.execute()
+
+    assert result is not None
+    assert result.status == "failed"
+    assert "2 attempts" in (result.error or "")
+    ingest_factory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_should_record_progress_and_extend_lease(
+    use_case: ProcessIngestionJob,
+    uow: AsyncMock,
+    ingest_factory: Mock,
+    ingest_use_case: AsyncMock,
+) -> None:
+    job = _make_running_job()
+    uow.jobs.claim_next.return_value = job
+
+    async def execute(_input: IngestDocumentationInput) -> IngestResultDTO:
+        on_progress = ingest_factory.call_args[0][1]
+        await on_progress(64)
+        return _make_result()
+
+    ingest_use_case.execute.side_effect = execute
+
+    await use_case.execute()
+
+    uow.jobs.record_progress.assert_awaited_once_with(job, 64, timedelta(seconds=30))
+
+
+@pytest.mark.asyncio
+async def test_execute_should_renew_lease_while_ingestion_runs(
+    uow: AsyncMock,
+    ingest_factory: Mock,
+    ingest_use_case: AsyncMock,
+) -> None:
+    job = _make_running_job()
+    uow.jobs.claim_next.return_value = job
+    uow.jobs.renew_lease.return_value = True
+    lease = timedelta(milliseconds=30)
+
+    async def execute(_input: IngestDocumentationInput) -> IngestResultDTO:
+        await asyncio.sleep(0.05)
+        return _make_result()
+
+    ingest_use_case.execute.side_effect = execute
+    use_case = ProcessIngestionJob(uow=uow, ingest_factory=ingest_factory, lease=lease)
+
+    await use_case.execute()
+    renewals = uow.jobs.renew_lease.await_count
+    await asyncio.sleep(0.05)
+
+    assert renewals >= 2
+    uow.jobs.renew_lease.assert_awaited_with(job, lease)
+    assert uow.jobs.renew_lease.await_count == renewals
+
+
+@pytest.mark.asyncio
+async def test_execute_should_stop_renewing_when_job_claimed_by_another_worker(
+    uow: AsyncMock,
+    ingest_factory: Mock,
+    ingest_use_case: AsyncMock,
+) -> None:
+    uow.jobs.claim_next.return_value = _make_running_job()
+    uow.jobs.renew_lease.return_value = False
+
+    async def execute(_input: IngestDocumentationInput) -> IngestResultDTO:
+        await asyncio.sleep(0.05)
+        return _make_result()
+
+    ingest_use_case.execute.side_effect = execute
+    use_case = ProcessIngestionJob(
+        uow=uow, ingest_factory=ingest_factory, lease=timedelta(milliseconds=30)
+    )
+
+    await use_case.execute()
+
+    uow.jobs.renew_lease.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_should_save_all_jobs_in_one_commit(uow: AsyncMock) -> None:
+    jobs = await EnqueueIngestion(uow=uow).execute_many(
+        [
+            EnqueueIngestionInput(source="https://example.com/a"),
+            EnqueueIngestionInput(
+                source="sha256:abc", filename="b.md", payload=b"# B"
+            ),
+        ]
+    )
+
+    assert [job.source for job in jobs] == ["https://example.com/a", "sha256:abc"]
+    assert all(job.status == "queued" for job in jobs)
+    assert uow.jobs.save.await_count == 2
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_job_status_should_raise_not_found_when_job_missing(
+    uow: AsyncMock,
+) -> None:
+    uow.jobs.find_by_id.return_value = None
+
+    with pytest.raises(JobNotFoundError, match="job-1"):
+        await GetJobStatus(uow=uow).execute("job-1")
@@ -0,0 +1,8 @@
+import pytest
+
+from tests.fakes import WordTokenizer
+
+
+@pytest.fixture
+def tokenizer() -> WordTokenizer:
+    return WordTokenizer()
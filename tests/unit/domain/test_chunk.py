@@ -1,3 +1,5 @@
+from array import array
+
 import pytest
 
 from documentor.domain.exceptions import InvalidChunkError, InvalidEmbeddingError
@@ -5,7 +7,7 @@ from documentor.domain.models.chunk import (
     Chunk,
     ChunkContent,
     Embedding,
-    split_text_into_chunks,
+    SearchProfile,
 )
 
 
@@ -17,9 +19,64 @@ class TestEmbedding:
     def test_embedding_from_list_should_create_embedding_when_valid_list(self) -> None:
         embedding = Embedding.from_list([0.1, 0.2, 0.3])
         assert embedding.dimension == 3
-        assert embedding.vector == (0.1, 0.2, 0.3)
+        assert embedding.to_list() == pytest.approx([0.1, 0.2, 0.3])
+
+    def test_embedding_from_buffer_should_wrap_float32_bytes(self) -> None:
+        data = array("f", [1.0, 2.0]).tobytes()
+        embedding = Embedding.from_buffer(data)
+        assert embedding.dimension == 2
+        assert embedding.to_list() == [1.0, 2.0]
+
+    def test_embedding_from_buffer_should_raise_error_when_partial_float(self) -> None:
+        with pytest.raises(InvalidEmbeddingError, match="float32"):
+            Embedding.from_buffer(b"\x00\x00\x00")
+
+    def test_embedding_should_be_equal_and_hashable_by_value(self) -> None:
+        a = Embedding.from_list([0.5, 0.25])
+        b = Embedding.from_buffer(array("f", [0.5, 0.25]))
+        assert a == b
+        assert hash(a) == hash(b)
+
+    def test_cosine_similarity_should_compare_directions(self) -> None:
+        a = Embedding.from_list([1.0, 0.0])
+        assert a.cosine_similarity(Embedding.from_list([2.0, 0.0])) == pytest.approx(1.0)
+        assert a.cosine_similarity(Embedding.from_list([0.0, 3.0])) == pytest.approx(0.0)
+
+    def test_cosine_similarities_should_match_pairwise_similarity(self) -> None:
+        query = Embedding.from_list([1.0, 1.0])
+        others = [
+            Embedding.from_list([2.0, 0.0]),
+            Embedding.from_list([-1.0, -1.0]),
+            Embedding.from_list([0.0, 0.0]),
+        ]
+
+        similarities = query.cosine_similarities(others)
+
+        assert similarities == pytest.approx(
+            [query.cosine_similarity(other) for other in others]
+        )
+
+    def test_cosine_similarities_should_raise_error_when_dimensions_differ(
+        self,
+    ) -> None:
+        with pytest.raises(InvalidEmbeddingError, match="dimension"):
+            Embedding.from_list([1.0]).cosine_similarities(
+                [Embedding.from_list([1.0, 2.0])]
+            )
+
+    def test_dot_should_raise_error_when_dimensions_differ(self) -> None:
+        with pytest.raises(InvalidEmbeddingError, match="dimension"):
+            Embedding.from_list([1.0]).dot(Embedding.from_list([1.0, 2.0]))
 
 
+    def test_truncate_should_keep_unit_length_prefix(self) -> None:
+        short = Embedding.from_list([3.0, 4.0, 12.0]).truncate(2)
+        assert short.to_list() == pytest.approx([0.6, 0.8])
+
+    def test_truncate_should_raise_error_when_dimension_out_of_range(self) -> None:
+        with pytest.raises(InvalidEmbeddingError):
+            Embedding.from_list([1.0, 2.0]).truncate(3)
+
 class TestChunkContent:
     def test_chunk_content_should_raise_error_when_text_is_empty(self) -> None:
         with pytest.raises(InvalidChunkError, match="text"):
@@ -52,33 +109,27 @@ class TestChunk:
         assert chunk.has_embedding() is False
 
 
-class TestSplitTextIntoChunks:
-    def test_should_return_empty_list_when_text_is_empty(self) -> None:
-        assert split_text_into_chunks("") == []
 
-    def test_should_return_empty_list_when_text_is_whitespace(self) -> None:
-        assert split_text_into_chunks("   ") == []
+class TestSearchProfile:
+    def test_search_profile_should_default_to_server_settings(self) -> None:
+        profile = SearchProfile()
+        assert profile.ef_search is None
+        assert profile.iterative_scan == "off"
+        assert profile.min_score is None
+
+    @pytest.mark.parametrize("ef_search", [0, 1001])
+    def test_search_profile_should_reject_out_of_range_ef_search(
+        self, ef_search: int
+    ) -> None:
+        with pytest.raises(ValueError, match="ef_search"):
+            SearchProfile(ef_search=ef_search)
 
-    def test_should_return_single_chunk_when_text_fits_in_chunk_size(self) -> None:
-        text = "word " * 10
-        result = split_text_into_chunks(text, chunk_size=500)
-        assert len(result) == 1
-        assert result[0] == " ".join(["word"] * 10)
+    def test_search_profile_should_reject_non_positive_max_scan_tuples(self) -> None:
+        with pytest.raises(ValueError, match="max_scan_tuples"):
+            SearchProfile(max_scan_tuples=0)
 
-    def test_should_split_into_multiple_chunks_when_text_exceeds_chunk_size(
+    def test_search_profile_should_reject_non_positive_rerank_candidates(
         self,
     ) -> None:
-        text = " ".join(f"w{i}" for i in range(20))
-        result = split_text_into_chunks(text, chunk_size=10, overlap=0)
-        assert len(result) == 2
-        assert result[0] == " ".join(f"w{i}" for i in range(10))
-        assert result[1] == " ".join(f"w{i}" for i in range(10, 20))
-
-    def test_should_create_overlapping_chunks_when_overlap_specified(self) -> None:
-        text = " ".join(f"w{i}" for i in range(15))
-        result = split_text_into_chunks(text, chunk_size=10, overlap=5)
-        assert len(result) == 3
-        assert result[0] == " ".join(f"w{i}" for i in range(0, 10))
-        assert result[1] == " ".join(f"w{i}" for i in range(5, 15))
-        # Third chunk contains the tail from position 10
-        assert result[2] == " ".join(f"w{i}" for i in range(10, 15))
+        with pytest.raises(ValueError, match="rerank_candidates"):
+            SearchProfile(rerank_candidates=0)
@@ -0,0 +1,98 @@
+from documentor.domain.models.chunk import Chunk, ChunkContent, RetrievedChunk
+from documentor.domain.services.context_packing import (
+    fit_token_budget,
+    merge_adjacent,
+)
+
+
+def _hit(
+    name: str,
+    text: str,
+    *,
+    document_id: str = "doc-1",
+    position: int = 0,
+    token_count: int = 10,
+) -> RetrievedChunk:
+    chunk = Chunk(
+        id=name,
+        document_id=document_id,
+        content=ChunkContent(text=text, token_count=token_count),
+        position=position,
+    )
+    return RetrievedChunk(chunk=chunk, score=0.5, document_title="Doc")
+
+
+class TestFitTokenBudget:
+    def test_should_skip_hits_that_overflow_and_keep_smaller_ones(self) -> None:
+        results = [
+            _hit("a", "a", token_count=300),
+            _hit("b", "b", token_count=500),
+            _hit("c", "c", token_count=200),
+        ]
+
+        kept = fit_token_budget(results, 600)
+
+        assert [r.chunk.id for r in kept] == ["a", "c"]
+
+    def test_should_always_keep_most_relevant_hit(self) -> None:
+        kept = fit_token_budget([_hit("a", "a", token_count=900)], 600)
+
+        assert [r.chunk.id for r in kept] == ["a"]
+
+
+class TestMergeAdjacent:
+    def test_should_merge_consecutive_chunks_and_drop_overlap(self) -> None:
+        first = "The pool grows on demand. Idle connections are closed after"
+        second = "Idle connections are closed after five minutes of inactivity."
+        results = [
+            _hit("b", second, position=4, token_count=12),
+            _hit("a", first, position=3, token_count=12),
+        ]
+
+        [passage] = merge_adjacent(results)
+
+        assert passage.content.text == (
+            "The pool grows on demand. Idle connections are closed after"
+            " five minutes of inactivity."
+        )
+        assert (passage.id, passage.position) == ("a", 3)
+        assert 12 < passage.content.token_count < 24
+
+    def test_should_join_adjacent_chunks_without_overlap(self) -> None:
+        results = [
+            _hit("a", "# Install", position=0, token_count=2),
+            _hit("b", "Run pip install documentor.", position=1, token_count=5),
+        ]
+
+        [passage] = merge_adjacent(results)
+
+        assert passage.content == ChunkContent(
+            text="# Install\n\nRun pip install documentor.", token_count=7
+        )
+
+    def test_should_keep_gaps_and_other_documents_apart(self) -> None:
+        results = [
+            _hit("a", "First", position=0),
+            _hit("c", "Third", position=2),
+            _hit("x", "Other", document_id="doc-2", position=1),
+        ]
+
+        passages = merge_adjacent(results)
+
+        assert [p.id for p in passages] == ["a", "c", "x"]
+
+    def test_should_order_passages_by_best_member(self) -> None:
+        results = [
+            _hit("x", "Other", document_id="doc-2", position=7),
+            _hit("b", "Second", position=1),
+            _hit("a", "First", position=0),
+        ]
+
+        passages = merge_adjacent(results)
+
+        assert [p.id for p in passages] == ["x", "a"]
+
+    def test_should_return_single_chunks_unchanged(self) -> None:
+        results = [_hit("a", "Only")]
+
+        assert merge_adjacent(results) == [results[0].chunk]
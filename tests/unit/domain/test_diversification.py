@@ -0,0 +1,71 @@
+import pytest
+
+from documentor.domain.models.chunk import (
+    Chunk,
+    ChunkContent,
+    Embedding,
+    RetrievedChunk,
+)
+from documentor.domain.services.diversification import maximal_marginal_relevance
+
+
+def _hit(name: str, score: float, vector: list[float] | None) -> RetrievedChunk:
+    chunk = Chunk(
+        id=name,
+        document_id="doc-1",
+        content=ChunkContent(text=name, token_count=1),
+        position=0,
+        embedding=Embedding.from_list(vector) if vector is not None else None,
+    )
+    return RetrievedChunk(chunk=chunk, score=score, document_title="Doc")
+
+
+class TestMaximalMarginalRelevance:
+    def test_should_skip_near_duplicate_of_selected_chunk(self) -> None:
+        candidates = [
+            _hit("a", 0.90, [1.0, 0.0, 0.0]),
+            _hit("a-overlap", 0.89, [0.99, 0.1, 0.0]),
+            _hit("b", 0.80, [0.0, 1.0, 0.0]),
+        ]
+
+        selected = maximal_marginal_relevance(candidates, top_k=2, lambda_=0.5)
+
+        assert [r.chunk.id for r in selected] == ["a", "b"]
+
+    def test_should_keep_ranking_when_lambda_is_one(self) -> None:
+        candidates = [
+            _hit("a", 0.90, [1.0, 0.0]),
+            _hit("a-overlap", 0.89, [1.0, 0.0]),
+            _hit("b", 0.80, [0.0, 1.0]),
+        ]
+
+        selected = maximal_marginal_relevance(candidates, top_k=2, lambda_=1.0)
+
+        assert [r.chunk.id for r in selected] == ["a", "a-overlap"]
+
+    def test_should_keep_original_scores(self) -> None:
+        candidates = [_hit("a", 0.9, [1.0, 0.0]), _hit("b", 0.5, [0.0, 1.0])]
+
+        selected = maximal_marginal_relevance(candidates, top_k=2)
+
+        assert [r.score for r in selected] == [0.9, 0.5]
+
+    def test_should_not_penalize_candidates_without_embedding(self) -> None:
+        candidates = [
+            _hit("a", 0.9, [1.0, 0.0]),
+            _hit("a-overlap", 0.85, [1.0, 0.0]),
+            _hit("unknown", 0.8, None),
+        ]
+
+        selected = maximal_marginal_relevance(candidates, top_k=2, lambda_=0.5)
+
+        assert [r.chunk.id for r in selected] == ["a", "unknown"]
+
+    def test_should_return_all_candidates_when_fewer_than_top_k(self) -> None:
+        candidates = [_hit("a", 0.9, [1.0, 0.0])]
+
+        assert maximal_marginal_relevance(candidates, top_k=5) == candidates
+
+    def test_should_reject_lambda_outside_unit_interval(self) -> None:
+        with pytest.raises(ValueError):
+            maximal_marginal_relevance([], top_k=5, lambda_=1.5)
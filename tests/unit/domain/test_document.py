@@ -36,3 +36,16 @@ class TestDocument:
                 title="   ",
                 source_type=SourceType.URL,
             )
+
+    def test_touch_should_mark_document_updated_since_creation(self) -> None:
+        doc = Document.create(
+            source="https://example.com",
+            title="Title",
+            source_type=SourceType.URL,
+        )
+        assert doc.updated_at == doc.created_at
+        assert not doc.updated_since(doc.created_at)
+
+        doc.touch()
+
+        assert doc.updated_since(doc.created_at)
@@ -7,7 +7,9 @@ from documentor.domain.exceptions import (
     InvalidChunkError,
     InvalidDocumentError,
     InvalidEmbeddingError,
+    InvalidJobError,
     InvalidQuestionError,
+    JobNotFoundError,
     LLMGenerationError,
 )
 
@@ -16,6 +18,8 @@ class TestDomainExceptions:
     def test_domain_exceptions_should_inherit_from_base_when_checked(self) -> None:
         exceptions = [
             DocumentNotFoundError("123"),
+            JobNotFoundError("456"),
+            InvalidJobError(),
             InvalidDocumentError(),
             InvalidChunkError(),
             InvalidAnswerError(),
@@ -0,0 +1,37 @@
+import pytest
+
+from documentor.domain.exceptions import InvalidJobError
+from documentor.domain.models.ingestion_job import IngestionJob, JobStatus
+
+
+class TestIngestionJob:
+    def test_create_job_should_be_queued_when_using_factory(self) -> None:
+        job = IngestionJob.create(source="https://example.com/docs")
+        assert job.id
+        assert job.status == JobStatus.QUEUED
+        assert job.created_at.tzinfo is not None
+        assert job.attempts == 0
+        assert not job.is_finished
+
+    def test_create_job_should_raise_error_when_source_is_empty(self) -> None:
+        with pytest.raises(InvalidJobError, match="source"):
+            IngestionJob.create(source="  ")
+
+    def test_create_job_should_raise_error_when_payload_has_no_filename(self) -> None:
+        with pytest.raises(InvalidJobError, match="filename"):
+            IngestionJob.create(source="sha256:abc", payload=b"data")
+
+    def test_succeed_should_record_document_and_chunks(self) -> None:
+        job = IngestionJob.create(source="sha256:abc", filename="a.md", payload=b"x")
+        job.succeed("doc-1", chunks_processed=7)
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.document_id == "doc-1"
+        assert job.chunks_processed == 7
+        assert job.is_finished
+
+    def test_fail_should_record_error(self) -> None:
+        job = IngestionJob.create(source="https://example.com/docs")
+        job.fail("boom")
+        assert job.status == JobStatus.FAILED
+        assert job.error == "boom"
+        assert job.is_finished
@@ -0,0 +1,28 @@
+from documentor.domain.services.query_decomposition import decompose_query
+
+
+class TestDecomposeQuery:
+    def test_should_split_separate_questions(self) -> None:
+        assert decompose_query("What is Depends? How are background tasks run?") == [
+            "What is Depends?",
+            "How are background tasks run?",
+        ]
+
+    def test_should_split_conjoined_questions(self) -> None:
+        assert decompose_query(
+            "How do I install FastAPI and how do I deploy it to AWS?"
+        ) == ["How do I install FastAPI", "how do I deploy it to AWS?"]
+
+    def test_should_not_split_conjoined_objects(self) -> None:
+        assert decompose_query("What is the difference between lists and tuples?") == []
+
+    def test_should_return_empty_list_for_single_question(self) -> None:
+        assert decompose_query("Explain routers") == []
+
+    def test_should_cap_sub_queries(self) -> None:
+        text = "What is A? What is B? What is C? What is D?"
+
+        assert decompose_query(text, max_queries=2) == ["What is A?", "What is B?"]
+
+    def test_should_drop_duplicate_sub_queries(self) -> None:
+        assert decompose_query("What is Depends? What is Depends?") == []
@@ -0,0 +1,37 @@
+from documentor.domain.models.chunk import Chunk, ChunkContent, RetrievedChunk
+from documentor.domain.services.rank_fusion import reciprocal_rank_fusion
+
+
+def _hit(name: str, score: float) -> RetrievedChunk:
+    chunk = Chunk(
+        id=name,
+        document_id="doc-1",
+        content=ChunkContent(text=name, token_count=1),
+        position=0,
+    )
+    return RetrievedChunk(chunk=chunk, score=score, document_title="Doc")
+
+
+class TestReciprocalRankFusion:
+    def test_should_rank_chunks_found_by_both_rankings_first(self) -> None:
+        vector = [_hit("a", 0.9), _hit("b", 0.8), _hit("c", 0.7)]
+        lexical = [_hit("d", 0.5), _hit("c", 0.4)]
+
+        fused = reciprocal_rank_fusion([vector, lexical])
+
+        assert [r.chunk.id for r in fused] == ["c", "a", "d", "b"]
+
+    def test_should_keep_score_from_first_ranking_listing_chunk(self) -> None:
+        fused = reciprocal_rank_fusion([[_hit("a", 0.9)], [_hit("a", 0.2)]])
+
+        assert [r.score for r in fused] == [0.9]
+
+    def test_should_truncate_to_top_k(self) -> None:
+        fused = reciprocal_rank_fusion(
+            [[_hit("a", 0.9), _hit("b", 0.8)], [_hit("c", 0.3)]], top_k=2
+        )
+
+        assert [r.chunk.id for r in fused] == ["a", "c"]
+
+    def test_should_return_empty_list_for_empty_rankings(self) -> None:
+        assert reciprocal_rank_fusion([[], []]) == []
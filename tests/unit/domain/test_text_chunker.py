@@ -0,0 +1,101 @@
+import pytest
+
+from documentor.domain.services.text_chunker import TextChunker
+from tests.fakes import WordTokenizer
+
+
+def _words(prefix: str, count: int) -> str:
+    return " ".join(f"{prefix}{i}" for i in range(count))
+
+
+class TestTextChunker:
+    def test_split_should_return_empty_list_when_text_is_blank(
+        self, tokenizer: WordTokenizer
+    ) -> None:
+        chunker = TextChunker(tokenizer)
+        assert chunker.split("") == []
+        assert chunker.split("  \n\t ") == []
+
+    def test_split_should_return_single_chunk_with_exact_token_count(
+        self, tokenizer: WordTokenizer
+    ) -> None:
+        text = "First paragraph here.\n\nSecond one."
+        [chunk] = TextChunker(tokenizer).split(text)
+        assert chunk.text == text
+        assert chunk.token_count == len(tokenizer.encode(chunk.text))
+
+    def test_split_should_never_exceed_max_tokens(
+        self, tokenizer: WordTokenizer
+    ) -> None:
+        paragraphs = [_words(f"p{n}w", 7) for n in range(20)]
+        chunks = TextChunker(tokenizer, max_tokens=30, overlap_tokens=5).split(
+            "\n\n".join(paragraphs)
+        )
+        assert len(chunks) > 1
+        assert all(chunk.token_count <= 30 for chunk in chunks)
+        assert "\n\n".join(chunk.text for chunk in chunks) == "\n\n".join(paragraphs)
+
+    def test_split_should_start_new_chunk_at_markdown_heading(
+        self, tokenizer: WordTokenizer
+    ) -> None:
+        text = f"# Intro\n\n{_words('a', 10)}\n\n## Usage\n\n{_words('b', 10)}"
+        chunks = TextChunker(tokenizer, max_tokens=100, min_section_tokens=5).split(text)
+        assert [chunk.text.splitlines()[0] for chunk in chunks] == ["# Intro", "## Usage"]
+
+    def test_split_should_keep_small_sections_together_below_min_size(
+        self, tokenizer: WordTokenizer
+    ) -> None:
+        text = "# One\n\nshort\n\n# Two\n\nshort too"
+        assert len(TextChunker(tokenizer, max_tokens=100).split(text)) == 1
+
+    def test_split_should_recognize_rst_and_html_headings(
+        self, tokenizer: WordTokenizer
+    ) -> None:
+        text = (
+            f"Overview\n========\n\n{_words('a', 10)}\n\n"
+            f"<h2>Details</h2>\n\n{_words('b', 10)}"
+        )
+        chunks = TextChunker(tokenizer, max_tokens=100, min_section_tokens=5).split(text)
+        assert chunks[0].text.startswith("Overview\n========")
+        assert chunks[1].text.startswith("<h2>Details</h2>")
+
+    def test_split_should_not_leave_heading_at_end_of_chunk(
+        self, tokenizer: WordTokenizer
+    ) -> None:
+        text = f"{_words('a', 20)}\n\n# Next\n\n{_words('b', 20)}"
+        chunks = TextChunker(
+            tokenizer, max_tokens=25, overlap_tokens=0, min_section_tokens=50
+        ).split(text)
+        assert chunks[0].text == _words("a", 20)
+        assert chunks[1].text.startswith("# Next")
+
+    def test_split_should_keep_code_fence_whole(
+        self, tokenizer: WordTokenizer
+    ) -> None:
+        fence = "```python\ndef f():\n\n    return 1\n```"
+        text = f"{_words('a', 15)}\n\n{fence}\n\n{_words('b', 15)}"
+        chunks = TextChunker(tokenizer, max_tokens=20, overlap_tokens=0).split(text)
+        assert any(chunk.text == fence for chunk in chunks)
+
+    def test_split_should_window_oversized_block_with_overlap(
+        self, tokenizer: WordTokenizer
+    ) -> None:
+        chunks = TextChunker(tokenizer, max_tokens=10, overlap_tokens=4).split(
+            _words("w", 22)
+        )
+        assert [chunk.token_count for chunk in chunks] == [10, 10, 10]
+        assert chunks[0].text.split()[-4:] == chunks[1].text.split()[:4]
+        assert chunks[-1].text.endswith("w21")
+
+    def test_iter_chunks_should_yield_lazily(self, tokenizer: WordTokenizer) -> None:
+        chunks = TextChunker(tokenizer, max_tokens=10, overlap_tokens=0).iter_chunks(
+            _words("w", 25)
+        )
+        assert next(chunks).text == _words("w", 10)
+        assert len(list(chunks)) == 2
+
+    def test_init_should_raise_error_when_overlap_not_below_max(
+        self, tokenizer: WordTokenizer
+    ) -> None:
+        with pytest.raises(ValueError, match="overlap_tokens"):
+            TextChunker(tokenizer, max_tokens=10, overlap_tokens=10)
@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from documentor.domain.models.chunk import Chunk, ChunkContent
+from documentor.domain.models.conversation import ConversationMessage
+from documentor.domain.models.question import Question
+from documentor.infrastructure.external.anthropic_llm_service import (
+    AnthropicLLMService,
+)
+from documentor.infrastructure.external.llm_usage import LLMUsage, collect_usage
+
+_HISTORY = (
+    ConversationMessage(role="user", content="What is FastAPI?"),
+    ConversationMessage(role="assistant", content="A web framework."),
+)
+_CHUNK = Chunk.create(
+    document_id="doc-1",
+    content=ChunkContent(text="FastAPI supports dependency injection.", token_count=5),
+    position=0,
+)
+
+
+def _make_response(text: str = "the answer") -> object:
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(
+            input_tokens=40,
+            output_tokens=12,
+            cache_read_input_tokens=1500,
+            cache_creation_input_tokens=None,
+        ),
+    )
+
+
+@pytest.fixture
+def service() -> AnthropicLLMService:
+    service = AnthropicLLMService(api_key="test-key")
+    service._client.messages.create = AsyncMock(return_value=_make_response())
+    return service
+
+
+@pytest.mark.asyncio
+async def test_generate_should_keep_system_prompt_and_history_as_cached_prefix(
+    service: AnthropicLLMService,
+) -> None:
+    await service.generate(Question(text="Does it support DI?"), [_CHUNK], _HISTORY)
+
+    kwargs = service._client.messages.create.await_args.kwargs
+    assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "--- CONTEXT ---" not in kwargs["system"][0]["text"]
+    messages = kwargs["messages"]
+    assert messages[0] == {"role": "user", "content": "What is FastAPI?"}
+    assert messages[1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert messages[1]["content"][0]["text"] == "A web framework."
+    assert messages[2]["role"] == "user"
+    assert _CHUNK.content.text in messages[2]["content"]
+    assert messages[2]["content"].endswith("Question: Does it support DI?")
+
+
+@pytest.mark.asyncio
+async def test_generate_should_send_only_the_question_message_without_history(
+    service: AnthropicLLMService,
+) -> None:
+    await service.generate(Question(text="Does it support DI?"), [_CHUNK])
+
+    messages = service._client.messages.create.await_args.kwargs["messages"]
+    assert len(messages) == 1
+    assert messages[0]["role"] == "user"
+
+
+@pytest.mark.asyncio
+async def test_generate_should_report_cache_usage(
+    service: AnthropicLLMService,
+) -> None:
+    with collect_usage() as usages:
+        await service.generate(Question(text="Does it support DI?"), [_CHUNK])
+
+    assert usages == [
+        LLMUsage(
+            input_tokens=40,
+            output_tokens=12,
+            cache_read_input_tokens=1500,
+            cache_creation_input_tokens=0,
+        )
+    ]
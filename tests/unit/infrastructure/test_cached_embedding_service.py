@@ -0,0 +1,140 @@
+import hashlib
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from documentor.domain.models.chunk import Embedding
+from documentor.domain.services.embedding_service import EmbeddingService
+from documentor.infrastructure.cache import CacheStats
+from documentor.infrastructure.cached_embedding_service import CachedEmbeddingService
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _embedding(value: float) -> Embedding:
+    return Embedding.from_list([value, 1.0])
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+    mock = AsyncMock(spec=EmbeddingService)
+    mock.embed_batch.side_effect = lambda texts: [
+        _embedding(float(len(text))) for text in texts
+    ]
+    mock.embed.side_effect = lambda text: _embedding(float(len(text)))
+    mock.count_tokens = Mock(return_value=7)
+    return mock
+
+
+@pytest.fixture
+def cache() -> AsyncMock:
+    mock = AsyncMock()
+    mock.get_many.return_value = {}
+    return mock
+
+
+@pytest.fixture
+def service(inner: AsyncMock, cache: AsyncMock) -> CachedEmbeddingService:
+    return CachedEmbeddingService(inner, cache, model="test-model")
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_should_only_embed_misses_and_keep_input_order(
+    service: CachedEmbeddingService,
+    inner: AsyncMock,
+    cache: AsyncMock,
+) -> None:
+    cached = _embedding(99.0)
+    cache.get_many.return_value = {_hash("bb"): cached}
+
+    result = await service.embed_batch(["a", "bb", "ccc"])
+
+    inner.embed_batch.assert_awaited_once_with(["a", "ccc"])
+    assert result == [_embedding(1.0), cached, _embedding(3.0)]
+    cache.get_many.assert_awaited_once_with(
+        "test-model", {_hash("a"), _hash("bb"), _hash("ccc")}
+    )
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_should_store_computed_embeddings_by_content_hash(
+    service: CachedEmbeddingService,
+    cache: AsyncMock,
+) -> None:
+    await service.embed_batch(["a", "bb"])
+
+    cache.put_many.assert_awaited_once_with(
+        "test-model", {_hash("a"): _embedding(1.0), _hash("bb"): _embedding(2.0)}
+    )
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_should_skip_upstream_when_everything_is_cached(
+    service: CachedEmbeddingService,
+    inner: AsyncMock,
+    cache: AsyncMock,
+) -> None:
+    cache.get_many.return_value = {_hash("a"): _embedding(5.0)}
+
+    result = await service.embed_batch(["a", "a"])
+
+    assert result == [_embedding(5.0), _embedding(5.0)]
+    inner.embed_batch.assert_not_awaited()
+    cache.put_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_should_embed_duplicate_misses_once(
+    service: CachedEmbeddingService,
+    inner: AsyncMock,
+) -> None:
+    result = await service.embed_batch(["same", "same"])
+
+    inner.embed_batch.assert_awaited_once_with(["same"])
+    assert len(result) == 2
+
+
+@pytest.mark.asyncio
+async def test_embed_should_return_cached_embedding_when_present(
+    service: CachedEmbeddingService,
+    inner: AsyncMock,
+    cache: AsyncMock,
+) -> None:
+    cache.get_many.return_value = {_hash("query"): _embedding(42.0)}
+
+    result = await service.embed("query")
+
+    assert result == _embedding(42.0)
+    inner.embed.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_embed_should_fall_back_to_inner_when_cache_fails(
+    service: CachedEmbeddingService,
+    inner: AsyncMock,
+    cache: AsyncMock,
+) -> None:
+    cache.get_many.side_effect = RuntimeError("db down")
+    cache.put_many.side_effect = RuntimeError("db down")
+
+    result = await service.embed("query")
+
+    assert result == _embedding(5.0)
+    inner.embed.assert_awaited_once_with("query")
+
+
+def test_count_tokens_should_delegate_to_inner(
+    service: CachedEmbeddingService,
+) -> None:
+    assert service.count_tokens("hello") == 7
+
+
+def test_cache_stats_should_report_hit_rate() -> None:
+    stats = CacheStats()
+    assert stats.hit_rate == 0.0
+
+    stats.record(hits=3, misses=1)
+
+    assert stats.hit_rate == 0.75
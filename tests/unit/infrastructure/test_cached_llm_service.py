@@ -0,0 +1,139 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from documentor.domain.models.conversation import ConversationMessage
+from documentor.domain.models.question import Question
+from documentor.domain.services.llm_service import LLMService
+from documentor.infrastructure.cache import LruTtlCache
+from documentor.infrastructure.cached_llm_service import (
+    RewriteCachingLLMService,
+    rewrite_cache_key,
+)
+from documentor.infrastructure.external.prompt_builder import (
+    MAX_REWRITE_HISTORY_MESSAGES,
+)
+
+_HISTORY = (
+    ConversationMessage(role="user", content="Tell me about FastAPI"),
+    ConversationMessage(role="assistant", content="FastAPI is a web framework."),
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+    mock = AsyncMock(spec=LLMService)
+    mock.rewrite_query.return_value = "How to install FastAPI"
+    return mock
+
+
+@pytest.fixture
+def cache() -> LruTtlCache[str]:
+    return LruTtlCache(max_entries=100, ttl=60.0)
+
+
+@pytest.fixture
+def service(inner: AsyncMock, cache: LruTtlCache[str]) -> RewriteCachingLLMService:
+    return RewriteCachingLLMService(inner, cache, model="openai:gpt-4o-mini")
+
+
+@pytest.mark.asyncio
+async def test_rewrite_query_should_reuse_rewrite_for_same_turn(
+    service: RewriteCachingLLMService,
+    inner: AsyncMock,
+    cache: LruTtlCache[str],
+) -> None:
+    first = await service.rewrite_query(Question(text="How to install?"), _HISTORY)
+    second = await service.rewrite_query(Question(text="How to install?"), _HISTORY)
+
+    assert first == second == "How to install FastAPI"
+    inner.rewrite_query.assert_awaited_once()
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_rewrite_query_should_call_inner_when_question_differs(
+    service: RewriteCachingLLMService,
+    inner: AsyncMock,
+) -> None:
+    await service.rewrite_query(Question(text="How to install?"), _HISTORY)
+    await service.rewrite_query(Question(text="How to deploy?"), _HISTORY)
+
+    assert inner.rewrite_query.await_count == 2
+
+
+def test_rewrite_cache_key_should_ignore_history_outside_prompt_window() -> None:
+    question = Question(text="And then?")
+    recent = tuple(
+        ConversationMessage(role="user", content=f"message {i}")
+        for i in range(MAX_REWRITE_HISTORY_MESSAGES)
+    )
+    older = (ConversationMessage(role="user", content="long forgotten"),)
+
+    assert rewrite_cache_key("m", question, older + recent) == rewrite_cache_key(
+        "m", question, recent
+    )
+    assert rewrite_cache_key("m", question, recent) != rewrite_cache_key(
+        "other", question, recent
+    )
+
+
+@pytest.mark.asyncio
+async def test_rewrite_query_should_share_call_between_concurrent_retries(
+    service: RewriteCachingLLMService,
+    inner: AsyncMock,
+) -> None:
+    release = asyncio.Event()
+
+    async def slow_rewrite(question, history) -> str:
+        await release.wait()
+        return "rewritten"
+
+    inner.rewrite_query.side_effect = slow_rewrite
+    requests = [
+        asyncio.create_task(service.rewrite_query(Question(text="Why?"), _HISTORY))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*requests) == ["rewritten"] * 3
+    inner.rewrite_query.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_generate_should_delegate_to_inner(
+    service: RewriteCachingLLMService,
+    inner: AsyncMock,
+) -> None:
+    inner.generate.return_value = "answer"
+    inner.generate_stream = MagicMock(return_value="stream")
+
+    assert await service.generate(Question(text="Q?"), []) == "answer"
+    assert service.generate_stream(Question(text="Q?"), []) == "stream"
+
+
+def test_lru_ttl_cache_should_expire_and_evict_least_recently_used() -> None:
+    clock = _Clock()
+    cache: LruTtlCache[str] = LruTtlCache(max_entries=2, ttl=10.0, clock=clock)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+
+    clock.now = 10.0
+
+    assert cache.get("a") is None
+    assert cache.get("c") is None
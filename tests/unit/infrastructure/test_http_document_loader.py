@@ -0,0 +1,100 @@
+import asyncio
+import socket
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from documentor.domain.exceptions import DocumentLoadError
+from documentor.infrastructure.external.http_document_loader import (
+    HttpDocumentLoader,
+)
+
+_PUBLIC_ADDRINFO = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+_PRIVATE_ADDRINFO = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.5", 0))]
+
+
+@pytest.fixture
+def resolver(monkeypatch: pytest.MonkeyPatch) -> Callable[[list], list[str]]:
+    """Patch DNS for the running loop; returns the list of resolved hostnames."""
+    calls: list[str] = []
+
+    def install(addrinfo: list) -> list[str]:
+        async def getaddrinfo(host: str, *args: object, **kwargs: object) -> list:
+            calls.append(host)
+            return addrinfo
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+        return calls
+
+    return install
+
+
+def _client(handler: Callable[[httpx.Request], httpx.Response]) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_load_should_return_document_when_url_is_public(resolver) -> None:
+    resolver(_PUBLIC_ADDRINFO)
+    client = _client(lambda request: httpx.Response(200, text="# Guide\n\nBody"))
+
+    result = await HttpDocumentLoader(client).load("https://docs.example.com/guide")
+
+    assert result.title == "Guide"
+    assert result.content == "# Guide\n\nBody"
+
+
+@pytest.mark.asyncio
+async def test_load_should_reject_url_when_host_resolves_to_private_ip(
+    resolver,
+) -> None:
+    resolver(_PRIVATE_ADDRINFO)
+    client = _client(lambda request: httpx.Response(200, text="secret"))
+
+    with pytest.raises(DocumentLoadError, match="private or reserved"):
+        await HttpDocumentLoader(client).load("https://internal.example.com/")
+
+
+@pytest.mark.asyncio
+async def test_load_should_resolve_host_once_when_client_is_shared(resolver) -> None:
+    calls = resolver(_PUBLIC_ADDRINFO)
+    client = _client(lambda request: httpx.Response(200, text="page"))
+    loader = HttpDocumentLoader(client)
+
+    await loader.load("https://docs.example.com/a")
+    await loader.load("https://docs.example.com/b")
+
+    assert calls == ["docs.example.com"]
+
+
+@pytest.mark.asyncio
+async def test_load_should_wrap_http_errors(resolver) -> None:
+    resolver(_PUBLIC_ADDRINFO)
+    client = _client(lambda request: httpx.Response(404))
+
+    with pytest.raises(DocumentLoadError, match="Failed to load URL"):
+        await HttpDocumentLoader(client).load("https://docs.example.com/missing")
+
+
+@pytest.mark.asyncio
+async def test_load_should_limit_concurrent_requests_per_host(resolver) -> None:
+    resolver(_PUBLIC_ADDRINFO)
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text="page")
+
+    loader = HttpDocumentLoader(_client(handler), max_connections_per_host=2)
+
+    await asyncio.gather(
+        *(loader.load(f"https://docs.example.com/{i}") for i in range(6))
+    )
+
+    assert peak == 2
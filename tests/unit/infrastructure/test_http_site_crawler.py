@@ -0,0 +1,135 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from documentor.domain.exceptions import DocumentLoadError
+from documentor.domain.models.document import SourceType
+from documentor.domain.services.document_loader_service import LoadedDocument
+from documentor.domain.services.site_crawler import CrawledPage
+from documentor.infrastructure.external.http_site_crawler import HttpSiteCrawler
+
+
+class _FakeLoader:
+    """Serves pages from a dict; unknown URLs fail like a 404."""
+
+    def __init__(
+        self, pages: dict[str, str], broken: frozenset[str] = frozenset()
+    ) -> None:
+        self._pages = pages
+        self._broken = broken
+        self.requested: list[str] = []
+
+    async def fetch_text(self, url: str) -> str:
+        self.requested.append(url)
+        if url in self._broken:
+            raise ValueError(f"Invalid port in '{url}'")
+        if url not in self._pages:
+            raise DocumentLoadError(f"Failed to load URL '{url}': 404")
+        return self._pages[url]
+
+    async def load(self, url: str) -> LoadedDocument:
+        content = await self.fetch_text(url)
+        return LoadedDocument(content=content, title=url, source_type=SourceType.URL)
+
+
+async def _crawl(loader: _FakeLoader, url: str, max_pages: int = 100) -> dict:
+    crawler = HttpSiteCrawler(loader, concurrency=3)  # type: ignore[arg-type]
+    return await _collect(crawler.crawl(url, max_pages=max_pages))
+
+
+async def _collect(pages: AsyncIterator[CrawledPage]) -> dict[str, CrawledPage]:
+    return {page.url: page async for page in pages}
+
+
+@pytest.mark.asyncio
+async def test_crawl_should_follow_links_within_seed_directory() -> None:
+    loader = _FakeLoader(
+        {
+            "https://example.com/docs/": (
+                '<a href="intro">Intro</a> <a href="/docs/api#x">API</a>'
+                ' <a href="/blog/">Blog</a> <a href="https://other.com/docs/">Other</a>'
+                ' <a href="logo.png">Logo</a>'
+            ),
+            "https://example.com/docs/intro": '<a href="/docs/">Home</a>',
+            "https://example.com/docs/api": "API reference",
+        }
+    )
+
+    pages = await _crawl(loader, "https://example.com/docs/")
+
+    assert set(pages) == {
+        "https://example.com/docs/",
+        "https://example.com/docs/intro",
+        "https://example.com/docs/api",
+    }
+    assert sorted(loader.requested) == sorted(pages)
+
+
+@pytest.mark.asyncio
+async def test_crawl_should_stop_at_max_pages() -> None:
+    links = " ".join(f'<a href="/docs/p{i}">p</a>' for i in range(20))
+    pages = {"https://example.com/docs/": links} | {
+        f"https://example.com/docs/p{i}": "page" for i in range(20)
+    }
+
+    crawled = await _crawl(_FakeLoader(pages), "https://example.com/docs/", 5)
+
+    assert len(crawled) == 5
+
+
+@pytest.mark.asyncio
+async def test_crawl_should_read_sitemap_index_and_report_failed_pages() -> None:
+    loader = _FakeLoader(
+        {
+            "https://example.com/sitemap.xml": (
+                "<sitemapindex><sitemap><loc>https://example.com/s1.xml</loc>"
+                "</sitemap></sitemapindex>"
+            ),
+            "https://example.com/s1.xml": (
+                "<urlset><url><loc>https://example.com/a</loc></url>"
+                "<url><loc> https://example.com/gone </loc></url></urlset>"
+            ),
+            "https://example.com/a": "page a",
+        }
+    )
+
+    pages = await _crawl(loader, "https://example.com/sitemap.xml")
+
+    assert pages["https://example.com/a"].document is not None
+    assert pages["https://example.com/gone"].document is None
+    assert "404" in (pages["https://example.com/gone"].error or "")
+
+
+@pytest.mark.asyncio
+async def test_crawl_should_yield_error_when_sitemap_unreachable() -> None:
+    pages = await _crawl(_FakeLoader({}), "https://example.com/sitemap.xml")
+
+    assert list(pages) == ["https://example.com/sitemap.xml"]
+    assert pages["https://example.com/sitemap.xml"].error
+
+
+@pytest.mark.asyncio
+async def test_crawl_should_report_unexpected_errors_and_keep_crawling() -> None:
+    loader = _FakeLoader(
+        {
+            "https://example.com/docs/": (
+                '<a href="/docs/bad">Bad</a> <a href="/docs/a">A</a>'
+                ' <a href="/docs/b">B</a>'
+            ),
+            "https://example.com/docs/a": "page a",
+            "https://example.com/docs/b": "page b",
+        },
+        broken=frozenset({"https://example.com/docs/bad"}),
+    )
+    crawler = HttpSiteCrawler(loader, concurrency=1)  # type: ignore[arg-type]
+
+    pages = await asyncio.wait_for(
+        _collect(crawler.crawl("https://example.com/docs/", max_pages=10)), timeout=1
+    )
+
+    assert pages["https://example.com/docs/bad"].error == (
+        "Unexpected error while crawling"
+    )
+    assert pages["https://example.com/docs/a"].document is not None
+    assert pages["https://example.com/docs/b"].document is not None
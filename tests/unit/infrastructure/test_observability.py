@@ -7,6 +7,7 @@ from documentor.domain.models.chunk import Embedding
 from documentor.domain.models.question import Question
 from documentor.domain.services.embedding_service import EmbeddingService
 from documentor.domain.services.llm_service import LLMService
+from documentor.infrastructure.external.llm_usage import LLMUsage, report_usage
 from documentor.infrastructure.observability import (
     ObservedEmbeddingService,
     ObservedLLMService,
@@ -74,6 +75,46 @@ async def test_generate_stream_should_yield_all_chunks_from_inner(
     assert chunks == ["Hello", " ", "world"]
 
 
+@pytest.mark.asyncio
+async def test_generate_should_record_usage_reported_by_inner(
+    inner_llm: AsyncMock,
+) -> None:
+    async def generate(*_args: object) -> str:
+        report_usage(
+            LLMUsage(
+                input_tokens=40,
+                output_tokens=12,
+                cache_read_input_tokens=1500,
+                cache_creation_input_tokens=0,
+            )
+        )
+        return "the answer"
+
+    inner_llm.generate.side_effect = generate
+    span = MagicMock()
+
+    @contextmanager
+    def observation(**_kwargs: object) -> object:
+        yield span
+
+    mock_client = MagicMock()
+    mock_client.start_as_current_observation = MagicMock(side_effect=observation)
+    with patch(
+        "documentor.infrastructure.observability.get_client", return_value=mock_client
+    ):
+        await ObservedLLMService(inner_llm).generate(Question(text="What is RAG?"), [])
+
+    span.update.assert_called_once_with(
+        output="the answer",
+        usage_details={
+            "input": 40,
+            "output": 12,
+            "cache_read_input_tokens": 1500,
+            "cache_creation_input_tokens": 0,
+        },
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("_mock_langfuse")
 async def test_rewrite_query_should_delegate_to_inner_and_return_result(
@@ -1,8 +1,12 @@
+import asyncio
+import base64
+from array import array
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from documentor.domain.exceptions import EmbeddingGenerationError
 from documentor.infrastructure.external.openai_embedding_service import (
     OpenAIEmbeddingService,
     _MAX_BATCH_SIZE,
@@ -74,3 +78,118 @@ async def test_embed_batch_should_return_empty_list_when_no_texts(
     result = await service.embed_batch([])
 
     assert result == []
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_should_split_by_token_budget_when_batch_too_long() -> None:
+    with patch("tiktoken.encoding_for_model"):
+        service = OpenAIEmbeddingService(api_key="test-key", max_batch_tokens=10)
+    service._encoding.encode = lambda text: text.split()
+    texts = ["one two three four", "five six seven eight", "nine ten eleven"]
+    service._client.embeddings.create = AsyncMock(
+        side_effect=lambda model, input, **_: _make_embedding_response(len(input))
+    )
+
+    result = await service.embed_batch(texts)
+
+    assert len(result) == 3
+    inputs = [
+        call.kwargs["input"]
+        for call in service._client.embeddings.create.call_args_list
+    ]
+    assert inputs == [texts[:2], texts[2:]]
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_should_preserve_input_order_when_batches_race() -> None:
+    with patch("tiktoken.encoding_for_model"):
+        service = OpenAIEmbeddingService(api_key="test-key", max_batch_tokens=1)
+    service._encoding.encode = lambda text: [text]
+    texts = ["first", "second", "third"]
+    delays = {"first": 0.03, "second": 0.0, "third": 0.01}
+
+    async def create(model: str, input: list[str], **_: object) -> object:
+        await asyncio.sleep(delays[input[0]])
+        weight = float(texts.index(input[0]))
+        return _make_embedding_response(1, vector=[weight, 1.0])
+
+    service._client.embeddings.create = AsyncMock(side_effect=create)
+
+    result = await service.embed_batch(texts)
+
+    assert [embedding.vector[0] for embedding in result] == [0.0, 1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_should_limit_concurrent_requests_when_configured() -> None:
+    with patch("tiktoken.encoding_for_model"):
+        service = OpenAIEmbeddingService(
+            api_key="test-key", max_concurrency=2, max_batch_tokens=1
+        )
+    service._encoding.encode = lambda text: [text]
+    in_flight = 0
+    peak = 0
+
+    async def create(model: str, input: list[str], **_: object) -> object:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _make_embedding_response(len(input))
+
+    service._client.embeddings.create = AsyncMock(side_effect=create)
+
+    result = await service.embed_batch([f"text-{i}" for i in range(6)])
+
+    assert len(result) == 6
+    assert service._client.embeddings.create.await_count == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_should_raise_embedding_error_when_sub_batch_fails(
+    service: OpenAIEmbeddingService,
+) -> None:
+    service._client.embeddings.create = AsyncMock(side_effect=RuntimeError("boom"))
+
+    with pytest.raises(EmbeddingGenerationError, match="boom"):
+        await service.embed_batch(["text"])
+
+
+@pytest.mark.asyncio
+async def test_embed_should_decode_base64_float32_payload(
+    service: OpenAIEmbeddingService,
+) -> None:
+    payload = base64.b64encode(array("f", [0.5, -1.0]).tobytes()).decode()
+    service._client.embeddings.create = AsyncMock(
+        return_value=SimpleNamespace(
+            data=[SimpleNamespace(index=0, embedding=payload)]
+        )
+    )
+
+    result = await service.embed("hello")
+
+    assert result.to_list() == [0.5, -1.0]
+    kwargs = service._client.embeddings.create.await_args.kwargs
+    assert kwargs["encoding_format"] == "base64"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("model", "expected"),
+    [("text-embedding-3-small", {"dimensions": 512}), ("text-embedding-ada-002", {})],
+)
+async def test_embed_should_request_dimensions_when_model_supports_them(
+    model: str, expected: dict[str, int]
+) -> None:
+    with patch("tiktoken.encoding_for_model"):
+        service = OpenAIEmbeddingService(api_key="k", model=model, dimensions=512)
+    service._client.embeddings.create = AsyncMock(
+        return_value=_make_embedding_response(1)
+    )
+
+    await service.embed("hello")
+
+    kwargs = service._client.embeddings.create.await_args.kwargs
+    assert {k: v for k, v in kwargs.items() if k == "dimensions"} == expected
@@ -1,9 +1,12 @@
+from documentor.domain.models.chunk import Chunk, ChunkContent
 from documentor.domain.models.conversation import ConversationMessage
 from documentor.domain.models.question import Question
 from documentor.infrastructure.external.prompt_builder import (
     MAX_REWRITE_HISTORY_CHARS,
     MAX_REWRITE_HISTORY_MESSAGES,
     build_query_rewrite_prompt,
+    build_rag_system_prompt,
+    build_rag_user_message,
     build_rewrite_user_message,
 )
 
@@ -83,3 +86,24 @@ def test_build_rewrite_user_message_should_truncate_when_history_exceeds_char_li
     assert "Should not appear" not in message
     assert "..." in message
     assert "Follow up" in message
+
+
+def test_build_rag_system_prompt_should_not_depend_on_the_request() -> None:
+    assert build_rag_system_prompt() == build_rag_system_prompt()
+    assert "CONTEXT" not in build_rag_system_prompt()
+
+
+def test_build_rag_user_message_should_put_context_before_question() -> None:
+    chunk = Chunk.create(
+        document_id="doc-1",
+        content=ChunkContent(text="Python is a language.", token_count=5),
+        position=0,
+    )
+
+    message = build_rag_user_message(Question(text="What is Python?"), [chunk])
+
+    assert f"chunk_id={chunk.id}" in message
+    assert "document_id=doc-1" in message
+    assert message.index("Python is a language.") < message.index(
+        "Question: What is Python?"
+    )
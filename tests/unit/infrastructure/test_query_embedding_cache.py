@@ -0,0 +1,141 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from documentor.domain.models.chunk import Embedding
+from documentor.domain.services.embedding_service import EmbeddingService
+from documentor.infrastructure.cached_embedding_service import (
+    QueryCachedEmbeddingService,
+)
+from documentor.infrastructure.query_embedding_cache import QueryEmbeddingCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _embedding(value: float, dimension: int = 4) -> Embedding:
+    return Embedding.from_list([value] * dimension)
+
+
+def _cache(**kwargs: object) -> QueryEmbeddingCache:
+    options: dict = {"max_bytes": 1_000_000, "ttl": 60.0} | kwargs
+    return QueryEmbeddingCache(**options)
+
+
+def test_get_should_hit_normalized_query_and_record_stats() -> None:
+    cache = _cache()
+    cache.put("How do I  install?", _embedding(1.0))
+
+    assert cache.get("  how do i install? ") == _embedding(1.0)
+    assert cache.get("how do I uninstall?") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_get_should_match_exact_text_when_normalization_disabled() -> None:
+    cache = _cache(normalize=False)
+    cache.put("Install", _embedding(1.0))
+
+    assert cache.get("install") is None
+    assert cache.get("Install") == _embedding(1.0)
+
+
+def test_get_should_drop_entry_after_ttl() -> None:
+    clock = _Clock()
+    cache = _cache(ttl=10.0, clock=clock)
+    cache.put("query", _embedding(1.0))
+
+    clock.now = 9.9
+    assert cache.get("query") is not None
+    clock.now = 10.0
+    assert cache.get("query") is None
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_put_should_evict_least_recently_used_beyond_max_bytes() -> None:
+    probe = _cache()
+    probe.put("a", _embedding(0.0, 256))
+    cache = _cache(max_bytes=probe.nbytes * 2)
+
+    cache.put("a", _embedding(1.0, 256))
+    cache.put("b", _embedding(2.0, 256))
+    cache.get("a")
+    cache.put("c", _embedding(3.0, 256))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.nbytes <= probe.nbytes * 2
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+    mock = AsyncMock(spec=EmbeddingService)
+    mock.embed.side_effect = lambda text: _embedding(float(len(text)))
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_embed_should_skip_inner_service_for_repeated_query(
+    inner: AsyncMock,
+) -> None:
+    service = QueryCachedEmbeddingService(inner, _cache())
+
+    first = await service.embed("What is DocuMentor?")
+    second = await service.embed("what is  documentor?")
+
+    assert first == second
+    inner.embed.assert_awaited_once_with("What is DocuMentor?")
+
+
+@pytest.mark.asyncio
+async def test_embed_should_share_one_call_between_concurrent_misses(
+    inner: AsyncMock,
+) -> None:
+    release = asyncio.Event()
+
+    async def slow_embed(text: str) -> Embedding:
+        await release.wait()
+        return _embedding(1.0)
+
+    inner.embed.side_effect = slow_embed
+    cache = _cache()
+    requests = [
+        asyncio.create_task(QueryCachedEmbeddingService(inner, cache).embed("query"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*requests) == [_embedding(1.0)] * 3
+    inner.embed.assert_awaited_once()
+    assert cache.in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_embed_should_not_cache_failures(inner: AsyncMock) -> None:
+    inner.embed.side_effect = [RuntimeError("rate limited"), _embedding(1.0)]
+    service = QueryCachedEmbeddingService(inner, _cache())
+
+    with pytest.raises(RuntimeError):
+        await service.embed("query")
+
+    assert await service.embed("query") == _embedding(1.0)
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_should_bypass_cache(inner: AsyncMock) -> None:
+    inner.embed_batch.return_value = [_embedding(1.0)]
+    cache = _cache()
+    service = QueryCachedEmbeddingService(inner, cache)
+
+    await service.embed_batch(["chunk"])
+
+    inner.embed_batch.assert_awaited_once_with(["chunk"])
+    assert len(cache) == 0
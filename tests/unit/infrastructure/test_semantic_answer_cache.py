@@ -0,0 +1,80 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from documentor.domain.models.answer import Answer
+from documentor.domain.models.chunk import Embedding
+from documentor.infrastructure.semantic_answer_cache import SemanticAnswerCache
+
+_NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _answer(text: str) -> Answer:
+    return Answer(text=text, sources=())
+
+
+def _cache(**kwargs: object) -> SemanticAnswerCache:
+    options: dict = {"max_entries": 10, "ttl": 60.0, "max_distance": 0.05} | kwargs
+    return SemanticAnswerCache(**options)
+
+
+@pytest.mark.asyncio
+async def test_find_similar_should_return_closest_entry_within_distance() -> None:
+    cache = _cache()
+    await cache.store(Embedding.from_list([1.0, 0.0]), _answer("x"), frozenset(), _NOW)
+    await cache.store(Embedding.from_list([0.0, 1.0]), _answer("y"), frozenset(), _NOW)
+
+    hit = await cache.find_similar(Embedding.from_list([0.1, 1.0]))
+    miss = await cache.find_similar(Embedding.from_list([1.0, 1.0]))
+
+    assert hit is not None and hit.answer.text == "y"
+    assert miss is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_find_similar_should_skip_expired_entries() -> None:
+    clock = _Clock()
+    cache = _cache(ttl=10.0, clock=clock)
+    await cache.store(Embedding.from_list([1.0, 0.0]), _answer("x"), frozenset(), _NOW)
+
+    clock.now = 10.0
+
+    assert await cache.find_similar(Embedding.from_list([1.0, 0.0])) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_store_should_evict_least_recently_used_beyond_max_entries() -> None:
+    cache = _cache(max_entries=2)
+    a, b, c = (Embedding.from_list(v) for v in ([1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]))
+    await cache.store(a, _answer("a"), frozenset(), _NOW)
+    await cache.store(b, _answer("b"), frozenset(), _NOW)
+    await cache.find_similar(a)
+
+    await cache.store(c, _answer("c"), frozenset(), _NOW)
+
+    assert await cache.find_similar(b) is None
+    assert await cache.find_similar(a) is not None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_documents_should_drop_entries_using_any_of_them() -> None:
+    cache = _cache()
+    a, b = Embedding.from_list([1.0, 0.0]), Embedding.from_list([0.0, 1.0])
+    await cache.store(a, _answer("a"), frozenset({"doc-1", "doc-2"}), _NOW)
+    await cache.store(b, _answer("b"), frozenset({"doc-3"}), _NOW)
+
+    await cache.invalidate_documents({"doc-2"})
+
+    assert await cache.find_similar(a) is None
+    assert await cache.find_similar(b) is not None
+    assert len(cache) == 1
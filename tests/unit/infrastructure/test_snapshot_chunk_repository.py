@@ -0,0 +1,161 @@
+from dataclasses import dataclass, field
+from unittest.mock import AsyncMock
+
+import pytest
+
+from documentor.domain.models.chunk import (
+    Chunk,
+    ChunkContent,
+    Embedding,
+    RetrievedChunk,
+    SearchFilter,
+    SearchProfile,
+)
+from documentor.infrastructure.persistence.pg_chunk_repository import (
+    PgChunkRepository,
+)
+from documentor.infrastructure.persistence.snapshot_chunk_repository import (
+    SnapshotChunkRepository,
+)
+
+_QUERY = Embedding.from_list([1.0, 0.0])
+
+
+@dataclass(frozen=True)
+class _Hit:
+    chunk_id: str
+    score: float
+    embedding: Embedding | None = None
+
+
+@dataclass
+class _FakeSnapshot:
+    ready: bool = True
+    hits: list[_Hit] = field(default_factory=list)
+    calls: list[dict] = field(default_factory=list)
+
+    def search(self, embedding: Embedding, top_k: int, **options) -> list[_Hit]:
+        self.calls.append({"top_k": top_k, **options})
+        return self.hits[:top_k]
+
+
+def _retrieved(chunk_id: str, score: float) -> RetrievedChunk:
+    chunk = Chunk(
+        id=chunk_id,
+        document_id="doc-1",
+        content=ChunkContent(text=f"text of {chunk_id}", token_count=3),
+        position=0,
+    )
+    return RetrievedChunk(chunk=chunk, score=score, document_title="Doc")
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+    mock = AsyncMock(spec=PgChunkRepository)
+    mock.find_retrieved.side_effect = lambda scores: [
+        _retrieved(chunk_id, score)
+        for chunk_id, score in sorted(scores.items(), key=lambda item: -item[1])
+    ]
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_retrieve_should_rank_with_snapshot_and_load_hits(
+    inner: AsyncMock,
+) -> None:
+    snapshot = _FakeSnapshot(hits=[_Hit("a", 0.9), _Hit("b", 0.7)])
+    repository = SnapshotChunkRepository(inner, snapshot)
+
+    results = await repository.retrieve(
+        _QUERY, top_k=2, profile=SearchProfile(min_score=0.3)
+    )
+
+    assert [(r.chunk.id, r.score) for r in results] == [("a", 0.9), ("b", 0.7)]
+    assert snapshot.calls == [{"top_k": 2, "min_score": 0.3, "with_vectors": False}]
+    inner.find_retrieved.assert_awaited_once_with({"a": 0.9, "b": 0.7})
+    inner.retrieve.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_search_similar_should_attach_snapshot_vectors(
+    inner: AsyncMock,
+) -> None:
+    vector = Embedding.from_list([0.6, 0.8])
+    snapshot = _FakeSnapshot(hits=[_Hit("a", 0.6, vector)])
+    repository = SnapshotChunkRepository(inner, snapshot)
+
+    [(chunk, score)] = await repository.search_similar(_QUERY, top_k=1)
+
+    assert (chunk.id, score, chunk.embedding) == ("a", 0.6, vector)
+    assert snapshot.calls == [{"top_k": 1, "min_score": None, "with_vectors": True}]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_should_attach_snapshot_vectors_when_asked(
+    inner: AsyncMock,
+) -> None:
+    vector = Embedding.from_list([0.6, 0.8])
+    snapshot = _FakeSnapshot(hits=[_Hit("a", 0.6, vector)])
+    repository = SnapshotChunkRepository(inner, snapshot)
+
+    [result] = await repository.retrieve(_QUERY, top_k=1, with_embeddings=True)
+
+    assert result.chunk.embedding == vector
+
+
+@pytest.mark.asyncio
+async def test_retrieve_should_fall_back_until_snapshot_is_ready(
+    inner: AsyncMock,
+) -> None:
+    snapshot = _FakeSnapshot(ready=False)
+    repository = SnapshotChunkRepository(inner, snapshot)
+
+    await repository.retrieve(_QUERY, top_k=5)
+
+    inner.retrieve.assert_awaited_once_with(_QUERY, 5, None, None, False)
+    assert snapshot.calls == []
+
+
+@pytest.mark.asyncio
+async def test_retrieve_should_fall_back_for_filtered_searches(
+    inner: AsyncMock,
+) -> None:
+    snapshot = _FakeSnapshot()
+    repository = SnapshotChunkRepository(inner, snapshot)
+    search_filter = SearchFilter(document_ids=frozenset({"doc-1"}))
+
+    await repository.retrieve(_QUERY, top_k=5, search_filter=search_filter)
+
+    inner.retrieve.assert_awaited_once_with(_QUERY, 5, None, search_filter, False)
+    assert snapshot.calls == []
+
+
+@pytest.mark.asyncio
+async def test_retrieve_should_use_snapshot_for_empty_filter(
+    inner: AsyncMock,
+) -> None:
+    snapshot = _FakeSnapshot(hits=[_Hit("a", 0.9)])
+    repository = SnapshotChunkRepository(inner, snapshot)
+
+    await repository.retrieve(_QUERY, top_k=5, search_filter=SearchFilter())
+
+    inner.retrieve.assert_not_awaited()
+    assert len(snapshot.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retrieve_batch_should_load_hits_of_all_queries_at_once(
+    inner: AsyncMock,
+) -> None:
+    snapshot = _FakeSnapshot(hits=[_Hit("a", 0.9), _Hit("b", 0.7)])
+    repository = SnapshotChunkRepository(inner, snapshot)
+
+    batches = await repository.retrieve_batch([_QUERY, _QUERY], top_k=1)
+
+    assert [[(r.chunk.id, r.score) for r in batch] for batch in batches] == [
+        [("a", 0.9)],
+        [("a", 0.9)],
+    ]
+    assert len(snapshot.calls) == 2
+    inner.find_retrieved.assert_awaited_once()
+    inner.retrieve_batch.assert_not_awaited()
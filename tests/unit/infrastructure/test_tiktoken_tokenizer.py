@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+import pytest
+import tiktoken
+
+from documentor.domain.services.text_chunker import TextChunker
+from documentor.infrastructure.external.tiktoken_tokenizer import TiktokenTokenizer
+
+_TEXT = "日本語のドキュメントを分割します 🎉 café naïve Größe " * 20
+
+
+def _byte_level_encoding() -> tiktoken.Encoding:
+    """Encoding without merges: every multi-byte character spans several tokens."""
+    return tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+
+
+@pytest.fixture(params=["text-embedding-3-small", "bytes"])
+def tokenizer(request: pytest.FixtureRequest) -> TiktokenTokenizer:
+    if request.param == "bytes":
+        with patch("tiktoken.encoding_for_model", return_value=_byte_level_encoding()):
+            return TiktokenTokenizer()
+    try:
+        return TiktokenTokenizer(request.param)
+    except OSError as e:  # The BPE file is downloaded on first use.
+        pytest.skip(f"tiktoken encoding unavailable: {e}")
+
+
+def test_starts_character_should_reject_utf8_continuation_tokens() -> None:
+    with patch("tiktoken.encoding_for_model", return_value=_byte_level_encoding()):
+        tokenizer = TiktokenTokenizer()
+
+    first, second, third = tokenizer.encode("語")
+
+    assert tokenizer.starts_character(first)
+    assert not tokenizer.starts_character(second)
+    assert not tokenizer.starts_character(third)
+
+
+@pytest.mark.parametrize(("max_tokens", "overlap_tokens"), [(7, 2), (16, 5), (33, 8)])
+def test_split_should_not_cut_multibyte_characters(
+    tokenizer: TiktokenTokenizer, max_tokens: int, overlap_tokens: int
+) -> None:
+    chunks = TextChunker(
+        tokenizer, max_tokens=max_tokens, overlap_tokens=overlap_tokens
+    ).split(_TEXT)
+
+    assert len(chunks) > 1
+    assert all("�" not in chunk.text for chunk in chunks)
+    assert all(chunk.token_count <= max_tokens for chunk in chunks)
+    assert all(chunk.text in _TEXT for chunk in chunks)